@@ -17,6 +17,10 @@ try:
     from api.services.group_service import GroupService
     from api.services.user_service import UserService
     from api.services.achievement_service import AchievementService
+    from api.services.export_service import ExportService
+    from api.services.import_service import ImportService
+    from api.services.search_service import SearchService
+    from api.services.statistics_service import StatisticsService
     from api.routes.mood_routes import create_mood_routes
     from api.routes.goal_routes import create_goal_routes
     from api.routes.group_routes import create_group_routes
@@ -24,8 +28,15 @@ try:
     from api.routes.misc_routes import create_misc_routes
     from api.routes.config_routes import create_config_routes
     from api.routes.achievement_routes import create_achievement_routes
+    from api.routes.export_routes import create_export_routes
+    from api.routes.import_routes import create_import_routes
+    from api.routes.search_routes import create_search_routes
+    from api.routes.statistics_routes import create_statistics_routes
     from api.utils.error_handlers import setup_error_handlers
+    from api.utils.json_provider import install_json_provider
     from api.utils.security_headers import add_security_headers
+    from api.utils.unit_of_work import init_unit_of_work
+    from api.utils.analytics_cache import AnalyticsCache
     from api.services.mus_service import MusicService
     from api.routes.mus_routes import create_music_routes
 except Exception:  # fallback for running from inside api/
@@ -35,6 +46,10 @@ except Exception:  # fallback for running from inside api/
     from services.group_service import GroupService
     from services.user_service import UserService
     from services.achievement_service import AchievementService
+    from services.export_service import ExportService
+    from services.import_service import ImportService
+    from services.search_service import SearchService
+    from services.statistics_service import StatisticsService
     from routes.mood_routes import create_mood_routes
     from routes.goal_routes import create_goal_routes
     from routes.group_routes import create_group_routes
@@ -42,8 +57,15 @@ except Exception:  # fallback for running from inside api/
     from routes.misc_routes import create_misc_routes
     from routes.config_routes import create_config_routes
     from routes.achievement_routes import create_achievement_routes
+    from routes.export_routes import create_export_routes
+    from routes.import_routes import create_import_routes
+    from routes.search_routes import create_search_routes
+    from routes.statistics_routes import create_statistics_routes
     from utils.error_handlers import setup_error_handlers
+    from utils.json_provider import install_json_provider
     from utils.security_headers import add_security_headers
+    from utils.unit_of_work import init_unit_of_work
+    from utils.analytics_cache import AnalyticsCache
     from services.mus_service import MusicService
     from routes.mus_routes import create_music_routes
 
@@ -59,6 +81,7 @@ def create_app(config_name="default"):
 
     app = Flask(__name__)
     app.config.from_object(config_map[config_name])
+    install_json_provider(app)
 
     # Load typed runtime config and align secrets
     cfg = None
@@ -81,15 +104,44 @@ def create_app(config_name="default"):
     # Add security headers
     add_security_headers(app)
 
-    # Initialize database
-    db = MoodDatabase(app.config.get("DATABASE_PATH"))
+    # Initialize database (connections are pooled per worker process)
+    db = MoodDatabase(
+        app.config.get("DATABASE_PATH"),
+        pool_size=getattr(cfg, "DB_POOL_SIZE", 8),
+        pool_max_uses=getattr(cfg, "DB_POOL_MAX_USES", 1000),
+        performance_profile=app.config.get("DB_PERFORMANCE_PROFILE")
+        or getattr(cfg, "DB_PERFORMANCE_PROFILE", None),
+        write_queue=bool(getattr(cfg, "ENABLE_DB_WRITE_QUEUE", False)),
+        write_queue_latency_ms=getattr(cfg, "DB_WRITE_QUEUE_LATENCY_MS", 2.0),
+        stats_view_flush_interval=getattr(cfg, "STATS_VIEW_FLUSH_INTERVAL", 5.0),
+        stats_view_flush_threshold=getattr(cfg, "STATS_VIEW_FLUSH_THRESHOLD", 100),
+    )
+
+    # One connection and transaction per request
+    if getattr(cfg, "DB_REQUEST_UNIT_OF_WORK", True):
+        init_unit_of_work(app, db)
+
+    # Analytics results shared by the services, keyed on each user's data version
+    analytics_cache = AnalyticsCache(
+        db,
+        max_entries=getattr(cfg, "ANALYTICS_CACHE_MAX_ENTRIES", 1024),
+        max_bytes=getattr(cfg, "ANALYTICS_CACHE_MAX_BYTES", 8 * 1024 * 1024),
+    )
 
     # Initialize services
-    mood_service = MoodService(db)
+    mood_service = MoodService(
+        db,
+        bulk_max_entries=getattr(cfg, "MOOD_BULK_MAX_ENTRIES", 1000),
+        cache=analytics_cache,
+    )
     group_service = GroupService(db)
     goal_service = GoalService(db)
     user_service = UserService(db)
-    achievement_service = AchievementService(db)
+    achievement_service = AchievementService(db, cache=analytics_cache)
+    export_service = ExportService(db)
+    import_service = ImportService(db)
+    search_service = SearchService(db)
+    statistics_service = StatisticsService(db, cache=analytics_cache)
 
     # Initialize music service
     music_service = MusicService(db)
@@ -102,6 +154,12 @@ def create_app(config_name="default"):
     app.register_blueprint(
         create_achievement_routes(achievement_service), url_prefix="/api"
     )
+    app.register_blueprint(create_export_routes(export_service), url_prefix="/api")
+    app.register_blueprint(create_import_routes(import_service), url_prefix="/api")
+    app.register_blueprint(create_search_routes(search_service), url_prefix="/api")
+    app.register_blueprint(
+        create_statistics_routes(statistics_service), url_prefix="/api"
+    )
     app.register_blueprint(create_misc_routes(), url_prefix="/api")
     app.register_blueprint(create_config_routes(), url_prefix="/api")
 
@@ -110,6 +168,7 @@ def create_app(config_name="default"):
         if not hasattr(app, "extensions") or app.extensions is None:  # type: ignore[attr-defined]
             app.extensions = {}  # type: ignore[attr-defined]
         app.extensions["user_service"] = user_service  # type: ignore[attr-defined]
+        app.extensions["analytics_cache"] = analytics_cache  # type: ignore[attr-defined]
     except Exception:
         pass
 
@@ -0,0 +1,72 @@
+"""Shared helpers for the standalone benchmark scripts in this directory.
+
+Benchmarks are plain scripts (``python api/benchmarks/<name>.py``); they are
+not collected by pytest and never touch the real ``data/nightlio.db``.
+"""
+from __future__ import annotations
+
+import logging
+import statistics
+import sys
+import tempfile
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List
+
+API_DIR = Path(__file__).resolve().parent.parent
+PROJECT_ROOT = API_DIR.parent
+for _path in (str(API_DIR), str(PROJECT_ROOT)):
+    if _path not in sys.path:
+        sys.path.insert(0, _path)
+
+# Schema bootstrap logs are noise when timing; keep warnings visible.
+logging.getLogger("api.database").setLevel(logging.WARNING)
+
+
+@contextmanager
+def temp_db_path(name: str = "bench.db") -> Iterator[str]:
+    """Yield a path to a fresh SQLite file inside a throwaway directory."""
+    with tempfile.TemporaryDirectory(prefix="nightlio-bench-") as tmp:
+        yield str(Path(tmp) / name)
+
+
+def percentile(samples: List[float], pct: float) -> float:
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, max(0, int(round(pct / 100 * len(ordered))) - 1))
+    return ordered[index]
+
+
+def time_calls(fn: Callable[[], object], iterations: int) -> Dict[str, float]:
+    """Call ``fn`` repeatedly and summarise per-call latency in microseconds."""
+    samples: List[float] = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1e6)
+    return {
+        "mean_us": statistics.fmean(samples),
+        "p50_us": percentile(samples, 50),
+        "p99_us": percentile(samples, 99),
+    }
+
+
+def print_table(title: str, rows: List[Dict[str, object]]) -> None:
+    print(f"\n{title}")
+    if not rows:
+        return
+    headers = list(rows[0].keys())
+    widths = {
+        h: max(len(h), *(len(_fmt(row[h])) for row in rows)) for h in headers
+    }
+    print("  ".join(h.ljust(widths[h]) for h in headers))
+    for row in rows:
+        print("  ".join(_fmt(row[h]).ljust(widths[h]) for h in headers))
+
+
+def _fmt(value: object) -> str:
+    if isinstance(value, float):
+        return f"{value:,.1f}"
+    return str(value)
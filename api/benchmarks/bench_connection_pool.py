@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+"""Compare connect-per-call against the pooled connections in MoodDatabase.
+
+Usage: python api/benchmarks/bench_connection_pool.py [iterations]
+"""
+from __future__ import annotations
+
+import sys
+
+from _common import print_table, temp_db_path, time_calls
+
+from database import MoodDatabase  # noqa: E402
+
+
+def _run(db: MoodDatabase, label: str, iterations: int):
+    user_id = db.upsert_user_by_google_id("bench", "bench@localhost", "Bench")["id"]
+    entry_id = db.add_mood_entry(user_id, "2024-01-01", 3, "seed")
+    rows = []
+    for op, fn in (
+        ("get_mood_entry_by_id", lambda: db.get_mood_entry_by_id(user_id, entry_id)),
+        (
+            "add_mood_entry",
+            lambda: db.add_mood_entry(user_id, "2024-01-02", 4, "bench", None, [1, 2]),
+        ),
+    ):
+        rows.append({"mode": label, "operation": op, **time_calls(fn, iterations)})
+    return rows
+
+
+def main() -> int:
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    rows = []
+    with temp_db_path() as path:
+        db = MoodDatabase(path)
+        db._pool = None  # fall back to a fresh sqlite3.connect per call
+        rows.extend(_run(db, "connect-per-call", iterations))
+    with temp_db_path() as path:
+        db = MoodDatabase(path)
+        rows.extend(_run(db, "pooled", iterations))
+        db.close()
+    print_table(f"Connection pool benchmark ({iterations} calls each)", rows)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""Peak Python memory of a streamed export vs materialising the history.
+
+Compares consuming ExportService.export_entries (NDJSON, fetchmany batches)
+with the old approach of loading every entry plus selections into lists and
+serialising them in one go.
+
+Usage: python api/benchmarks/bench_export.py [sizes...]
+"""
+from __future__ import annotations
+
+import json
+import sys
+import time
+import tracemalloc
+
+from _common import print_table, temp_db_path
+
+from api.database import MoodDatabase  # noqa: E402
+from api.services.export_service import ExportService  # noqa: E402
+
+CONTENT = "A fairly long journal entry. " * 40
+
+
+def _seed(db: MoodDatabase, user_id: int, entries: int) -> None:
+    batch = [
+        {
+            "date": "01/01/2024",
+            "mood": 1 + i % 5,
+            "content": CONTENT,
+            "selected_options": [1 + i % 7, 8 + i % 5],
+        }
+        for i in range(1000)
+    ]
+    for offset in range(0, entries, len(batch)):
+        db.add_mood_entries_bulk(user_id, batch[: entries - offset])
+
+
+def _measure(fn):
+    tracemalloc.start()
+    start = time.perf_counter()
+    fn()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed * 1e3, peak / 1e6
+
+
+def _run(entries: int):
+    with temp_db_path() as path:
+        db = MoodDatabase(path)
+        user_id = db.upsert_user_by_google_id("bench", "b@localhost", "Bench")["id"]
+        _seed(db, user_id, entries)
+        service = ExportService(db)
+
+        def streamed():
+            for _chunk in service.export_entries(user_id, "ndjson"):
+                pass
+
+        def materialised():
+            rows = db.get_all_mood_entries(user_id)
+            for row in rows:
+                row.selections = db.get_entry_selections(row.id)
+            "\n".join(json.dumps(row.to_json()) for row in rows).encode("utf-8")
+
+        stream_ms, stream_mb = _measure(streamed)
+        full_ms, full_mb = _measure(materialised)
+        db.close()
+
+    return {
+        "entries": entries,
+        "stream_ms": stream_ms,
+        "stream_peak_mb": stream_mb,
+        "materialised_ms": full_ms,
+        "materialised_peak_mb": full_mb,
+    }
+
+
+def main() -> int:
+    sizes = [int(arg) for arg in sys.argv[1:]] or [1000, 10000, 50000]
+    print_table("Journal export (NDJSON)", [_run(n) for n in sizes])
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
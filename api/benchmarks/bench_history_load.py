@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""Loading a whole history: sqlite3.Row + dict(row) vs slotted MoodEntry rows.
+
+Times and measures peak Python memory for reading N entries (default 100k)
+the old way (``sqlite3.Row`` then ``dict(row)`` per row) and through
+``get_all_mood_entries``, which builds ``MoodEntry`` objects straight from
+the row tuples. Each is also serialized through the app's JSON provider,
+as GET /api/moods does.
+
+Usage: python api/benchmarks/bench_history_load.py [entries]
+"""
+from __future__ import annotations
+
+import sqlite3
+import sys
+import time
+import tracemalloc
+
+from _common import print_table, temp_db_path
+
+from flask import Flask  # noqa: E402
+
+from api.database import MoodDatabase  # noqa: E402
+from api.utils.json_provider import install_json_provider  # noqa: E402
+
+
+def _seed(db: MoodDatabase, user_id: int, entries: int) -> None:
+    db._run_write(
+        lambda conn: conn.executemany(
+            "INSERT INTO mood_entries (user_id, date, entry_day, mood, content) "
+            "VALUES (?, '01/01/2024', ?, ?, ?)",
+            (
+                (user_id, 738886 + i, 1 + i % 5, f"Entry {i}: walked, read, slept.")
+                for i in range(entries)
+            ),
+        )
+    )
+
+
+def _dict_rows(db: MoodDatabase, user_id: int):
+    with db._connect() as conn:
+        conn.row_factory = sqlite3.Row
+        cursor = conn.execute(
+            "SELECT id, date, mood, content, created_at, updated_at "
+            "FROM mood_entries WHERE user_id = ? "
+            "ORDER BY created_at DESC, entry_day DESC",
+            (user_id,),
+        )
+        return [dict(row) for row in cursor.fetchall()]
+
+
+def _measure(fn, repeat: int = 3):
+    elapsed = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        elapsed = min(elapsed, time.perf_counter() - start)
+    tracemalloc.start()
+    fn()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed * 1e3, peak / 1e6
+
+
+def main() -> int:
+    entries = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    app = Flask(__name__)
+    install_json_provider(app)
+    rows = []
+    with temp_db_path() as path, app.app_context():
+        db = MoodDatabase(path)
+        user_id = db.upsert_user_by_google_id("bench", "b@localhost", "Bench")["id"]
+        _seed(db, user_id, entries)
+
+        for label, load in (
+            ("dict(row)", lambda: _dict_rows(db, user_id)),
+            ("MoodEntry", lambda: db.get_all_mood_entries(user_id)),
+        ):
+            load_ms, load_mb = _measure(load)
+            respond_ms, respond_mb = _measure(lambda: app.json.response(load()))
+            rows.append(
+                {
+                    "rows": label,
+                    "load_ms": load_ms,
+                    "load_peak_mb": load_mb,
+                    "load+json_ms": respond_ms,
+                    "load+json_peak_mb": respond_mb,
+                }
+            )
+        db.close()
+
+    print_table(f"Loading {entries:,} entries", rows)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
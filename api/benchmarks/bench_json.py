@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""JSON serialization of a large history: stdlib provider vs orjson.
+
+Builds the GET /api/moods?include=selections payload for N entries (default
+10k) from a real database and times ``app.json.response`` with Flask's
+default provider and with FastJSONProvider, reporting body sizes too.
+
+Usage: python api/benchmarks/bench_json.py [entries]
+"""
+from __future__ import annotations
+
+import sys
+
+from _common import print_table, temp_db_path, time_calls
+
+from flask import Flask  # noqa: E402
+
+from api.database import MoodDatabase  # noqa: E402
+from api.services.mood_service import MoodService  # noqa: E402
+from api.utils.json_provider import install_json_provider, orjson  # noqa: E402
+
+
+def _payload(entries: int):
+    with temp_db_path() as path:
+        db = MoodDatabase(path)
+        user_id = db.upsert_user_by_google_id("bench", "b@localhost", "Bench")["id"]
+        options = [o["id"] for g in db.get_all_groups() for o in g["options"]][:3]
+        db.add_mood_entries_bulk(
+            user_id,
+            [
+                {
+                    "date": "01/01/2024",
+                    "mood": 1 + i % 5,
+                    "content": f"Entry {i}: a walk, some coffee and an early night.",
+                    "selected_options": options,
+                }
+                for i in range(entries)
+            ],
+        )
+        payload = MoodService(db).get_all_entries(user_id, include_selections=True)
+        db.close()
+    return payload
+
+
+def main() -> int:
+    entries = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000
+    payload = _payload(entries)
+
+    rows = []
+    for label, install in (("stdlib", None), ("orjson", install_json_provider)):
+        if install is not None and orjson is None:
+            print("orjson is not installed; skipping the fast provider")
+            continue
+        app = Flask(__name__)
+        if install is not None:
+            install(app)
+        with app.app_context():
+            body = app.json.response(payload).get_data()
+            timing = time_calls(lambda: app.json.response(payload), 20)
+        rows.append(
+            {
+                "provider": label,
+                "p50_ms": timing["p50_us"] / 1e3,
+                "p99_ms": timing["p99_us"] / 1e3,
+                "bytes": len(body),
+            }
+        )
+
+    print_table(f"Serializing {entries:,} entries with selections", rows)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""Option statistics: vectorized NumPy totals vs the plain Python fallback.
+
+Seeds one user with N entries, each selecting a few of 50 options, then
+times StatisticsService.get_option_stats end to end with and without NumPy,
+and ``option_totals`` alone on rows that were already fetched.
+
+Usage: python api/benchmarks/bench_option_stats.py [sizes...]
+"""
+from __future__ import annotations
+
+import random
+import sys
+
+from _common import print_table, temp_db_path, time_calls
+
+from api.database import MoodDatabase  # noqa: E402
+from api.services.statistics_service import StatisticsService  # noqa: E402
+from api.utils import option_stats  # noqa: E402
+
+OPTIONS = 50
+
+
+def _run(entries: int):
+    rng = random.Random(entries)
+    with temp_db_path() as path:
+        db = MoodDatabase(path)
+        user_id = db.upsert_user_by_google_id("bench", "b@localhost", "Bench")["id"]
+        group_id = db.create_group("Bench")
+        option_ids = [
+            db.create_group_option(group_id, f"Option {i}") for i in range(OPTIONS)
+        ]
+        db.add_mood_entries_bulk(
+            user_id,
+            [
+                {
+                    "date": f"{1 + i % 12:02d}/{1 + i % 28:02d}/{2000 + i // 336}",
+                    "mood": rng.randint(1, 5),
+                    "content": "",
+                    "selected_options": rng.sample(option_ids, rng.randint(1, 6)),
+                }
+                for i in range(entries)
+            ],
+        )
+        service = StatisticsService(db)
+        numpy_module = option_stats.np
+
+        def mean_ms(fn):
+            return time_calls(fn, 10)["mean_us"] / 1e3
+
+        rows = db.get_option_mood_rows(user_id)
+        fetch = mean_ms(lambda: db.get_option_mood_rows(user_id))
+        vectorized = mean_ms(lambda: service.get_option_stats(user_id))
+        totals = mean_ms(lambda: option_stats.option_totals(rows))
+        option_stats.np = None
+        try:
+            python = mean_ms(lambda: service.get_option_stats(user_id))
+            python_totals = mean_ms(lambda: option_stats.option_totals(rows))
+        finally:
+            option_stats.np = numpy_module
+        db.close()
+
+    return {
+        "entries": entries,
+        "fetch_ms": fetch,
+        "numpy_ms": vectorized,
+        "python_ms": python,
+        "totals_numpy_ms": totals,
+        "totals_python_ms": python_totals,
+    }
+
+
+def main() -> int:
+    if option_stats.np is None:
+        print("numpy is not installed; nothing to compare")
+        return 1
+    sizes = [int(arg) for arg in sys.argv[1:]] or [1000, 10000, 50000]
+    print_table("Option statistics (50 options)", [_run(n) for n in sizes])
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
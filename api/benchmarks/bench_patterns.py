@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""Weekday x hour mood patterns over large histories.
+
+Seeds one user with N entries spread over the day and times
+StatisticsService.get_patterns end to end, along with the grouped query on
+its own and the same query forced onto the old (user_id, entry_day, mood)
+index, which has to visit the table row for every entry's created_at.
+
+Usage: python api/benchmarks/bench_patterns.py [sizes...]
+"""
+from __future__ import annotations
+
+import random
+import sys
+from datetime import date, timedelta
+
+from _common import print_table, temp_db_path, time_calls
+
+from api.database import MoodDatabase  # noqa: E402
+from api.database_common import SQLQueries  # noqa: E402
+from api.services.statistics_service import StatisticsService  # noqa: E402
+
+CHUNK = 5000
+
+
+def _run(entries: int):
+    rng = random.Random(entries)
+    first = date(2000, 1, 1)
+    items = []
+    for i in range(entries):
+        day = first + timedelta(days=i // 4)
+        items.append(
+            {
+                "date": day.isoformat(),
+                "mood": rng.randint(1, 5),
+                "content": "",
+                "time": f"{day}T{rng.randint(0, 23):02d}:{rng.randint(0, 59):02d}:00Z",
+            }
+        )
+    with temp_db_path() as path:
+        db = MoodDatabase(path)
+        user_id = db.upsert_user_by_google_id("bench", "b@localhost", "Bench")["id"]
+        for start in range(0, entries, CHUNK):
+            db.add_mood_entries_bulk(user_id, items[start : start + CHUNK])
+        service = StatisticsService(db)
+
+        def mean_ms(fn):
+            return time_calls(fn, 10)["mean_us"] / 1e3
+
+        endpoint = mean_ms(lambda: service.get_patterns(user_id, 60))
+        query = mean_ms(lambda: db.get_mood_patterns(user_id, 60))
+        with db._connect() as conn:
+            conn.execute(
+                "CREATE INDEX bench_user_day ON mood_entries(user_id, entry_day, mood)"
+            )
+            narrow = SQLQueries.GET_MOOD_PATTERNS.replace(
+                "FROM mood_entries", "FROM mood_entries INDEXED BY bench_user_day"
+            )
+            without = mean_ms(lambda: conn.execute(narrow, (60, user_id)).fetchall())
+            conn.execute("DROP INDEX bench_user_day")
+        db.close()
+
+    return {
+        "entries": entries,
+        "patterns_ms": endpoint,
+        "query_ms": query,
+        "narrow_index_ms": without,
+    }
+
+
+def main() -> int:
+    sizes = [int(arg) for arg in sys.argv[1:]] or [1000, 10000, 100000]
+    print_table("Weekday x hour patterns", [_run(n) for n in sizes])
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
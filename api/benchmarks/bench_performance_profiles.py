@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""Compare SQLite performance profiles under concurrent multi-process load.
+
+Spawns writer and reader processes (like gunicorn sync workers) against one
+database file per profile and reports write throughput, lock errors and
+read latency percentiles.
+
+Usage: python api/benchmarks/bench_performance_profiles.py [seconds] [writers] [readers]
+"""
+from __future__ import annotations
+
+import multiprocessing as mp
+import sqlite3
+import sys
+import time
+
+from _common import percentile, print_table, temp_db_path
+
+from database import MoodDatabase  # noqa: E402
+from database_common import PERFORMANCE_PROFILES, DatabaseError  # noqa: E402
+
+
+def _writer(path, profile, user_id, seconds, out):
+    db = MoodDatabase(path, init=False, performance_profile=profile)
+    writes = errors = 0
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        try:
+            db.add_mood_entry(user_id, "2024-03-01", 3, "load test entry", None, [1])
+            writes += 1
+        except (sqlite3.Error, DatabaseError):
+            errors += 1
+    out.put(("w", writes, errors, []))
+
+
+def _reader(path, profile, user_id, seconds, out):
+    db = MoodDatabase(path, init=False, performance_profile=profile)
+    samples, errors = [], 0
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        start = time.perf_counter()
+        try:
+            db.get_mood_statistics(user_id)
+            samples.append((time.perf_counter() - start) * 1e3)
+        except (sqlite3.Error, DatabaseError):
+            errors += 1
+    out.put(("r", len(samples), errors, samples))
+
+
+def _run_profile(profile, seconds, writers, readers):
+    with temp_db_path() as path:
+        db = MoodDatabase(path, performance_profile=profile)
+        user_id = db.upsert_user_by_google_id("bench", "b@localhost", "Bench")["id"]
+        for _ in range(2000):
+            db.add_mood_entry(user_id, "2024-01-01", 4, "seed")
+        db.close()
+
+        out: mp.Queue = mp.Queue()
+        procs = [
+            mp.Process(target=_writer, args=(path, profile, user_id, seconds, out))
+            for _ in range(writers)
+        ] + [
+            mp.Process(target=_reader, args=(path, profile, user_id, seconds, out))
+            for _ in range(readers)
+        ]
+        for proc in procs:
+            proc.start()
+        results = [out.get() for _ in procs]
+        for proc in procs:
+            proc.join()
+
+    writes = sum(r[1] for r in results if r[0] == "w")
+    write_errors = sum(r[2] for r in results if r[0] == "w")
+    read_errors = sum(r[2] for r in results if r[0] == "r")
+    latencies = [s for r in results if r[0] == "r" for s in r[3]]
+    return {
+        "profile": profile,
+        "writes_per_s": writes / seconds,
+        "write_errors": write_errors,
+        "reads": len(latencies),
+        "read_errors": read_errors,
+        "read_p50_ms": percentile(latencies, 50),
+        "read_p99_ms": percentile(latencies, 99),
+    }
+
+
+def main() -> int:
+    seconds = float(sys.argv[1]) if len(sys.argv) > 1 else 3.0
+    writers = int(sys.argv[2]) if len(sys.argv) > 2 else 2
+    readers = int(sys.argv[3]) if len(sys.argv) > 3 else 2
+    rows = [
+        _run_profile(name, seconds, writers, readers) for name in PERFORMANCE_PROFILES
+    ]
+    print_table(
+        f"Performance profiles ({writers} writers, {readers} readers, {seconds:g}s)",
+        rows,
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
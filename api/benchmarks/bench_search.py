@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""Full-text search latency over a large journal.
+
+Seeds one user with N entries of random prose (default 100k), interleaved
+with as many entries from a second user that share the index, and times
+``search_mood_entries`` for common, rare and prefix terms, with and without
+filters, against the ``content LIKE`` scan it replaces.
+
+Usage: python api/benchmarks/bench_search.py [entries]
+"""
+from __future__ import annotations
+
+import random
+import sqlite3
+import sys
+import time
+
+from _common import print_table, temp_db_path, time_calls
+
+from api.database import MoodDatabase  # noqa: E402
+
+WORDS = (
+    "walk run river coffee rain sun friends family work tired sleep gym read "
+    "movie cook dinner music quiet stress calm meeting travel beach garden "
+    "study call party headache park dog cat evening morning lunch"
+).split()
+RARE_WORD = "zeppelin"
+
+
+def _seed(db: MoodDatabase, user_id: int, other_id: int, entries: int) -> None:
+    rng = random.Random(entries)
+
+    def rows():
+        for i in range(entries):
+            for owner in (user_id, other_id):
+                words = rng.choices(WORDS, k=rng.randint(8, 40))
+                if i % 5000 == 0:
+                    words.append(RARE_WORD)
+                yield owner, 738886 + i // 3, 1 + i % 5, " ".join(words)
+
+    db._run_write(
+        lambda conn: conn.executemany(
+            "INSERT INTO mood_entries (user_id, date, entry_day, mood, content) "
+            "VALUES (?, '01/01/2024', ?, ?, ?)",
+            rows(),
+        )
+    )
+
+
+def _like_scan(path: str, user_id: int, term: str) -> None:
+    with sqlite3.connect(path) as conn:
+        conn.execute(
+            "SELECT id, content FROM mood_entries WHERE user_id = ? "
+            "AND content LIKE ? ORDER BY created_at DESC LIMIT 21",
+            (user_id, f"%{term}%"),
+        ).fetchall()
+
+
+def main() -> int:
+    entries = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    with temp_db_path() as path:
+        db = MoodDatabase(path)
+        user_id = db.upsert_user_by_google_id("bench", "b@localhost", "Bench")["id"]
+        other_id = db.upsert_user_by_google_id("other", "o@localhost", "Other")["id"]
+        start = time.perf_counter()
+        _seed(db, user_id, other_id, entries)
+        print(
+            f"seeded 2 x {entries:,} entries in {time.perf_counter() - start:.1f}s"
+        )
+
+        cases = [
+            ("rare term", RARE_WORD, {}),
+            ("common term", "coffee", {}),
+            ("two terms", "rain walk", {}),
+            ("prefix", "gard", {}),
+            ("common + mood", "coffee", {"moods": [5]}),
+            (
+                "common + month",
+                "coffee",
+                {"start_date": "2024-03-01", "end_date": "2024-03-31"},
+            ),
+            ("common, page 5", "coffee", {"offset": 80}),
+        ]
+        rows = []
+        for label, text, kwargs in cases:
+            fts = time_calls(
+                lambda: db.search_mood_entries(user_id, text, **kwargs), 20
+            )
+            like = time_calls(lambda: _like_scan(path, user_id, text), 5)
+            rows.append(
+                {
+                    "query": label,
+                    "fts_p50_ms": fts["p50_us"] / 1e3,
+                    "fts_p99_ms": fts["p99_us"] / 1e3,
+                    "like_p50_ms": like["p50_us"] / 1e3,
+                }
+            )
+        db.close()
+
+    print_table(f"Search over {entries:,} entries", rows)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""Loading history with selections: per-entry requests vs ?include=selections.
+
+The old client fetched GET /api/moods and then GET /api/mood/<id>/selections
+for every entry. This times that N+1 pattern against a single
+GET /api/moods?include=selections, through the real mood blueprint.
+
+Usage: python api/benchmarks/bench_selections.py [sizes...]
+"""
+from __future__ import annotations
+
+import random
+import sys
+import time
+
+from _common import print_table, temp_db_path
+
+from flask import Flask  # noqa: E402
+from jose import jwt  # noqa: E402
+
+from api.database import MoodDatabase  # noqa: E402
+from api.routes.mood_routes import create_mood_routes  # noqa: E402
+from api.services.mood_service import MoodService  # noqa: E402
+
+SECRET = "bench-secret"
+
+
+def _seed(db: MoodDatabase, user_id: int, entries: int) -> None:
+    options = [o["id"] for g in db.get_all_groups() for o in g["options"]]
+    rng = random.Random(entries)
+
+    def _write(conn):
+        for i in range(entries):
+            cursor = conn.execute(
+                "INSERT INTO mood_entries (user_id, date, entry_day, mood, content) "
+                "VALUES (?, '01/01/2024', ?, ?, 'bench')",
+                (user_id, 738886 + i, 1 + i % 5),
+            )
+            conn.executemany(
+                "INSERT INTO entry_selections (entry_id, option_id) VALUES (?, ?)",
+                [(cursor.lastrowid, o) for o in rng.sample(options, 3)],
+            )
+
+    db._run_write(_write)
+
+
+def _run(entries: int):
+    with temp_db_path() as path:
+        db = MoodDatabase(path)
+        user_id = db.upsert_user_by_google_id("bench", "b@localhost", "Bench")["id"]
+        _seed(db, user_id, entries)
+        app = Flask(__name__)
+        app.config["JWT_SECRET_KEY"] = SECRET
+        app.register_blueprint(create_mood_routes(MoodService(db)), url_prefix="/api")
+        headers = {
+            "Authorization": "Bearer "
+            + jwt.encode({"user_id": user_id}, SECRET, algorithm="HS256")
+        }
+        client = app.test_client()
+
+        start = time.perf_counter()
+        listing = client.get("/api/moods", headers=headers).get_json()
+        for entry in listing:
+            client.get(f"/api/mood/{entry['id']}/selections", headers=headers)
+        n_plus_one = time.perf_counter() - start
+
+        start = time.perf_counter()
+        embedded = client.get("/api/moods?include=selections", headers=headers)
+        single = time.perf_counter() - start
+        assert len(embedded.get_json()) == entries
+        db.close()
+
+    return {
+        "entries": entries,
+        "n+1_requests": entries + 1,
+        "n+1_ms": n_plus_one * 1e3,
+        "include_ms": single * 1e3,
+        "speedup": n_plus_one / single if single else float("inf"),
+    }
+
+
+def main() -> int:
+    sizes = [int(arg) for arg in sys.argv[1:]] or [100, 1000, 10000]
+    print_table("History load with selections", [_run(n) for n in sizes])
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
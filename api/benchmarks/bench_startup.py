@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""Measure MoodDatabase boot time across concurrently starting workers.
+
+Starts N processes at once (like gunicorn workers) that each construct
+MoodDatabase against the same file and time init_database. Scenarios:
+
+- empty: first boot, every migration runs (once, under the exclusive lock)
+- legacy: populated database with user_version reset to 0, which replays
+  the full bootstrap the way every boot did before versioned migrations
+- up-to-date: the fast path, a single PRAGMA user_version read
+
+Usage: python api/benchmarks/bench_startup.py [workers] [rounds]
+"""
+from __future__ import annotations
+
+import multiprocessing as mp
+import sqlite3
+import statistics
+import sys
+import time
+
+from _common import print_table, temp_db_path
+
+from database import MoodDatabase  # noqa: E402
+
+
+def _boot(path, barrier, out):
+    barrier.wait()
+    start = time.perf_counter()
+    MoodDatabase(path).close()
+    out.put((time.perf_counter() - start) * 1e3)
+
+
+def _boot_workers(path, workers):
+    barrier = mp.Barrier(workers)
+    out: mp.Queue = mp.Queue()
+    procs = [mp.Process(target=_boot, args=(path, barrier, out)) for _ in range(workers)]
+    for proc in procs:
+        proc.start()
+    samples = [out.get() for _ in procs]
+    for proc in procs:
+        proc.join()
+    return samples
+
+
+def _scenario(name, workers, rounds, prepare):
+    samples = []
+    for _ in range(rounds):
+        with temp_db_path() as path:
+            prepare(path)
+            samples.extend(_boot_workers(path, workers))
+    return {
+        "scenario": name,
+        "workers": workers,
+        "mean_ms": statistics.fmean(samples),
+        "max_ms": max(samples),
+    }
+
+
+def _reset_version(path):
+    MoodDatabase(path).close()
+    with sqlite3.connect(path) as conn:
+        conn.execute("PRAGMA user_version = 0")
+
+
+def main() -> int:
+    workers = int(sys.argv[1]) if len(sys.argv) > 1 else 4
+    rounds = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+    rows = [
+        _scenario("empty", workers, rounds, lambda path: None),
+        _scenario("legacy", workers, rounds, _reset_version),
+        _scenario("up-to-date", workers, rounds, lambda path: MoodDatabase(path).close()),
+    ]
+    print_table(f"init_database across {workers} workers ({rounds} rounds)", rows)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""Throughput of concurrent POST /api/mood with and without the write queue.
+
+Builds a minimal Flask app around the real mood blueprint, service and
+MoodDatabase, then fires N authenticated POSTs from a thread pool (as with
+gunicorn gthread workers). No request unit of work is installed. That
+matches the app with the queue on, since it skips the unit of work then.
+Without the queue, the app default runs one transaction per request
+rather than the per-call transactions measured here.
+
+Usage: python api/benchmarks/bench_write_queue.py [requests] [threads]
+"""
+from __future__ import annotations
+
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from _common import print_table, temp_db_path
+
+from flask import Flask  # noqa: E402
+from jose import jwt  # noqa: E402
+
+from api.database import MoodDatabase  # noqa: E402
+from api.routes.mood_routes import create_mood_routes  # noqa: E402
+from api.services.mood_service import MoodService  # noqa: E402
+
+SECRET = "bench-secret"
+
+
+def _run(profile: str, write_queue: bool, requests: int, threads: int):
+    with temp_db_path() as path:
+        db = MoodDatabase(path, performance_profile=profile, write_queue=write_queue)
+        user_id = db.upsert_user_by_google_id("bench", "b@localhost", "Bench")["id"]
+        app = Flask(__name__)
+        app.config["JWT_SECRET_KEY"] = SECRET
+        app.register_blueprint(create_mood_routes(MoodService(db)), url_prefix="/api")
+        headers = {
+            "Authorization": "Bearer "
+            + jwt.encode({"user_id": user_id}, SECRET, algorithm="HS256")
+        }
+        payload = {"mood": 4, "date": "2024-05-01", "content": "bench", "selected_options": [1, 2]}
+
+        def post(_):
+            with app.test_client() as client:
+                return client.post("/api/mood", json=payload, headers=headers).status_code
+
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=threads) as pool:
+            statuses = list(pool.map(post, range(requests)))
+        elapsed = time.perf_counter() - start
+        batches = db._writer.batches if db._writer else "-"
+        db.close()
+
+    return {
+        "profile": profile,
+        "write_queue": "on" if write_queue else "off",
+        "requests": requests,
+        "ok": sum(1 for s in statuses if s == 201),
+        "req_per_s": requests / elapsed,
+        "write_txns": batches,
+    }
+
+
+def main() -> int:
+    requests = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    threads = int(sys.argv[2]) if len(sys.argv) > 2 else 32
+    rows = [
+        _run(profile, queued, requests, threads)
+        for profile in ("durable", "balanced")
+        for queued in (False, True)
+    ]
+    print_table(f"POST /api/mood x{requests} over {threads} threads", rows)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -67,6 +67,8 @@ class TestingConfig(Config):
     TESTING = True
     # Use a file-backed SQLite DB so multiple connections see the same data
     DATABASE_PATH = "/tmp/nightlio_test.db"
+    # Tests delete and recreate the DB file between cases; avoid WAL sidecars
+    DB_PERFORMANCE_PROFILE = "durable"
 
 
 # Configuration mapping (legacy app factory still uses this).
@@ -123,10 +125,45 @@ class ConfigData:
     SELFHOST_USER_NAME: Optional[str] = None
     SELFHOST_USER_EMAIL: Optional[str] = None
 
+    # SQLite connection pool (per worker process)
+    DB_POOL_SIZE: int = 8
+    DB_POOL_MAX_USES: int = 1000
+    # SQLite tuning profile: "durable", "balanced" (WAL) or "throughput";
+    # None leaves the choice to MoodDatabase (DEFAULT_PERFORMANCE_PROFILE)
+    DB_PERFORMANCE_PROFILE: Optional[str] = None
+    # Funnel writes through one group-committing writer thread per process
+    ENABLE_DB_WRITE_QUEUE: bool = False
+    DB_WRITE_QUEUE_LATENCY_MS: float = 2.0
+    # Write-behind buffering for stats view counters (0 = write through)
+    STATS_VIEW_FLUSH_INTERVAL: float = 5.0
+    STATS_VIEW_FLUSH_THRESHOLD: int = 100
+    # Share one connection and transaction across each request's DB calls
+    # (ignored when ENABLE_DB_WRITE_QUEUE is on; the two cannot be combined)
+    DB_REQUEST_UNIT_OF_WORK: bool = True
+    # Largest array accepted by POST /api/moods/bulk
+    MOOD_BULK_MAX_ENTRIES: int = 1000
+    # Per-process LRU of analytics results (0 entries = disabled)
+    ANALYTICS_CACHE_MAX_ENTRIES: int = 1024
+    ANALYTICS_CACHE_MAX_BYTES: int = 8 * 1024 * 1024
+
 
 _CONFIG_SINGLETON: Optional[ConfigData] = None
 
 
+def _int_from_env(name: str, default: int) -> int:
+    try:
+        return int(os.getenv(name, str(default)))
+    except (TypeError, ValueError):
+        return default
+
+
+def _float_from_env(name: str, default: float) -> float:
+    try:
+        return float(os.getenv(name, str(default)))
+    except (TypeError, ValueError):
+        return default
+
+
 def _load_config_from_env() -> ConfigData:
     """Load ConfigData from environment variables.
 
@@ -166,6 +203,21 @@ def _load_config_from_env() -> ConfigData:
         or "selfhost_default_user",
         SELFHOST_USER_NAME=os.getenv("SELFHOST_USER_NAME") or "Me",
         SELFHOST_USER_EMAIL=os.getenv("SELFHOST_USER_EMAIL") or None,
+        DB_POOL_SIZE=_int_from_env("DB_POOL_SIZE", 8),
+        DB_POOL_MAX_USES=_int_from_env("DB_POOL_MAX_USES", 1000),
+        DB_PERFORMANCE_PROFILE=(
+            (os.getenv("DB_PERFORMANCE_PROFILE") or "").strip().lower() or None
+        ),
+        ENABLE_DB_WRITE_QUEUE=is_truthy(os.getenv("ENABLE_DB_WRITE_QUEUE")),
+        DB_WRITE_QUEUE_LATENCY_MS=_float_from_env("DB_WRITE_QUEUE_LATENCY_MS", 2.0),
+        STATS_VIEW_FLUSH_INTERVAL=_float_from_env("STATS_VIEW_FLUSH_INTERVAL", 5.0),
+        STATS_VIEW_FLUSH_THRESHOLD=_int_from_env("STATS_VIEW_FLUSH_THRESHOLD", 100),
+        DB_REQUEST_UNIT_OF_WORK=is_truthy(os.getenv("DB_REQUEST_UNIT_OF_WORK", "1")),
+        MOOD_BULK_MAX_ENTRIES=_int_from_env("MOOD_BULK_MAX_ENTRIES", 1000),
+        ANALYTICS_CACHE_MAX_ENTRIES=_int_from_env("ANALYTICS_CACHE_MAX_ENTRIES", 1024),
+        ANALYTICS_CACHE_MAX_BYTES=_int_from_env(
+            "ANALYTICS_CACHE_MAX_BYTES", 8 * 1024 * 1024
+        ),
     )
 
 
@@ -2,34 +2,54 @@
 
 from __future__ import annotations
 
+import threading
+from functools import partial
 from pathlib import Path
 from typing import Optional
 
 try:  # pragma: no cover - fallback for script execution
     from .database_achievements import AchievementsMixin
     from .database_common import (
+        DEFAULT_PERFORMANCE_PROFILE,
+        ConnectionPool,
+        CounterBuffer,
         DatabaseConnectionMixin,
         DatabaseError,
         SQLQueries,
+        UnitOfWork,
+        WriteQueue,
         logger,
+        performance_profile_pragmas,
     )
     from .database_goals import GoalsMixin
     from .database_groups import GroupsMixin
     from .database_moods import MoodEntriesMixin
+    from .database_rollups import DailyRollupMixin
     from .database_schema import DatabaseSchemaMixin
+    from .database_search import SearchMixin
+    from .database_versions import DataVersionMixin
     from .database_users import UsersMixin
 except ImportError:  # pragma: no cover - executed when run as a script module
     from database_achievements import AchievementsMixin  # type: ignore
     from database_common import (  # type: ignore
+        DEFAULT_PERFORMANCE_PROFILE,
+        ConnectionPool,
+        CounterBuffer,
         DatabaseConnectionMixin,
         DatabaseError,
         SQLQueries,
+        UnitOfWork,
+        WriteQueue,
         logger,
+        performance_profile_pragmas,
     )
     from database_goals import GoalsMixin  # type: ignore
     from database_groups import GroupsMixin  # type: ignore
     from database_moods import MoodEntriesMixin  # type: ignore
+    from database_rollups import DailyRollupMixin  # type: ignore
     from database_schema import DatabaseSchemaMixin  # type: ignore
+    from database_search import SearchMixin  # type: ignore
+    from database_versions import DataVersionMixin  # type: ignore
     from database_users import UsersMixin  # type: ignore
 
 
@@ -40,12 +60,27 @@ class MoodDatabase(
     MoodEntriesMixin,
     GroupsMixin,
     AchievementsMixin,
+    SearchMixin,
+    DataVersionMixin,
+    DailyRollupMixin,
 ):
     """High-level facade composing all database-related mixins."""
 
     db_path: str
 
-    def __init__(self, db_path: Optional[str] = None, *, init: bool = True) -> None:
+    def __init__(
+        self,
+        db_path: Optional[str] = None,
+        *,
+        init: bool = True,
+        pool_size: int = 8,
+        pool_max_uses: int = 1000,
+        performance_profile: Optional[str] = None,
+        write_queue: bool = False,
+        write_queue_latency_ms: float = 2.0,
+        stats_view_flush_interval: float = 0.0,
+        stats_view_flush_threshold: int = 100,
+    ) -> None:
         data_dir = Path(__file__).resolve().parent.parent / "data"
         data_dir.mkdir(parents=True, exist_ok=True)
 
@@ -54,19 +89,52 @@ class MoodDatabase(
         )
         self.db_path = str(resolved_path)
 
+        self.performance_profile = performance_profile or DEFAULT_PERFORMANCE_PROFILE
+        self._local = threading.local()
+        self._pool = ConnectionPool(
+            self.db_path,
+            max_size=pool_size,
+            max_uses=pool_max_uses,
+            pragmas=performance_profile_pragmas(self.performance_profile),
+        )
+        if write_queue:
+            self._writer = WriteQueue(
+                self._pool, max_latency=write_queue_latency_ms / 1000.0
+            )
+        if stats_view_flush_interval > 0:
+            # Buffered deltas belong to many requests; never commit them as
+            # part of (or roll them back with) whichever request flushes.
+            self._stats_view_buffer = CounterBuffer(
+                partial(self._flush_stats_views, detached=True),
+                interval=stats_view_flush_interval,
+                max_pending=stats_view_flush_threshold,
+            )
+
         logger.debug("MoodDatabase configured with db_path=%s", self.db_path)
 
         if init:
             self.init_database()
 
+    def close(self) -> None:
+        """Flush buffered counters, drain queued writes and release connections."""
+        if self._stats_view_buffer is not None:
+            self._stats_view_buffer.close()
+        if self._writer is not None:
+            self._writer.close()
+        if self._pool is not None:
+            self._pool.close()
+
     def __repr__(self) -> str:  # pragma: no cover - convenience helper
         return f"MoodDatabase(db_path={self.db_path!r})"
 
 
 __all__ = [
     "MoodDatabase",
+    "ConnectionPool",
     "DatabaseConnectionMixin",
     "DatabaseError",
     "SQLQueries",
+    "UnitOfWork",
+    "WriteQueue",
     "logger",
 ]
@@ -3,33 +3,62 @@
 from __future__ import annotations
 
 import sqlite3
-from datetime import datetime, timedelta, date
-from typing import Dict, List, Optional
+from typing import Dict, Iterable, List, Optional, Tuple
 
 try:  # pragma: no cover - allow running as top-level script
-    from .database_common import DatabaseConnectionMixin, SQLQueries, logger
+    from .database_common import (
+        CounterBuffer,
+        DatabaseConnectionMixin,
+        SQLQueries,
+        logger,
+    )
 except ImportError:  # pragma: no cover - executed for script usage fallback
-    from database_common import DatabaseConnectionMixin, SQLQueries, logger  # type: ignore
+    from database_common import (  # type: ignore
+        CounterBuffer,
+        DatabaseConnectionMixin,
+        SQLQueries,
+        logger,
+    )
 
 
 class AchievementsMixin(DatabaseConnectionMixin):
     """Provides stats, streak, and achievement utilities."""
 
+    _stats_view_buffer: Optional[CounterBuffer] = None
+
     # --- Statistics -----------------------------------------------------------
+    @property
+    def buffers_stats_views(self) -> bool:
+        """Whether statistics views are counted in memory rather than written."""
+        return self._stats_view_buffer is not None
+
     def increment_stats_view(self, user_id: int) -> None:
-        with self._connect() as conn:
-            conn.execute(
+        buffer = self._stats_view_buffer
+        if buffer is not None:
+            buffer.add(user_id)
+            return
+        self._flush_stats_views([(user_id, 1)])
+
+    def _flush_stats_views(
+        self, deltas: List[Tuple[int, int]], *, detached: bool = False
+    ) -> None:
+        def _write(conn: sqlite3.Connection) -> None:
+            conn.executemany(
                 """
                 INSERT INTO user_metrics (user_id, stats_views)
-                VALUES (?, 1)
+                VALUES (?, ?)
                 ON CONFLICT(user_id)
-                DO UPDATE SET stats_views = stats_views + 1, updated_at = CURRENT_TIMESTAMP
+                DO UPDATE SET stats_views = stats_views + excluded.stats_views,
+                              updated_at = CURRENT_TIMESTAMP
                 """,
-                (user_id,),
+                deltas,
             )
-            conn.commit()
+
+        self._run_write(_write, detached=detached)
 
     def get_user_metrics(self, user_id: int) -> Dict:
+        buffer = self._stats_view_buffer
+        pending = buffer.pending(user_id) if buffer is not None else 0
         with self._connect() as conn:
             conn.row_factory = sqlite3.Row
             row = conn.execute(
@@ -37,108 +66,135 @@ class AchievementsMixin(DatabaseConnectionMixin):
                 (user_id,),
             ).fetchone()
             if not row:
-                return {"user_id": user_id, "stats_views": 0}
-            return dict(row)
+                return {"user_id": user_id, "stats_views": pending}
+            metrics = dict(row)
+            metrics["stats_views"] = int(metrics["stats_views"] or 0) + pending
+            return metrics
 
     def get_mood_statistics(self, user_id: int) -> Dict:
         with self._connect() as conn:
-            cursor = conn.execute(SQLQueries.GET_MOOD_STATISTICS, (user_id,))
-            row = cursor.fetchone()
-            if row and row[0] > 0:
-                return {
-                    "total_entries": row[0],
-                    "average_mood": round(row[1], 2) if row[1] else 0,
-                    "lowest_mood": row[2],
-                    "highest_mood": row[3],
-                    "first_entry_date": row[4],
-                    "last_entry_date": row[5],
-                }
-            return {
-                "total_entries": 0,
-                "average_mood": 0,
-                "lowest_mood": None,
-                "highest_mood": None,
-                "first_entry_date": None,
-                "last_entry_date": None,
-            }
+            row = conn.execute(SQLQueries.GET_MOOD_SUMMARY, (user_id,)).fetchone()
+        return self._format_mood_statistics(row)
 
     def get_mood_counts(self, user_id: int) -> Dict[int, int]:
         with self._connect() as conn:
-            cursor = conn.execute(
-                """
-                SELECT mood, COUNT(*) as count
-                  FROM mood_entries
-                 WHERE user_id = ?
-                 GROUP BY mood
-                 ORDER BY mood
-                """,
-                (user_id,),
-            )
+            cursor = conn.execute(SQLQueries.GET_MOOD_SUMMARY_COUNTS, (user_id,))
             return {row[0]: row[1] for row in cursor.fetchall()}
 
-    # --- Streak calculation ---------------------------------------------------
+    def get_mood_totals(self, user_id: int) -> Tuple[int, int]:
+        """Return ``(entry_count, mood_sum)`` from the maintained summary."""
+        with self._connect() as conn:
+            row = conn.execute(SQLQueries.GET_MOOD_SUMMARY, (user_id,)).fetchone()
+        return (row[0], row[1]) if row else (0, 0)
+
+    @staticmethod
+    def _format_mood_statistics(row: Optional[Tuple]) -> Dict:
+        """Shape a ``GET_MOOD_SUMMARY`` row (count, sum, min, max, dates)."""
+        if row and row[0] > 0:
+            return {
+                "total_entries": row[0],
+                "average_mood": round(row[1] / row[0], 2),
+                "lowest_mood": row[2],
+                "highest_mood": row[3],
+                "first_entry_date": row[4],
+                "last_entry_date": row[5],
+            }
+        return {
+            "total_entries": 0,
+            "average_mood": 0,
+            "lowest_mood": None,
+            "highest_mood": None,
+            "first_entry_date": None,
+            "last_entry_date": None,
+        }
+
+    # --- Summary maintenance --------------------------------------------------
+    def _summary_user_ids(
+        self, conn: sqlite3.Connection, user_ids: Optional[Iterable[int]]
+    ) -> List[int]:
+        if user_ids is not None:
+            return [int(user_id) for user_id in user_ids]
+        return [row[0] for row in conn.execute("SELECT id FROM users ORDER BY id")]
+
+    def verify_mood_summaries(
+        self, user_ids: Optional[Iterable[int]] = None
+    ) -> List[int]:
+        """Return the users whose stored summary disagrees with their entries.
+
+        Recomputes each summary from ``mood_entries`` the slow way, so this is
+        meant for maintenance runs rather than request paths. All users are
+        checked when ``user_ids`` is omitted.
+        """
+        empty = (0, 0, None, None, None, None)
+        drifted: List[int] = []
+        with self._connect() as conn:
+            for user_id in self._summary_user_ids(conn, user_ids):
+                stored = (
+                    conn.execute(SQLQueries.GET_MOOD_SUMMARY, (user_id,)).fetchone()
+                    or empty,
+                    conn.execute(
+                        SQLQueries.GET_MOOD_SUMMARY_COUNTS, (user_id,)
+                    ).fetchall(),
+                )
+                actual = (
+                    conn.execute(
+                        SQLQueries.GET_MOOD_STATISTICS, (user_id,) * 3
+                    ).fetchone(),
+                    conn.execute(SQLQueries.GET_MOOD_COUNTS, (user_id,)).fetchall(),
+                )
+                if (tuple(stored[0]), stored[1]) != (tuple(actual[0]), actual[1]):
+                    drifted.append(user_id)
+        return drifted
+
+    def rebuild_mood_summaries(self, user_ids: Optional[Iterable[int]] = None) -> int:
+        """Recompute stored summaries from ``mood_entries``; returns users rebuilt."""
+
+        def _write(conn: sqlite3.Connection) -> int:
+            targets = self._summary_user_ids(conn, user_ids)
+            for user_id in targets:
+                conn.execute(
+                    "DELETE FROM user_mood_counts WHERE user_id = ?", (user_id,)
+                )
+                conn.execute(
+                    """
+                    INSERT INTO user_mood_counts (user_id, mood, entries)
+                    SELECT user_id, mood, COUNT(*)
+                      FROM mood_entries
+                     WHERE user_id = ?
+                     GROUP BY mood
+                    """,
+                    (user_id,),
+                )
+                conn.execute(
+                    SQLQueries.REFRESH_MOOD_SUMMARY.format(user=":user_id"),
+                    {"user_id": user_id},
+                )
+            return len(targets)
+
+        return self._run_write(_write)
+
+    # --- Streaks --------------------------------------------------------------
     def get_current_streak(self, user_id: int) -> int:
         try:
-            dates = self._get_user_entry_dates(user_id)
-            if not dates:
-                return 0
-            parsed_dates = self._parse_date_strings(dates)
-            if not parsed_dates:
-                return 0
-            return self._calculate_streak_from_dates(parsed_dates)
+            return int(self.get_streak_state(user_id)["current_streak"])
         except Exception as exc:  # pragma: no cover - defensive guard
             logger.warning("Error calculating streak for user %s: %s", user_id, exc)
             return 0
 
-    def _get_user_entry_dates(self, user_id: int) -> List[str]:
-        with self._connect() as conn:
-            cursor = conn.execute(SQLQueries.GET_USER_ENTRY_DATES, (user_id,))
-            return [row[0] for row in cursor.fetchall()]
-
-    def _parse_date_strings(self, date_strings: List[str]) -> List[date]:
-        parsed_dates: List[date] = []
-        date_formats = ["%m/%d/%Y", "%Y-%m-%d"]
-        for date_str in date_strings:
-            for fmt in date_formats:
-                try:
-                    parsed_dates.append(datetime.strptime(date_str, fmt).date())
-                    break
-                except ValueError:
-                    continue
-            else:
-                logger.debug("Could not parse date: %s", date_str)
-        return sorted(parsed_dates, reverse=True)
-
-    def _calculate_streak_from_dates(self, parsed_dates: List[date]) -> int:
-        if not parsed_dates:
-            return 0
-        today = datetime.now().date()
-        most_recent = parsed_dates[0]
-        if (today - most_recent).days > 1:
-            return 0
-        streak = 0
-        expected_date = most_recent
-        for entry_date in parsed_dates:
-            if entry_date == expected_date:
-                streak += 1
-                expected_date = entry_date - timedelta(days=1)
-            else:
-                break
-        return streak
-
     # --- Achievements ---------------------------------------------------------
     def add_achievement(self, user_id: int, achievement_type: str) -> Optional[int]:
-        with self._connect() as conn:
+        def _write(conn: sqlite3.Connection) -> Optional[int]:
             try:
                 cursor = conn.execute(
                     "INSERT INTO achievements (user_id, achievement_type) VALUES (?, ?)",
                     (user_id, achievement_type),
                 )
-                conn.commit()
                 return int(cursor.lastrowid or 0)
             except sqlite3.IntegrityError:
                 return None
 
+        return self._run_write(_write)
+
     def get_user_achievements(self, user_id: int) -> List[Dict]:
         with self._connect() as conn:
             conn.row_factory = sqlite3.Row
@@ -159,7 +215,7 @@ class AchievementsMixin(DatabaseConnectionMixin):
         token_id: int,
         tx_hash: str,
     ) -> None:
-        with self._connect() as conn:
+        def _write(conn: sqlite3.Connection) -> None:
             conn.execute(
                 """
                 UPDATE achievements
@@ -170,7 +226,8 @@ class AchievementsMixin(DatabaseConnectionMixin):
                 """,
                 (token_id, tx_hash, achievement_id),
             )
-            conn.commit()
+
+        self._run_write(_write)
 
     def check_achievements(self, user_id: int) -> List[str]:
         new_achievements: List[str] = []
@@ -2,20 +2,66 @@
 
 from __future__ import annotations
 
+import atexit
 import logging
+import os
+import queue
 import sqlite3
+import threading
 import time
-from typing import Any, Dict, Iterable, Optional, Sequence
+import weakref
+from concurrent.futures import Future
+from contextlib import contextmanager
+from datetime import datetime
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+)
 
 # Configure logging once for all database modules
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger("api.database")
 
+T = TypeVar("T")
+WriteOperation = Callable[[sqlite3.Connection], T]
+
 
 class DatabaseError(Exception):
     """Raised when a database operation fails."""
 
 
+# Display formats accepted for ``mood_entries.date``. The stored string is
+# kept as entered; ``entry_day`` holds its ``date.toordinal()`` so ranges,
+# ordering and streaks compare integers through an index.
+ENTRY_DATE_FORMATS = ("%m/%d/%Y", "%Y-%m-%d")
+
+
+def parse_entry_day(value: Optional[str], *, strict: bool = True) -> Optional[int]:
+    """Return the day number for a mood entry date string.
+
+    Raises ``ValueError`` for unparseable input unless ``strict`` is false,
+    in which case ``None`` is returned.
+    """
+    if isinstance(value, str):
+        text = value.strip()
+        for fmt in ENTRY_DATE_FORMATS:
+            try:
+                return datetime.strptime(text, fmt).date().toordinal()
+            except ValueError:
+                continue
+    if strict:
+        raise ValueError(f"Invalid date: {value!r} (expected MM/DD/YYYY)")
+    return None
+
+
 class SQLQueries:
     """Constants for SQL queries to improve maintainability."""
 
@@ -57,54 +103,814 @@ class SQLQueries:
         "FROM goals WHERE id = ? AND user_id = ?"
     )
 
-    # Mood entries queries
-    GET_USER_ENTRY_DATES = (
-        "SELECT DISTINCT date FROM mood_entries WHERE user_id = ? ORDER BY date DESC"
-    )
-
+    # Computes from the entries what GET_MOOD_SUMMARY reads from the
+    # trigger-maintained summary; used to verify and rebuild it.
     GET_MOOD_STATISTICS = (
         "SELECT "
         "  COUNT(*) as total_entries, "
-        "  AVG(mood) as average_mood, "
+        "  COALESCE(SUM(mood), 0) as mood_sum, "
         "  MIN(mood) as lowest_mood, "
         "  MAX(mood) as highest_mood, "
-        "  MIN(date) as first_entry_date, "
-        "  MAX(date) as last_entry_date "
+        "  (SELECT date FROM mood_entries WHERE user_id = ? AND entry_day IS NOT NULL "
+        "    ORDER BY entry_day ASC LIMIT 1) as first_entry_date, "
+        "  (SELECT date FROM mood_entries WHERE user_id = ? AND entry_day IS NOT NULL "
+        "    ORDER BY entry_day DESC LIMIT 1) as last_entry_date "
         "FROM mood_entries WHERE user_id = ?"
     )
 
+    GET_MOOD_COUNTS = (
+        "SELECT mood, COUNT(*) FROM mood_entries "
+        "WHERE user_id = ? GROUP BY mood ORDER BY mood"
+    )
+
+    # Streak queries
+    GET_STREAK_STATE = (
+        "SELECT last_entry_day, current_run, longest_run "
+        "FROM user_streaks WHERE user_id = ?"
+    )
+
+    UPSERT_STREAK_STATE = (
+        "INSERT INTO user_streaks (user_id, last_entry_day, current_run, longest_run) "
+        "VALUES (?, ?, ?, ?) "
+        "ON CONFLICT(user_id) DO UPDATE SET "
+        "  last_entry_day = excluded.last_entry_day, "
+        "  current_run = excluded.current_run, "
+        "  longest_run = excluded.longest_run, "
+        "  updated_at = CURRENT_TIMESTAMP"
+    )
+
+    # Gaps and islands over a user's distinct entry days: consecutive days
+    # share ``entry_day - row_number``. Returns the newest run's end and
+    # length plus the longest run, or no row when the user has no days.
+    COMPUTE_STREAK_STATE = """
+        WITH runs AS (
+            SELECT MAX(entry_day) AS end_day, COUNT(*) AS length
+              FROM (
+                    SELECT entry_day,
+                           entry_day - ROW_NUMBER() OVER (ORDER BY entry_day) AS island
+                      FROM (
+                            SELECT DISTINCT entry_day FROM mood_entries
+                             WHERE user_id = ? AND entry_day IS NOT NULL
+                           )
+                   )
+             GROUP BY island
+        )
+        SELECT end_day, length, (SELECT MAX(length) FROM runs)
+          FROM runs
+         ORDER BY end_day DESC
+         LIMIT 1
+    """
+
+    # Daily rollup queries
+    GET_DAILY_ROLLUPS = (
+        "SELECT day, entries, mood_sum, mood_min, mood_max FROM user_daily_moods "
+        "WHERE user_id = ? AND day BETWEEN ? AND ? ORDER BY day"
+    )
+
+    # Mood count and sum per (weekday, hour) in one pass over the
+    # (user_id, entry_day, mood, created_at) index. Weekday is Monday = 0;
+    # the hour comes from the stored UTC timestamp, both the ISO and the
+    # SQLite formats keeping HH:MM at character 12, shifted by the first
+    # parameter (minutes east of UTC) into the user's local time.
+    GET_MOOD_PATTERNS = """
+        SELECT (entry_day - 1) % 7 AS weekday,
+               ((CAST(substr(created_at, 12, 2) AS INTEGER) * 60
+                 + CAST(substr(created_at, 15, 2) AS INTEGER)
+                 + ?) % 1440 + 1440) % 1440 / 60 AS hour,
+               COUNT(*), SUM(mood)
+          FROM mood_entries
+         WHERE user_id = ? AND entry_day IS NOT NULL
+         GROUP BY weekday, hour
+    """
+
+    # Recomputes one (user, day) rollup row from that day's entries, which
+    # the (user_id, entry_day, mood) index answers directly, and drops the
+    # row once the day has no entries left. ``{user}`` and ``{day}`` are
+    # bound parameters or trigger row references.
+    REFRESH_DAILY_ROLLUP = """
+        INSERT INTO user_daily_moods
+            (user_id, day, entries, mood_sum, mood_min, mood_max)
+        SELECT {user}, entry_day, COUNT(*), SUM(mood), MIN(mood), MAX(mood)
+          FROM mood_entries
+         WHERE user_id = {user} AND entry_day = {day}
+         GROUP BY entry_day
+        ON CONFLICT(user_id, day) DO UPDATE SET
+            entries = excluded.entries,
+            mood_sum = excluded.mood_sum,
+            mood_min = excluded.mood_min,
+            mood_max = excluded.mood_max;
+        DELETE FROM user_daily_moods
+         WHERE user_id = {user} AND day = {day}
+           AND NOT EXISTS (
+               SELECT 1 FROM mood_entries
+                WHERE user_id = {user} AND entry_day = {day}
+           );
+    """
+
+    # Mood summary queries
+    GET_MOOD_SUMMARY = (
+        "SELECT entry_count, mood_sum, mood_min, mood_max, "
+        "       first_entry_date, last_entry_date "
+        "FROM user_mood_summary WHERE user_id = ?"
+    )
+
+    GET_MOOD_SUMMARY_COUNTS = (
+        "SELECT mood, entries FROM user_mood_counts "
+        "WHERE user_id = ? ORDER BY mood"
+    )
+
+    # Recomputes a user's summary row from their per-mood counts (a handful
+    # of rows) plus two index seeks for the first and last dates. ``{user}``
+    # is ``:user_id`` when run directly, or a row reference inside triggers.
+    REFRESH_MOOD_SUMMARY = """
+        INSERT INTO user_mood_summary (
+            user_id, entry_count, mood_sum, mood_min, mood_max,
+            first_entry_date, last_entry_date
+        )
+        SELECT {user}, COALESCE(SUM(entries), 0), COALESCE(SUM(mood * entries), 0),
+               MIN(mood), MAX(mood),
+               (SELECT date FROM mood_entries
+                 WHERE user_id = {user} AND entry_day IS NOT NULL
+                 ORDER BY entry_day ASC LIMIT 1),
+               (SELECT date FROM mood_entries
+                 WHERE user_id = {user} AND entry_day IS NOT NULL
+                 ORDER BY entry_day DESC LIMIT 1)
+          FROM user_mood_counts
+         WHERE user_id = {user}
+        ON CONFLICT(user_id) DO UPDATE SET
+            entry_count = excluded.entry_count,
+            mood_sum = excluded.mood_sum,
+            mood_min = excluded.mood_min,
+            mood_max = excluded.mood_max,
+            first_entry_date = excluded.first_entry_date,
+            last_entry_date = excluded.last_entry_date,
+            updated_at = CURRENT_TIMESTAMP;
+    """
+
+
+# Named SQLite tuning profiles, applied to every pooled connection. Keys map
+# to PRAGMA names; ``journal_mode`` is persistent in the database file, so the
+# "durable" profile leaves whatever mode the file already uses untouched.
+# "balanced" (WAL with synchronous=NORMAL) never corrupts the database and
+# only risks the last commits on power loss or an OS crash. "throughput"
+# trades that away: with synchronous=OFF such a crash can lose committed
+# transactions and may corrupt the file, so use it only for data that can
+# be rebuilt (imports, benchmarks, throwaway instances).
+PERFORMANCE_PROFILES: Dict[str, Dict[str, Any]] = {
+    "durable": {
+        "synchronous": "FULL",
+        "busy_timeout": 5000,
+    },
+    "balanced": {
+        "journal_mode": "WAL",
+        "synchronous": "NORMAL",
+        "cache_size": -16000,  # KiB
+        "mmap_size": 64 * 1024 * 1024,
+        "temp_store": "MEMORY",
+        "busy_timeout": 5000,
+        "wal_autocheckpoint": 1000,
+    },
+    "throughput": {
+        "journal_mode": "WAL",
+        "synchronous": "OFF",
+        "cache_size": -64000,  # KiB
+        "mmap_size": 256 * 1024 * 1024,
+        "temp_store": "MEMORY",
+        "busy_timeout": 10000,
+        "wal_autocheckpoint": 4000,
+    },
+}
+
+DEFAULT_PERFORMANCE_PROFILE = "balanced"
+
+
+def performance_profile_pragmas(name: str) -> List[str]:
+    """Return the PRAGMA statements for a named performance profile."""
+    try:
+        profile = PERFORMANCE_PROFILES[name]
+    except KeyError:
+        raise ValueError(
+            f"Unknown database performance profile {name!r}; "
+            f"expected one of {', '.join(sorted(PERFORMANCE_PROFILES))}"
+        ) from None
+    pragmas = ["PRAGMA foreign_keys=ON"]
+    pragmas.extend(f"PRAGMA {key}={value}" for key, value in profile.items())
+    return pragmas
+
+
+class ConnectionPool:
+    """Bounded, thread-safe pool of warm SQLite connections.
+
+    Connections are opened with ``check_same_thread=False`` so a connection
+    checked out by one gunicorn gthread worker thread can be returned and
+    reused by another; the pool guarantees a connection is only ever held by
+    one thread at a time. Pragmas are applied once when a connection is
+    opened, connections are validated on checkout, and they are recycled
+    after ``max_uses`` checkouts or after an error. At most ``max_size`` idle
+    connections are kept; bursts beyond that are served by extra connections
+    that are closed on release, so nested checkouts never deadlock. The pool
+    notices when it has been inherited across a ``fork()`` (gunicorn
+    ``--preload``) and drops the parent's connections instead of sharing them.
+    """
+
+    def __init__(
+        self,
+        db_path: str,
+        *,
+        max_size: int = 8,
+        max_uses: int = 1000,
+        timeout: float = 5.0,
+        pragmas: Sequence[str] = ("PRAGMA foreign_keys=ON",),
+    ) -> None:
+        self.db_path = db_path
+        self.max_size = max(1, int(max_size))
+        self.max_uses = max(1, int(max_uses))
+        self.timeout = timeout
+        self.pragmas = tuple(pragmas)
+        self._lock = threading.Lock()
+        self._idle: List[sqlite3.Connection] = []
+        self._uses: Dict[int, int] = {}
+        self._pid = os.getpid()
+        self.opened = 0
+        self.checkouts = 0
+        self.recycled = 0
+
+    def _open(self) -> sqlite3.Connection:
+        try:
+            conn = sqlite3.connect(
+                self.db_path, timeout=self.timeout, check_same_thread=False
+            )
+            try:
+                for pragma in self.pragmas:
+                    conn.execute(pragma)
+            except sqlite3.Error:
+                conn.close()
+                raise
+        except sqlite3.Error as exc:  # pragma: no cover - rare failure
+            logger.error("Failed to connect to database: %s", exc)
+            raise DatabaseError(f"Database connection failed: {exc}") from exc
+        with self._lock:
+            self.opened += 1
+        return conn
+
+    def _reset_after_fork(self) -> None:
+        # Connections inherited from the parent process must never be used
+        # (or closed) by the child; just forget about them.
+        self._idle = []
+        self._uses = {}
+        self._pid = os.getpid()
+
+    def acquire(self) -> sqlite3.Connection:
+        """Check out a validated connection, opening a new one if needed."""
+        while True:
+            with self._lock:
+                if self._pid != os.getpid():
+                    self._reset_after_fork()
+                conn = self._idle.pop() if self._idle else None
+                self.checkouts += 1
+            if conn is None:
+                conn = self._open()
+                with self._lock:
+                    self._uses[id(conn)] = 0
+                return conn
+            try:
+                conn.execute("SELECT 1").fetchone()
+                return conn
+            except sqlite3.Error:
+                self._discard(conn)
+
+    def release(self, conn: sqlite3.Connection, *, discard: bool = False) -> None:
+        """Return a connection to the pool, closing it when it is spent."""
+        if not discard:
+            try:
+                if conn.in_transaction:
+                    conn.rollback()
+                conn.row_factory = None
+            except sqlite3.Error:
+                discard = True
+
+        with self._lock:
+            if self._pid != os.getpid():
+                self._reset_after_fork()
+                return
+            uses = self._uses.get(id(conn), 0) + 1
+            if (
+                discard
+                or uses >= self.max_uses
+                or len(self._idle) >= self.max_size
+            ):
+                self._uses.pop(id(conn), None)
+                self.recycled += 1
+                to_close: Optional[sqlite3.Connection] = conn
+            else:
+                self._uses[id(conn)] = uses
+                self._idle.append(conn)
+                to_close = None
+
+        if to_close is not None:
+            try:
+                to_close.close()
+            except sqlite3.Error:  # pragma: no cover - best effort
+                pass
+
+    def _discard(self, conn: sqlite3.Connection) -> None:
+        self.release(conn, discard=True)
+
+    @contextmanager
+    def connection(self) -> Iterator[sqlite3.Connection]:
+        """Borrow a connection for the duration of a ``with`` block.
+
+        Mirrors ``with sqlite3.connect(...)``: commits on success and rolls
+        back on error. Connections that raised are recycled rather than
+        returned to the pool.
+        """
+        conn = self.acquire()
+        try:
+            yield conn
+            conn.commit()
+        except BaseException as exc:
+            try:
+                conn.rollback()
+            except sqlite3.Error:
+                pass
+            self.release(conn, discard=isinstance(exc, sqlite3.Error))
+            raise
+        else:
+            self.release(conn)
+
+    def close(self) -> None:
+        """Close every idle connection held by the pool."""
+        with self._lock:
+            if self._pid != os.getpid():
+                self._reset_after_fork()
+                return
+            idle, self._idle = self._idle, []
+            for conn in idle:
+                self._uses.pop(id(conn), None)
+        for conn in idle:
+            try:
+                conn.close()
+            except sqlite3.Error:  # pragma: no cover - best effort
+                pass
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "idle": len(self._idle),
+                "opened": self.opened,
+                "checkouts": self.checkouts,
+                "recycled": self.recycled,
+            }
+
+
+class WriteQueue:
+    """Single writer thread that group-commits queued write operations.
+
+    Callers submit a callable that receives a connection and performs its
+    statements without committing. The writer thread collects operations for
+    at most ``max_latency`` seconds (or ``max_batch`` operations), runs each
+    one inside its own savepoint and commits the whole batch in one
+    transaction, so N concurrent requests cost one fsync instead of N. A
+    failing operation is rolled back to its savepoint and only its future
+    receives the exception. The thread is started lazily and restarted after
+    ``fork()`` because threads do not survive into gunicorn workers.
+    """
+
+    _STOP = object()
+
+    def __init__(
+        self,
+        pool: ConnectionPool,
+        *,
+        max_latency: float = 0.002,
+        max_batch: int = 256,
+    ) -> None:
+        self.pool = pool
+        self.max_latency = max(0.0, float(max_latency))
+        self.max_batch = max(1, int(max_batch))
+        self._queue: "queue.SimpleQueue[Any]" = queue.SimpleQueue()
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._pid = os.getpid()
+        self.batches = 0
+        self.operations = 0
+
+    def submit(self, op: WriteOperation[T]) -> "Future[T]":
+        """Queue ``op`` and return a future for its return value."""
+        if self._thread is not None and self._thread is threading.current_thread():
+            raise DatabaseError("Write operations cannot be queued from the writer")
+        self._ensure_started()
+        future: "Future[T]" = Future()
+        self._queue.put((op, future))
+        return future
+
+    def _ensure_started(self) -> None:
+        with self._lock:
+            if self._pid != os.getpid():
+                self._queue = queue.SimpleQueue()
+                self._thread = None
+                self._pid = os.getpid()
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(
+                    target=self._run, name="nightlio-db-writer", daemon=True
+                )
+                self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            item = self._queue.get()
+            if item is self._STOP:
+                return
+            batch: List[Tuple[WriteOperation[Any], "Future[Any]"]] = [item]
+            deadline = time.monotonic() + self.max_latency
+            stop = False
+            while len(batch) < self.max_batch:
+                remaining = deadline - time.monotonic()
+                try:
+                    item = (
+                        self._queue.get(timeout=remaining)
+                        if remaining > 0
+                        else self._queue.get_nowait()
+                    )
+                except queue.Empty:
+                    break
+                if item is self._STOP:
+                    stop = True
+                    break
+                batch.append(item)
+            self._commit_batch(batch)
+            if stop:
+                return
+
+    def _commit_batch(
+        self, batch: List[Tuple[WriteOperation[Any], "Future[Any]"]]
+    ) -> None:
+        outcomes: List[Tuple["Future[Any]", Any, Optional[BaseException]]] = []
+        pending = [(op, fut) for op, fut in batch if fut.set_running_or_notify_cancel()]
+        if not pending:
+            return
+        try:
+            conn = self.pool.acquire()
+        except BaseException as exc:  # pragma: no cover - connection failure
+            for _, fut in pending:
+                fut.set_exception(exc)
+            return
+
+        discard = False
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            for op, fut in pending:
+                conn.row_factory = None
+                conn.execute("SAVEPOINT queued_write")
+                try:
+                    result = op(conn)
+                except BaseException as exc:
+                    conn.execute("ROLLBACK TO SAVEPOINT queued_write")
+                    conn.execute("RELEASE SAVEPOINT queued_write")
+                    outcomes.append((fut, None, exc))
+                else:
+                    conn.execute("RELEASE SAVEPOINT queued_write")
+                    outcomes.append((fut, result, None))
+            conn.commit()
+        except BaseException as exc:
+            discard = True
+            try:
+                conn.rollback()
+            except sqlite3.Error:
+                pass
+            logger.error("Group commit of %s writes failed: %s", len(pending), exc)
+            outcomes = [(fut, None, exc) for _, fut in pending]
+        finally:
+            self.pool.release(conn, discard=discard)
+
+        self.batches += 1
+        self.operations += len(pending)
+        for fut, result, error in outcomes:
+            if error is not None:
+                fut.set_exception(error)
+            else:
+                fut.set_result(result)
+
+    def close(self, timeout: Optional[float] = 5.0) -> None:
+        """Drain queued writes and stop the writer thread."""
+        with self._lock:
+            thread = self._thread if self._pid == os.getpid() else None
+            self._thread = None
+        if thread is not None and thread.is_alive():
+            self._queue.put(self._STOP)
+            thread.join(timeout)
+
+
+class CounterBuffer:
+    """In-process write-behind buffer for per-key counter increments.
+
+    Increments are summed in memory and handed to ``flush`` as
+    ``[(key, delta), ...]`` once ``interval`` seconds have passed since the
+    first unflushed increment, once ``max_pending`` increments are waiting,
+    or at interpreter shutdown. Scheduled and threshold flushes both run on
+    a timer thread, never on the thread calling :meth:`add`, so they cannot
+    end up inside (and be rolled back with) that thread's transaction.
+    Readers add :meth:`pending` to the stored value so unflushed deltas stay
+    visible; deltas leave the buffer only once their write has committed.
+    A failed flush keeps its deltas and schedules another attempt.
+    """
+
+    def __init__(
+        self,
+        flush: Callable[[List[Tuple[int, int]]], None],
+        *,
+        interval: float = 5.0,
+        max_pending: int = 100,
+    ) -> None:
+        self._flush = flush
+        self.interval = max(0.0, float(interval))
+        self.max_pending = max(1, int(max_pending))
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._pending: Dict[int, int] = {}
+        self._count = 0
+        self._timer: Optional[threading.Timer] = None
+        self._timer_due_now = False
+        self._pid = os.getpid()
+        atexit.register(CounterBuffer._flush_at_exit, weakref.ref(self))
+
+    @staticmethod
+    def _flush_at_exit(ref: "weakref.ReferenceType[CounterBuffer]") -> None:
+        buffer = ref()
+        if buffer is not None:
+            buffer.close()
+
+    def _check_pid(self) -> None:
+        # Called with the lock held. Deltas and timers inherited from a
+        # parent process belong to the parent; never flush them twice.
+        if self._pid != os.getpid():
+            self._pending = {}
+            self._count = 0
+            self._timer = None
+            self._timer_due_now = False
+            self._pid = os.getpid()
+
+    def _schedule(self, delay: float) -> None:
+        # Called with the lock held.
+        if self._timer is not None:
+            self._timer.cancel()
+        self._timer = threading.Timer(delay, self.flush)
+        self._timer.daemon = True
+        self._timer.start()
+
+    def add(self, key: int, amount: int = 1) -> None:
+        with self._lock:
+            self._check_pid()
+            self._pending[key] = self._pending.get(key, 0) + amount
+            self._count += amount
+            if self._count >= self.max_pending:
+                if not self._timer_due_now:
+                    self._timer_due_now = True
+                    self._schedule(0)
+            elif self._timer is None:
+                self._schedule(self.interval)
+
+    def pending(self, key: int) -> int:
+        with self._lock:
+            self._check_pid()
+            return self._pending.get(key, 0)
+
+    def flush(self) -> None:
+        """Write all buffered deltas now."""
+        with self._flush_lock:
+            with self._lock:
+                self._check_pid()
+                if self._timer is not None:
+                    self._timer.cancel()
+                    self._timer = None
+                self._timer_due_now = False
+                # Deltas stay in _pending until the write commits, so readers
+                # never see them missing from both the buffer and the table.
+                items = list(self._pending.items())
+                flushing = self._count
+                self._count = 0
+            if not items:
+                return
+            try:
+                self._flush(items)
+            except Exception as exc:
+                logger.warning("Counter flush of %s keys failed: %s", len(items), exc)
+                with self._lock:
+                    self._count += flushing
+                    if self._timer is None:
+                        self._schedule(self.interval)
+                return
+            with self._lock:
+                for key, amount in items:
+                    remaining = self._pending.get(key, 0) - amount
+                    if remaining:
+                        self._pending[key] = remaining
+                    else:
+                        self._pending.pop(key, None)
+
+    def close(self) -> None:
+        self.flush()
+
+
+class UnitOfWork:
+    """One lazily opened connection and transaction shared by many calls.
+
+    While a unit of work is active on a thread, every ``_connect()`` block
+    and ``_run_write()`` operation of the owning database runs on its
+    connection inside a savepoint, so each call stays atomic on its own while
+    the whole group commits (or rolls back) once in :meth:`close`. The
+    connection is only checked out when the first call needs it.
+    """
+
+    def __init__(
+        self,
+        pool: ConnectionPool,
+        *,
+        immediate: bool = False,
+        on_close: Optional[Callable[["UnitOfWork"], None]] = None,
+    ) -> None:
+        self.pool = pool
+        self.immediate = immediate
+        self._on_close = on_close
+        self._conn: Optional[sqlite3.Connection] = None
+        self._depth = 0
+        self.closed = False
+
+    @property
+    def started(self) -> bool:
+        return self._conn is not None
+
+    def connection(self) -> sqlite3.Connection:
+        if self.closed:
+            raise DatabaseError("Unit of work is already closed")
+        if self._conn is None:
+            conn = self.pool.acquire()
+            try:
+                conn.execute("BEGIN IMMEDIATE" if self.immediate else "BEGIN")
+            except sqlite3.Error:
+                self.pool.release(conn, discard=True)
+                raise
+            self._conn = conn
+        return self._conn
+
+    @contextmanager
+    def savepoint(self) -> Iterator[sqlite3.Connection]:
+        """Run a block atomically inside the shared transaction."""
+        conn = self.connection()
+        name = f"uow_{self._depth}"
+        previous_factory = conn.row_factory
+        self._depth += 1
+        conn.execute(f"SAVEPOINT {name}")
+        try:
+            yield conn
+        except BaseException:
+            if conn.in_transaction:
+                conn.execute(f"ROLLBACK TO SAVEPOINT {name}")
+                conn.execute(f"RELEASE SAVEPOINT {name}")
+            raise
+        else:
+            conn.execute(f"RELEASE SAVEPOINT {name}")
+        finally:
+            self._depth -= 1
+            conn.row_factory = previous_factory
+
+    def close(self, commit: bool = True) -> None:
+        """Commit (or roll back) the shared transaction and release it."""
+        if self.closed:
+            return
+        self.closed = True
+        conn, self._conn = self._conn, None
+        try:
+            if conn is not None:
+                discard = False
+                try:
+                    if commit:
+                        conn.commit()
+                    else:
+                        conn.rollback()
+                except sqlite3.Error:
+                    discard = True
+                    raise
+                finally:
+                    self.pool.release(conn, discard=discard)
+        finally:
+            if self._on_close is not None:
+                self._on_close(self)
+
 
 class DatabaseConnectionMixin:
     """Provides connection helpers shared across database mixins."""
 
     db_path: str
+    _pool: Optional[ConnectionPool] = None
+    _writer: Optional[WriteQueue] = None
+    _local: Optional[threading.local] = None
+
+    # --- Units of work ------------------------------------------------------
+    @property
+    def write_queue_enabled(self) -> bool:
+        return self._writer is not None
+
+    def _active_unit_of_work(self) -> Optional[UnitOfWork]:
+        local = self._local
+        return getattr(local, "unit_of_work", None) if local is not None else None
+
+    def begin_unit_of_work(self, *, immediate: bool = False) -> UnitOfWork:
+        """Bind a new unit of work to the calling thread and return it.
+
+        Not available with the write queue: writes inside a unit of work
+        run on its own connection and would silently bypass group commit.
+        """
+        local = self._local
+        if self._pool is None or local is None:
+            raise DatabaseError("Units of work require a pooled database")
+        if self._writer is not None:
+            raise DatabaseError("Units of work cannot be combined with the write queue")
+        if getattr(local, "unit_of_work", None) is not None:
+            raise DatabaseError("A unit of work is already active on this thread")
+
+        def _unbind(uow: UnitOfWork) -> None:
+            if getattr(local, "unit_of_work", None) is uow:
+                local.unit_of_work = None
+
+        uow = UnitOfWork(self._pool, immediate=immediate, on_close=_unbind)
+        local.unit_of_work = uow
+        return uow
+
+    @contextmanager
+    def unit_of_work(self, *, immediate: bool = False) -> Iterator[UnitOfWork]:
+        """Share one connection and transaction across the enclosed calls."""
+        uow = self.begin_unit_of_work(immediate=immediate)
+        try:
+            yield uow
+        except BaseException:
+            uow.close(commit=False)
+            raise
+        uow.close(commit=True)
+
+    # --- Connections ----------------------------------------------------------
+    @contextmanager
+    def _connect(self, *, detached: bool = False) -> Iterator[sqlite3.Connection]:
+        """Borrow a SQLite connection with safe defaults.
+
+        Inside a unit of work this is a savepoint on the shared connection,
+        unless ``detached`` asks for a connection of its own (e.g. for
+        streamed responses that outlive the request's transaction).
+        Otherwise it uses the pool owned by the facade when one is configured
+        and falls back to a throwaway connection (e.g. bare mixin usage).
+        """
+        uow = None if detached else self._active_unit_of_work()
+        if uow is not None:
+            with uow.savepoint() as conn:
+                yield conn
+            return
+
+        pool = self._pool
+        if pool is not None:
+            with pool.connection() as conn:
+                yield conn
+            return
 
-    def _connect(self) -> sqlite3.Connection:
-        """Create a SQLite connection with safe defaults."""
         try:
             conn = sqlite3.connect(self.db_path)
             conn.execute("PRAGMA foreign_keys=ON")
-            return conn
         except sqlite3.Error as exc:  # pragma: no cover - rare failure
             logger.error("Failed to connect to database: %s", exc)
             raise DatabaseError(f"Database connection failed: {exc}") from exc
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def _run_write(
+        self, op: WriteOperation[T], retries: int = 3, *, detached: bool = False
+    ) -> T:
+        """Run a write operation in its own transaction and return its result.
+
+        ``op`` receives a connection and must not commit. With the write
+        queue enabled the operation is group-committed by the writer thread;
+        otherwise it runs under ``BEGIN IMMEDIATE`` on a pooled connection and
+        is retried when the database is locked. Inside a unit of work it runs
+        in a savepoint on the shared transaction instead, unless ``detached``
+        asks for a transaction of its own (for writes that must survive the
+        caller's rollback). SQLite errors propagate unchanged so callers keep
+        their existing exception handling.
+        """
+        uow = None if detached else self._active_unit_of_work()
+        if uow is not None:
+            with uow.savepoint() as conn:
+                return op(conn)
+
+        writer = self._writer
+        if writer is not None:
+            return writer.submit(op).result()
 
-    def _execute_with_retry(
-        self,
-        query: str,
-        params: Sequence[Any] | Iterable[Any] = (),
-        retries: int = 3,
-    ) -> sqlite3.Cursor:
-        """Execute a statement with basic retry handling for database locks."""
         for attempt in range(retries):
             try:
-                conn = self._connect()
-                try:
-                    cursor = conn.execute(query, tuple(params))
-                    conn.commit()
-                    return cursor
-                finally:
-                    conn.close()
+                with self._connect(detached=detached) as conn:
+                    conn.execute("BEGIN IMMEDIATE")
+                    return op(conn)
             except sqlite3.OperationalError as exc:
                 if "database is locked" in str(exc) and attempt < retries - 1:
                     delay = 0.1 * (attempt + 1)
@@ -115,18 +921,42 @@ class DatabaseConnectionMixin:
                     )
                     time.sleep(delay)
                     continue
-                logger.error("Database operation failed: %s", exc)
-                raise DatabaseError(f"Database operation failed: {exc}") from exc
-            except sqlite3.Error as exc:
-                logger.error("Database error: %s", exc)
-                raise DatabaseError(f"Database error: {exc}") from exc
+                raise
 
         raise DatabaseError("Database operation failed after all retries")
 
+    def _execute_with_retry(
+        self,
+        query: str,
+        params: Sequence[Any] | Iterable[Any] = (),
+        retries: int = 3,
+    ) -> sqlite3.Cursor:
+        """Execute a statement with basic retry handling for database locks."""
+        values = tuple(params)
+        try:
+            return self._run_write(
+                lambda conn: conn.execute(query, values), retries=retries
+            )
+        except sqlite3.OperationalError as exc:
+            logger.error("Database operation failed: %s", exc)
+            raise DatabaseError(f"Database operation failed: {exc}") from exc
+        except sqlite3.Error as exc:
+            logger.error("Database error: %s", exc)
+            raise DatabaseError(f"Database error: {exc}") from exc
+
 
 __all__ = [
+    "ConnectionPool",
+    "CounterBuffer",
+    "DEFAULT_PERFORMANCE_PROFILE",
+    "PERFORMANCE_PROFILES",
     "DatabaseConnectionMixin",
     "DatabaseError",
+    "ENTRY_DATE_FORMATS",
     "SQLQueries",
+    "UnitOfWork",
+    "WriteQueue",
     "logger",
+    "parse_entry_day",
+    "performance_profile_pragmas",
 ]
@@ -67,7 +67,6 @@ class GoalsMixin(DatabaseConnectionMixin):
             """,
             (0, streak, today_start, goal_dict["id"], goal_dict["user_id"]),
         )
-        conn.commit()
 
         conn.row_factory = sqlite3.Row
         refreshed = conn.execute(
@@ -103,27 +102,28 @@ class GoalsMixin(DatabaseConnectionMixin):
 
         period_start = self._week_start_iso()
 
+        def _write(conn: sqlite3.Connection) -> int:
+            cursor = conn.execute(
+                """
+                INSERT INTO goals (user_id, title, description, frequency_per_week,
+                                    completed, streak, period_start)
+                VALUES (?, ?, ?, ?, 0, 0, ?)
+                """,
+                (
+                    user_id,
+                    title.strip(),
+                    (description or "").strip(),
+                    frequency_per_week,
+                    period_start,
+                ),
+            )
+            goal_id = cursor.lastrowid
+            if goal_id is None:
+                raise DatabaseError("Failed to get goal ID after creation")
+            return int(goal_id)
+
         try:
-            with self._connect() as conn:
-                cursor = conn.execute(
-                    """
-                    INSERT INTO goals (user_id, title, description, frequency_per_week,
-                                        completed, streak, period_start)
-                    VALUES (?, ?, ?, ?, 0, 0, ?)
-                    """,
-                    (
-                        user_id,
-                        title.strip(),
-                        (description or "").strip(),
-                        frequency_per_week,
-                        period_start,
-                    ),
-                )
-                conn.commit()
-                goal_id = cursor.lastrowid
-                if goal_id is None:
-                    raise DatabaseError("Failed to get goal ID after creation")
-                return int(goal_id)
+            return self._run_write(_write)
         except sqlite3.Error as exc:
             logger.error("Failed to create goal for user %s: %s", user_id, exc)
             raise DatabaseError(f"Failed to create goal: {exc}") from exc
@@ -173,26 +173,29 @@ class GoalsMixin(DatabaseConnectionMixin):
         updates.append("updated_at = CURRENT_TIMESTAMP")
         params.extend([goal_id, user_id])
 
-        with self._connect() as conn:
+        def _write(conn: sqlite3.Connection) -> bool:
             cursor = conn.execute(
                 f"UPDATE goals SET {', '.join(updates)} WHERE id = ? AND user_id = ?",
                 params,
             )
-            conn.commit()
             return cursor.rowcount > 0
 
+        return self._run_write(_write)
+
     def delete_goal(self, user_id: int, goal_id: int) -> bool:
-        with self._connect() as conn:
+        def _write(conn: sqlite3.Connection) -> bool:
             cursor = conn.execute(
                 "DELETE FROM goals WHERE id = ? AND user_id = ?",
                 (goal_id, user_id),
             )
-            conn.commit()
             return cursor.rowcount > 0
 
+        return self._run_write(_write)
+
     def increment_goal_progress(self, user_id: int, goal_id: int) -> Optional[Dict]:
         today_str = datetime.now().strftime("%Y-%m-%d")
-        with self._connect() as conn:
+
+        def _write(conn: sqlite3.Connection) -> Optional[Dict]:
             conn.row_factory = sqlite3.Row
             row = conn.execute(
                 "SELECT * FROM goals WHERE id = ? AND user_id = ?",
@@ -246,7 +249,6 @@ class GoalsMixin(DatabaseConnectionMixin):
                 except sqlite3.Error:
                     pass
 
-            conn.commit()
             updated = conn.execute(
                 """
                 SELECT id, user_id, title, description, frequency_per_week, completed,
@@ -265,6 +267,8 @@ class GoalsMixin(DatabaseConnectionMixin):
             )
             return result
 
+        return self._run_write(_write)
+
     def get_goal_completions(
         self,
         user_id: int,
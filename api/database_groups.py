@@ -2,8 +2,9 @@
 
 from __future__ import annotations
 
+import json
 import sqlite3
-from typing import Dict, List
+from typing import Dict, Iterable, List, Optional, Tuple
 
 try:  # pragma: no cover - enable script execution fallback
     from .database_common import DatabaseConnectionMixin
@@ -37,42 +38,47 @@ class GroupsMixin(DatabaseConnectionMixin):
             return groups
 
     def create_group(self, name: str) -> int:
-        with self._connect() as conn:
+        def _write(conn: sqlite3.Connection) -> int:
             cursor = conn.execute("INSERT INTO groups (name) VALUES (?)", (name,))
-            conn.commit()
             return int(cursor.lastrowid or 0)
 
+        return self._run_write(_write)
+
     def create_group_option(self, group_id: int, name: str) -> int:
-        with self._connect() as conn:
+        def _write(conn: sqlite3.Connection) -> int:
             cursor = conn.execute(
                 "INSERT INTO group_options (group_id, name) VALUES (?, ?)",
                 (group_id, name),
             )
-            conn.commit()
             return int(cursor.lastrowid or 0)
 
+        return self._run_write(_write)
+
     def delete_group(self, group_id: int) -> bool:
-        with self._connect() as conn:
+        def _write(conn: sqlite3.Connection) -> bool:
             cursor = conn.execute("DELETE FROM groups WHERE id = ?", (group_id,))
-            conn.commit()
             return cursor.rowcount > 0
 
+        return self._run_write(_write)
+
     def delete_group_option(self, option_id: int) -> bool:
-        with self._connect() as conn:
+        def _write(conn: sqlite3.Connection) -> bool:
             cursor = conn.execute(
                 "DELETE FROM group_options WHERE id = ?",
                 (option_id,),
             )
-            conn.commit()
             return cursor.rowcount > 0
 
+        return self._run_write(_write)
+
     def add_entry_selections(self, entry_id: int, option_ids: List[int]) -> None:
-        with self._connect() as conn:
+        def _write(conn: sqlite3.Connection) -> None:
             conn.executemany(
                 "INSERT INTO entry_selections (entry_id, option_id) VALUES (?, ?)",
                 [(entry_id, option_id) for option_id in option_ids],
             )
-            conn.commit()
+
+        self._run_write(_write)
 
     def get_entry_selections(self, entry_id: int) -> List[Dict]:
         with self._connect() as conn:
@@ -90,5 +96,64 @@ class GroupsMixin(DatabaseConnectionMixin):
             )
             return [dict(row) for row in cursor.fetchall()]
 
+    def get_selections_for_entries(
+        self, user_id: int, entry_ids: Optional[Iterable[int]] = None
+    ) -> Dict[int, List[Dict]]:
+        """Return ``{entry_id: selections}`` for many of a user's entries.
+
+        One JOIN covers the whole set: every entry of the user when
+        ``entry_ids`` is ``None``, otherwise just the given ids (passed as a
+        single JSON parameter, so the statement does not grow with the page).
+        Entries without selections are absent from the result.
+        """
+        select = """
+            SELECT es.entry_id, go.id, go.name, g.name as group_name
+              FROM {source}
+              JOIN entry_selections es ON es.entry_id = me.id
+              JOIN group_options go ON es.option_id = go.id
+              JOIN groups g ON go.group_id = g.id
+             WHERE me.user_id = ?
+             ORDER BY es.entry_id, g.name, go.name
+        """
+        if entry_ids is None:
+            query = select.format(source="mood_entries me")
+            params: List[object] = [user_id]
+        else:
+            ids = [int(entry_id) for entry_id in entry_ids]
+            if not ids:
+                return {}
+            # Drive the join from the id list so a page costs one rowid
+            # lookup per entry however long the user's history is.
+            query = select.format(
+                source="json_each(?) ids JOIN mood_entries me ON me.id = ids.value"
+            )
+            params = [json.dumps(ids), user_id]
+
+        grouped: Dict[int, List[Dict]] = {}
+        with self._connect() as conn:
+            for entry_id, option_id, name, group_name in conn.execute(query, params):
+                grouped.setdefault(entry_id, []).append(
+                    {"id": option_id, "name": name, "group_name": group_name}
+                )
+        return grouped
+
+    def get_option_mood_rows(self, user_id: int) -> List[Tuple[int, int, int]]:
+        """Return ``(entry_id, option_id, mood)`` for every selection of a user.
+
+        Rows of one entry are adjacent. The order is the day index's own
+        (day, mood, created_at, id), so no sort step is needed.
+        """
+        with self._connect() as conn:
+            return conn.execute(
+                """
+                SELECT es.entry_id, es.option_id, me.mood
+                  FROM mood_entries me
+                  JOIN entry_selections es ON es.entry_id = me.id
+                 WHERE me.user_id = ?
+                 ORDER BY me.entry_day, me.mood, me.created_at, me.id
+                """,
+                (user_id,),
+            ).fetchall()
+
 
 __all__ = ["GroupsMixin"]
@@ -2,17 +2,29 @@
 
 from __future__ import annotations
 
+import json
 import sqlite3
-from typing import Dict, List, Optional
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
 
 try:  # pragma: no cover - allow top-level script usage
-    from .database_common import DatabaseConnectionMixin
+    from .database_common import parse_entry_day
+    from .database_streaks import StreakMixin
+    from .models.mood_entry import MoodEntry
 except ImportError:  # pragma: no cover
-    from database_common import DatabaseConnectionMixin  # type: ignore
+    from database_common import parse_entry_day  # type: ignore
+    from database_streaks import StreakMixin  # type: ignore
+    from models.mood_entry import MoodEntry  # type: ignore
 
 
-class MoodEntriesMixin(DatabaseConnectionMixin):
-    """CRUD helpers for mood entries and their selections."""
+class MoodEntriesMixin(StreakMixin):
+    """CRUD helpers for mood entries and their selections.
+
+    Every write reports the entry days it adds or removes to the streak
+    state (see ``StreakMixin``) inside the same transaction.
+    """
+
+    # Rows per executemany batch in add_mood_entries_bulk.
+    BULK_INSERT_CHUNK_SIZE = 500
 
     def add_mood_entry(
         self,
@@ -23,25 +35,29 @@ class MoodEntriesMixin(DatabaseConnectionMixin):
         time: Optional[str] = None,
         selected_options: Optional[List[int]] = None,
     ) -> int:
-        with self._connect() as conn:
+        entry_day = parse_entry_day(date, strict=False)
+
+        def _write(conn: sqlite3.Connection) -> int:
             if time:
                 cursor = conn.execute(
                     """
-                    INSERT INTO mood_entries (user_id, date, mood, content, created_at)
-                    VALUES (?, ?, ?, ?, ?)
+                    INSERT INTO mood_entries
+                        (user_id, date, entry_day, mood, content, created_at)
+                    VALUES (?, ?, ?, ?, ?, ?)
                     """,
-                    (user_id, date, mood, content, time),
+                    (user_id, date, entry_day, mood, content, time),
                 )
             else:
                 cursor = conn.execute(
                     """
-                    INSERT INTO mood_entries (user_id, date, mood, content)
-                    VALUES (?, ?, ?, ?)
+                    INSERT INTO mood_entries (user_id, date, entry_day, mood, content)
+                    VALUES (?, ?, ?, ?, ?)
                     """,
-                    (user_id, date, mood, content),
+                    (user_id, date, entry_day, mood, content),
                 )
 
             entry_id = cursor.lastrowid
+            self._streak_days_added(conn, user_id, [entry_day])
 
             if selected_options:
                 conn.executemany(
@@ -49,41 +65,318 @@ class MoodEntriesMixin(DatabaseConnectionMixin):
                     [(entry_id, option_id) for option_id in selected_options],
                 )
 
-            conn.commit()
             return int(entry_id if entry_id is not None else 0)
 
-    def get_all_mood_entries(self, user_id: int) -> List[Dict]:
+        return self._run_write(_write)
+
+    def add_mood_entries_bulk(
+        self, user_id: int, entries: Sequence[Dict]
+    ) -> List[int]:
+        """Insert many entries in one transaction and return their ids.
+
+        Each item carries ``date``, ``mood``, ``content`` and optionally
+        ``time``, ``selected_options`` and ``import_key``; callers validate
+        them first. Rows are written with ``executemany`` in bounded chunks.
+        """
+        if not entries:
+            return []
+        return self._run_write(
+            lambda conn: self._insert_entries(conn, user_id, entries)
+        )
+
+    def import_mood_entries(
+        self, user_id: int, entries: Sequence[Dict]
+    ) -> Tuple[int, int]:
+        """Insert entries whose ``import_key`` is new; return (inserted, skipped).
+
+        Keys already stored for the user, or repeated within ``entries``, are
+        skipped, which makes re-importing the same source idempotent. The
+        unique ``(user_id, import_key)`` index backs this up at the storage
+        level.
+        """
+
+        def _write(conn: sqlite3.Connection) -> Tuple[int, int]:
+            keys = [item["import_key"] for item in entries]
+            seen = {
+                row[0]
+                for row in conn.execute(
+                    """
+                    SELECT import_key FROM mood_entries
+                     WHERE user_id = ?
+                       AND import_key IN (SELECT value FROM json_each(?))
+                    """,
+                    (user_id, json.dumps(keys)),
+                )
+            }
+            fresh: List[Dict] = []
+            for item in entries:
+                if item["import_key"] not in seen:
+                    seen.add(item["import_key"])
+                    fresh.append(item)
+            self._insert_entries(conn, user_id, fresh)
+            return len(fresh), len(entries) - len(fresh)
+
+        if not entries:
+            return 0, 0
+        return self._run_write(_write)
+
+    def _insert_entries(
+        self, conn: sqlite3.Connection, user_id: int, entries: Sequence[Dict]
+    ) -> List[int]:
+        # Inside the write transaction AUTOINCREMENT ids are allocated
+        # contiguously, so a chunk's ids follow from last_insert_rowid().
+        ids: List[int] = []
+        days = set()
+        size = max(1, int(self.BULK_INSERT_CHUNK_SIZE))
+        for offset in range(0, len(entries), size):
+            chunk = entries[offset : offset + size]
+            rows = [
+                (
+                    user_id,
+                    item["date"],
+                    parse_entry_day(item["date"], strict=False),
+                    item["mood"],
+                    item["content"],
+                    item.get("time") or None,
+                    item.get("import_key"),
+                )
+                for item in chunk
+            ]
+            conn.executemany(
+                """
+                INSERT INTO mood_entries
+                    (user_id, date, entry_day, mood, content, created_at, import_key)
+                VALUES (?, ?, ?, ?, ?, COALESCE(?, CURRENT_TIMESTAMP), ?)
+                """,
+                rows,
+            )
+            days.update(row[2] for row in rows)
+            last_id = conn.execute("SELECT last_insert_rowid()").fetchone()[0]
+            chunk_ids = list(range(last_id - len(chunk) + 1, last_id + 1))
+            inserted = conn.execute(
+                "SELECT COUNT(*) FROM mood_entries "
+                "WHERE id BETWEEN ? AND ? AND user_id = ?",
+                (chunk_ids[0], last_id, user_id),
+            ).fetchone()[0]
+            if inserted != len(chunk):  # pragma: no cover - defensive guard
+                raise sqlite3.DatabaseError("Bulk insert ids were not contiguous")
+
+            selections = [
+                (entry_id, option_id)
+                for entry_id, item in zip(chunk_ids, chunk)
+                for option_id in item.get("selected_options") or ()
+            ]
+            if selections:
+                conn.executemany(
+                    "INSERT INTO entry_selections (entry_id, option_id) VALUES (?, ?)",
+                    selections,
+                )
+            ids.extend(chunk_ids)
+        self._streak_days_added(conn, user_id, days)
+        return ids
+
+    def get_all_mood_entries(self, user_id: int) -> List[MoodEntry]:
         with self._connect() as conn:
-            conn.row_factory = sqlite3.Row
+            conn.row_factory = MoodEntry.row_factory
             cursor = conn.execute(
-                """
-                SELECT id, date, mood, content, created_at, updated_at
+                f"""
+                SELECT {MoodEntry.COLUMNS}
                   FROM mood_entries
                  WHERE user_id = ?
-                 ORDER BY created_at DESC, date DESC
+                 ORDER BY created_at DESC, entry_day DESC
                 """,
                 (user_id,),
             )
-            return [dict(row) for row in cursor.fetchall()]
+            return cursor.fetchall()
 
     def get_mood_entries_by_date_range(
         self,
         user_id: int,
         start_date: str,
         end_date: str,
-    ) -> List[Dict]:
+    ) -> List[MoodEntry]:
+        """Return entries whose day falls in ``[start_date, end_date]``.
+
+        Both bounds accept the same formats as entry dates; anything else
+        raises ``ValueError``.
+        """
+        start_day = parse_entry_day(start_date)
+        end_day = parse_entry_day(end_date)
         with self._connect() as conn:
-            conn.row_factory = sqlite3.Row
+            conn.row_factory = MoodEntry.row_factory
             cursor = conn.execute(
-                """
-                SELECT id, date, mood, content, created_at, updated_at
+                f"""
+                SELECT {MoodEntry.COLUMNS}
+                  FROM mood_entries
+                 WHERE user_id = ? AND entry_day BETWEEN ? AND ?
+                 ORDER BY created_at DESC, entry_day DESC
+                """,
+                (user_id, start_day, end_day),
+            )
+            return cursor.fetchall()
+
+    def get_mood_entries_page(
+        self,
+        user_id: int,
+        limit: int,
+        after: Optional[Tuple[str, int]] = None,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+    ) -> Tuple[List[MoodEntry], Optional[Tuple[str, int]]]:
+        """Return one page of entries, newest first, and the next keyset.
+
+        Pages are ordered by ``(created_at, id)`` descending; ``after`` is
+        the key of the last row of the previous page. The returned key is
+        ``None`` once the final page has been read. Date bounds behave as in
+        :meth:`get_mood_entries_by_date_range`.
+        """
+        clauses = ["user_id = ?"]
+        params: List[object] = [user_id]
+        if start_date is not None and end_date is not None:
+            clauses.append("entry_day BETWEEN ? AND ?")
+            params.extend([parse_entry_day(start_date), parse_entry_day(end_date)])
+        if after is not None:
+            clauses.append("(created_at, id) < (?, ?)")
+            params.extend(after)
+        params.append(limit + 1)
+
+        with self._connect() as conn:
+            conn.row_factory = MoodEntry.row_factory
+            rows = conn.execute(
+                f"""
+                SELECT {MoodEntry.COLUMNS}
+                  FROM mood_entries
+                 WHERE {' AND '.join(clauses)}
+                 ORDER BY created_at DESC, id DESC
+                 LIMIT ?
+                """,
+                params,
+            ).fetchall()
+
+        entries = rows[:limit]
+        next_key = None
+        if len(rows) > limit:
+            last = entries[-1]
+            next_key = (last.created_at, last.id)
+        return entries, next_key
+
+    def get_mood_entry_changes(
+        self,
+        user_id: int,
+        limit: int,
+        since: Optional[Tuple[int, int]] = None,
+    ) -> Tuple[List[MoodEntry], List[int], Optional[Tuple[int, int]], bool]:
+        """Return entries written and ids deleted after a sync checkpoint.
+
+        Changes are ordered by ``(change_seq, id)``; ``since`` is the key of
+        the last change the client has seen, or ``None`` for a full sync
+        (which skips tombstones, as the client holds nothing to delete).
+        Returns ``(entries, deleted_ids, last_key, has_more)`` where
+        ``last_key`` is the checkpoint for the next call.
+        """
+        after = since or (-1, 0)
+        with self._connect() as conn:
+            conn.row_factory = None
+            entries = conn.execute(
+                f"""
+                SELECT {MoodEntry.COLUMNS}, change_seq
                   FROM mood_entries
-                 WHERE user_id = ? AND date BETWEEN ? AND ?
-                 ORDER BY created_at DESC, date DESC
+                 WHERE user_id = ? AND (change_seq, id) > (?, ?)
+                 ORDER BY change_seq, id
+                 LIMIT ?
                 """,
-                (user_id, start_date, end_date),
+                (user_id, *after, limit + 1),
+            ).fetchall()
+            tombstones = []
+            if since is not None:
+                tombstones = conn.execute(
+                    """
+                    SELECT entry_id, change_seq
+                      FROM mood_entry_tombstones
+                     WHERE user_id = ? AND (change_seq, entry_id) > (?, ?)
+                     ORDER BY change_seq, entry_id
+                     LIMIT ?
+                    """,
+                    (user_id, *after, limit + 1),
+                ).fetchall()
+
+        changes = sorted(
+            [((row[-1], row[0]), MoodEntry(*row[:-1])) for row in entries]
+            + [((row[1], row[0]), None) for row in tombstones],
+            key=lambda change: change[0],
+        )
+        has_more = len(changes) > limit
+        changes = changes[:limit]
+
+        written: List[MoodEntry] = []
+        deleted: List[int] = []
+        for key, entry in changes:
+            if entry is None:
+                deleted.append(key[1])
+            else:
+                written.append(entry)
+        last_key = changes[-1][0] if changes else since
+        return written, deleted, last_key, has_more
+
+    def iter_mood_entries_for_export(
+        self,
+        user_id: int,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        batch_size: int = 500,
+    ) -> Iterator[Dict]:
+        """Yield every entry with its selections, oldest day first.
+
+        One joined query is read with ``fetchmany`` so memory stays flat
+        whatever the history size; rows of an entry arrive together and are
+        folded into a single dict. The generator runs on a detached
+        connection, so it can be consumed after the request transaction has
+        ended, and it reads from one consistent snapshot.
+        """
+        clauses = ["me.user_id = ?"]
+        params: List[object] = [user_id]
+        if start_date is not None and end_date is not None:
+            clauses.append("me.entry_day BETWEEN ? AND ?")
+            params.extend([parse_entry_day(start_date), parse_entry_day(end_date)])
+
+        with self._connect(detached=True) as conn:
+            cursor = conn.execute(
+                f"""
+                SELECT me.id, me.date, me.mood, me.content, me.created_at,
+                       me.updated_at, go.id, go.name, g.name
+                  FROM mood_entries me
+                  LEFT JOIN entry_selections es ON es.entry_id = me.id
+                  LEFT JOIN group_options go ON es.option_id = go.id
+                  LEFT JOIN groups g ON go.group_id = g.id
+                 WHERE {' AND '.join(clauses)}
+                 ORDER BY me.entry_day, me.id, g.name, go.name
+                """,
+                params,
             )
-            return [dict(row) for row in cursor.fetchall()]
+            current: Optional[Dict] = None
+            while True:
+                rows = cursor.fetchmany(batch_size)
+                if not rows:
+                    break
+                for row in rows:
+                    if current is None or current["id"] != row[0]:
+                        if current is not None:
+                            yield current
+                        current = {
+                            "id": row[0],
+                            "date": row[1],
+                            "mood": row[2],
+                            "content": row[3],
+                            "created_at": row[4],
+                            "updated_at": row[5],
+                            "selections": [],
+                        }
+                    if row[6] is not None:
+                        current["selections"].append(
+                            {"id": row[6], "name": row[7], "group_name": row[8]}
+                        )
+            if current is not None:
+                yield current
 
     def get_mood_entry_by_id(self, user_id: int, entry_id: int) -> Optional[Dict]:
         with self._connect() as conn:
@@ -118,17 +411,20 @@ class MoodEntriesMixin(DatabaseConnectionMixin):
         if content is not None:
             updates.append("content = ?")
             params.append(content)
+        new_day = parse_entry_day(date, strict=False)
         if date is not None:
             updates.append("date = ?")
             params.append(date)
+            updates.append("entry_day = ?")
+            params.append(new_day)
         if time is not None:
             updates.append("created_at = ?")
             params.append(time)
 
-        with self._connect() as conn:
+        def _write(conn: sqlite3.Connection) -> bool:
             conn.row_factory = sqlite3.Row
             row = conn.execute(
-                "SELECT id FROM mood_entries WHERE id = ? AND user_id = ?",
+                "SELECT id, entry_day FROM mood_entries WHERE id = ? AND user_id = ?",
                 (entry_id, user_id),
             ).fetchone()
             if not row:
@@ -142,6 +438,9 @@ class MoodEntriesMixin(DatabaseConnectionMixin):
                     params + [entry_id, user_id],
                 )
                 updated = True
+                if date is not None and new_day != row["entry_day"]:
+                    self._streak_days_removed(conn, user_id, [row["entry_day"]])
+                    self._streak_days_added(conn, user_id, [new_day])
             else:
                 conn.execute(
                     """
@@ -164,17 +463,26 @@ class MoodEntriesMixin(DatabaseConnectionMixin):
                     )
                 updated = True
 
-            conn.commit()
             return updated or bool(selected_options is not None)
 
+        return self._run_write(_write)
+
     def delete_mood_entry(self, user_id: int, entry_id: int) -> bool:
-        with self._connect() as conn:
-            cursor = conn.execute(
+        def _write(conn: sqlite3.Connection) -> bool:
+            row = conn.execute(
+                "SELECT entry_day FROM mood_entries WHERE id = ? AND user_id = ?",
+                (entry_id, user_id),
+            ).fetchone()
+            if row is None:
+                return False
+            conn.execute(
                 "DELETE FROM mood_entries WHERE id = ? AND user_id = ?",
                 (entry_id, user_id),
             )
-            conn.commit()
-            return cursor.rowcount > 0
+            self._streak_days_removed(conn, user_id, [row[0]])
+            return True
+
+        return self._run_write(_write)
 
 
 __all__ = ["MoodEntriesMixin"]
@@ -0,0 +1,53 @@
+"""Per-user daily mood rollups and time-of-week patterns."""
+
+from __future__ import annotations
+
+from typing import List, Tuple
+
+try:  # pragma: no cover - allow top-level script usage
+    from .database_common import DatabaseConnectionMixin, SQLQueries
+except ImportError:  # pragma: no cover
+    from database_common import DatabaseConnectionMixin, SQLQueries  # type: ignore
+
+DailyRollup = Tuple[int, int, int, int, int]
+MoodPattern = Tuple[int, int, int, int]
+
+
+class DailyRollupMixin(DatabaseConnectionMixin):
+    """Reads ``user_daily_moods``, kept current by the ``*_rollup_*`` triggers.
+
+    Each row covers one day (``date.toordinal()``) on which the user has
+    entries and carries their count, mood sum, minimum and maximum. The
+    weekday x hour patterns come straight from the entries' day index.
+    """
+
+    def get_daily_rollups(
+        self, user_id: int, start_day: int, end_day: int
+    ) -> List[DailyRollup]:
+        """Return ``(day, entries, mood_sum, mood_min, mood_max)`` rows in order.
+
+        Days without entries are absent; both bounds are inclusive.
+        """
+        with self._connect() as conn:
+            cursor = conn.execute(
+                SQLQueries.GET_DAILY_ROLLUPS, (user_id, start_day, end_day)
+            )
+            return [tuple(row) for row in cursor.fetchall()]
+
+    def get_mood_patterns(
+        self, user_id: int, offset_minutes: int = 0
+    ) -> List[MoodPattern]:
+        """Return ``(weekday, hour, entries, mood_sum)`` for each occupied cell.
+
+        Weekday follows the entry's date (Monday is 0); the hour is the
+        creation time shifted by ``offset_minutes`` east of UTC. Undated
+        entries are left out.
+        """
+        with self._connect() as conn:
+            cursor = conn.execute(
+                SQLQueries.GET_MOOD_PATTERNS, (offset_minutes, user_id)
+            )
+            return [tuple(row) for row in cursor.fetchall()]
+
+
+__all__ = ["DailyRollupMixin"]
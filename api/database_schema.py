@@ -3,48 +3,758 @@
 from __future__ import annotations
 
 import sqlite3
-from typing import Iterable
+from typing import Iterable, Tuple
 
 try:  # pragma: no cover - allow module to run outside package context
-    from .database_common import DatabaseConnectionMixin, logger
+    from .database_common import (
+        DatabaseConnectionMixin,
+        logger,
+        parse_entry_day,
+    )
 except ImportError:  # pragma: no cover - fallback for scripts
-    from database_common import DatabaseConnectionMixin, logger  # type: ignore
+    from database_common import (  # type: ignore
+        DatabaseConnectionMixin,
+        logger,
+        parse_entry_day,
+    )
 
 
 class DatabaseSchemaMixin(DatabaseConnectionMixin):
-    """Provides table creation and bootstrap helpers."""
+    """Provides versioned schema migrations and bootstrap helpers.
+
+    The schema version lives in ``PRAGMA user_version``. Each entry in
+    ``MIGRATIONS`` is ``(version, description, method name)``; the methods
+    receive a connection inside the migration transaction and must not
+    commit. Append new steps, never edit or reorder released ones; steps
+    carry their own copies of the SQL they run, so a later change to a
+    shared query ships as a new step rather than rewriting an old one.
+    """
+
+    MIGRATIONS: Tuple[Tuple[int, str, str], ...] = (
+        (1, "baseline schema and default groups", "_migration_001_baseline"),
+        (2, "per-user composite and covering indexes", "_migration_002_indexes"),
+        (3, "sortable entry_day column for mood entries", "_migration_003_entry_day"),
+        (4, "keyset pagination index for mood entries", "_migration_004_keyset_index"),
+        (5, "import keys for idempotent imports", "_migration_005_import_key"),
+        (6, "full-text search index over entry content", "_migration_006_fts"),
+        (7, "per-user data versions", "_migration_007_data_versions"),
+        (8, "change sequence and tombstones for delta sync", "_migration_008_sync"),
+        (9, "trigger-maintained mood summaries", "_migration_009_mood_summary"),
+        (10, "persisted streak state", "_migration_010_streaks"),
+        (11, "trigger-maintained daily mood rollups", "_migration_011_daily_rollups"),
+        (12, "created_at in the per-day covering index", "_migration_012_day_index"),
+        (13, "one data version bump per entry write", "_migration_013_single_bump"),
+        (14, "incremental daily rollups on insert", "_migration_014_rollup_insert"),
+        (15, "per-user owner token in the search index", "_migration_015_fts_owner"),
+    )
+
+    # Rows read and rewritten per step of a data backfill.
+    BACKFILL_CHUNK_SIZE = 1000
+
+    @classmethod
+    def schema_version(cls) -> int:
+        """Return the version a fully migrated database reports."""
+        return cls.MIGRATIONS[-1][0] if cls.MIGRATIONS else 0
 
     def init_database(self) -> None:
-        """Initialize the database with required tables and seed data."""
+        """Bring the database schema up to date.
+
+        Booting against an up-to-date database costs a single PRAGMA read;
+        otherwise pending migrations run once under an exclusive lock.
+        """
         try:
-            logger.info("Initializing database at: %s", self.db_path)
-            with sqlite3.connect(self.db_path) as conn:
-                logger.info("Database connection successful. Creating tables...")
-
-                # Core tables
-                self._create_users_table(conn)
-                self._create_mood_entries_table(conn)
-                self._create_groups_table(conn)
-                self._create_group_options_table(conn)
-                self._create_entry_selections_table(conn)
-                self._create_achievements_table(conn)
-
-                # Goals and metrics
-                self._create_goals_table(conn)
-                self._create_goal_completions_table(conn)
-                self._create_user_metrics_table(conn)
-
-                # Shared indexes
-                self._create_database_indexes(conn)
-
-                conn.commit()
-                logger.info("Database initialization complete")
-
-            self._insert_default_groups()
+            with self._connect() as conn:
+                version = conn.execute("PRAGMA user_version").fetchone()[0]
+            target = self.schema_version()
+            if version >= target:
+                if version > target:
+                    logger.warning(
+                        "Database schema version %s is newer than this code (%s)",
+                        version,
+                        target,
+                    )
+                logger.info(
+                    "Database at %s is up to date (schema v%s, performance profile: %s)",
+                    self.db_path,
+                    version,
+                    getattr(self, "performance_profile", "default"),
+                )
+                return
+            self._run_migrations()
         except Exception as exc:  # pragma: no cover - initialization rarely fails
             logger.error("Database initialization failed: %s", exc)
             raise
 
+    def _run_migrations(self) -> None:
+        logger.info(
+            "Migrating database at %s (performance profile: %s)",
+            self.db_path,
+            getattr(self, "performance_profile", "default"),
+        )
+        with self._connect() as conn:
+            # Re-read the version under the lock: another worker may have
+            # finished the upgrade while we were waiting for it.
+            conn.execute("BEGIN EXCLUSIVE")
+            version = conn.execute("PRAGMA user_version").fetchone()[0]
+            for number, description, method_name in self.MIGRATIONS:
+                if number <= version:
+                    continue
+                getattr(self, method_name)(conn)
+                conn.execute(f"PRAGMA user_version = {int(number)}")
+                logger.info("Applied migration %03d: %s", number, description)
+                version = number
+            conn.commit()
+        journal_mode = self._journal_mode()
+        logger.info(
+            "Database schema at version %s (journal_mode: %s)", version, journal_mode
+        )
+
+    def _journal_mode(self) -> str:
+        with self._connect() as conn:
+            return str(conn.execute("PRAGMA journal_mode").fetchone()[0])
+
+    # --- Migrations -------------------------------------------------------------
+    def _migration_001_baseline(self, conn: sqlite3.Connection) -> None:
+        # Core tables
+        self._create_users_table(conn)
+        self._create_mood_entries_table(conn)
+        self._create_groups_table(conn)
+        self._create_group_options_table(conn)
+        self._create_entry_selections_table(conn)
+        self._create_achievements_table(conn)
+
+        # Goals and metrics
+        self._create_goals_table(conn)
+        self._create_goal_completions_table(conn)
+        self._create_user_metrics_table(conn)
+
+        # Shared indexes
+        self._create_database_indexes(conn)
+
+        self._insert_default_groups(conn)
+
+    def _migration_002_indexes(self, conn: sqlite3.Connection) -> None:
+        # Every hot query filters on user_id first; the global indexes below
+        # are superseded by per-user ones (or by UNIQUE autoindexes).
+        for index in (
+            "idx_mood_entries_date",
+            "idx_goals_user",
+            "idx_goal_completions_user_goal",
+            "idx_goal_completions_date",
+        ):
+            conn.execute(f"DROP INDEX IF EXISTS {index}")
+
+        statements = (
+            # Listings ordered by creation time (rowid breaks ties)
+            "CREATE INDEX IF NOT EXISTS idx_mood_entries_user_created "
+            "ON mood_entries(user_id, created_at DESC)",
+            # Date ranges, distinct dates and the statistics aggregates are
+            # answered from this index alone
+            "CREATE INDEX IF NOT EXISTS idx_mood_entries_user_date "
+            "ON mood_entries(user_id, date, mood)",
+            # Per-entry selection lookups and ON DELETE CASCADE from both parents
+            "CREATE INDEX IF NOT EXISTS idx_entry_selections_entry "
+            "ON entry_selections(entry_id, option_id)",
+            "CREATE INDEX IF NOT EXISTS idx_entry_selections_option "
+            "ON entry_selections(option_id)",
+            "CREATE INDEX IF NOT EXISTS idx_group_options_group "
+            "ON group_options(group_id, name)",
+            "CREATE INDEX IF NOT EXISTS idx_achievements_user_earned "
+            "ON achievements(user_id, earned_at DESC)",
+            "CREATE INDEX IF NOT EXISTS idx_goals_user_created "
+            "ON goals(user_id, created_at DESC)",
+            "CREATE INDEX IF NOT EXISTS idx_goal_completions_goal "
+            "ON goal_completions(goal_id)",
+        )
+        for statement in statements:
+            conn.execute(statement)
+
+    def _migration_003_entry_day(self, conn: sqlite3.Connection) -> None:
+        # ``date`` stays the display string; ``entry_day`` is its day number
+        # (``date.toordinal()``), NULL when the string cannot be parsed.
+        columns = {row[1] for row in conn.execute("PRAGMA table_info(mood_entries)")}
+        if "entry_day" not in columns:
+            conn.execute("ALTER TABLE mood_entries ADD COLUMN entry_day INTEGER")
+
+        # Backfill in id order, a bounded chunk at a time, so large tables
+        # never need to be held in memory at once.
+        last_id = 0
+        backfilled = 0
+        while True:
+            rows = conn.execute(
+                "SELECT id, date FROM mood_entries WHERE id > ? ORDER BY id LIMIT ?",
+                (last_id, self.BACKFILL_CHUNK_SIZE),
+            ).fetchall()
+            if not rows:
+                break
+            conn.executemany(
+                "UPDATE mood_entries SET entry_day = ? WHERE id = ?",
+                [
+                    (parse_entry_day(value, strict=False), row_id)
+                    for row_id, value in rows
+                ],
+            )
+            last_id = rows[-1][0]
+            backfilled += len(rows)
+        if backfilled:
+            logger.info("Backfilled entry_day for %s mood entries", backfilled)
+
+        conn.execute("DROP INDEX IF EXISTS idx_mood_entries_user_date")
+        # Date ranges, distinct days and the statistics aggregates are
+        # answered from this index alone
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_mood_entries_user_day "
+            "ON mood_entries(user_id, entry_day, mood)"
+        )
+
+    def _migration_004_keyset_index(self, conn: sqlite3.Connection) -> None:
+        # An ascending (user_id, created_at) index walked backwards yields
+        # (created_at, rowid) descending, which is exactly the page order;
+        # the DESC variant left the id tie-break to a temp b-tree.
+        conn.execute("DROP INDEX IF EXISTS idx_mood_entries_user_created")
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_mood_entries_user_created_id "
+            "ON mood_entries(user_id, created_at)"
+        )
+
+    def _migration_005_import_key(self, conn: sqlite3.Connection) -> None:
+        # Imported rows carry a stable key derived from the source row so
+        # re-importing a file skips what is already there.
+        columns = {row[1] for row in conn.execute("PRAGMA table_info(mood_entries)")}
+        if "import_key" not in columns:
+            conn.execute("ALTER TABLE mood_entries ADD COLUMN import_key TEXT")
+        conn.execute(
+            "CREATE UNIQUE INDEX IF NOT EXISTS idx_mood_entries_user_import_key "
+            "ON mood_entries(user_id, import_key) WHERE import_key IS NOT NULL"
+        )
+
+    def _migration_006_fts(self, conn: sqlite3.Connection) -> None:
+        # External-content FTS5 table: the text lives only in mood_entries and
+        # triggers keep the index in step with every write path. Prefix
+        # indexes keep search-as-you-type queries off the slow expansion path.
+        conn.execute("SAVEPOINT fts_probe")
+        try:
+            conn.execute(
+                """
+                CREATE VIRTUAL TABLE IF NOT EXISTS mood_entries_fts USING fts5(
+                    content,
+                    content='mood_entries',
+                    content_rowid='id',
+                    tokenize='unicode61 remove_diacritics 2',
+                    prefix='2 3 4'
+                )
+                """
+            )
+        except sqlite3.OperationalError as exc:
+            conn.execute("ROLLBACK TO fts_probe")
+            conn.execute("RELEASE fts_probe")
+            logger.warning("FTS5 unavailable, search will use LIKE scans: %s", exc)
+            return
+        conn.execute("RELEASE fts_probe")
+
+        statements = (
+            """
+            CREATE TRIGGER IF NOT EXISTS mood_entries_fts_ai
+            AFTER INSERT ON mood_entries BEGIN
+                INSERT INTO mood_entries_fts(rowid, content)
+                VALUES (new.id, new.content);
+            END
+            """,
+            """
+            CREATE TRIGGER IF NOT EXISTS mood_entries_fts_ad
+            AFTER DELETE ON mood_entries BEGIN
+                INSERT INTO mood_entries_fts(mood_entries_fts, rowid, content)
+                VALUES ('delete', old.id, old.content);
+            END
+            """,
+            """
+            CREATE TRIGGER IF NOT EXISTS mood_entries_fts_au
+            AFTER UPDATE OF content ON mood_entries BEGIN
+                INSERT INTO mood_entries_fts(mood_entries_fts, rowid, content)
+                VALUES ('delete', old.id, old.content);
+                INSERT INTO mood_entries_fts(rowid, content)
+                VALUES (new.id, new.content);
+            END
+            """,
+        )
+        for statement in statements:
+            conn.execute(statement)
+        # Index entries written before this migration
+        conn.execute(
+            "INSERT INTO mood_entries_fts(mood_entries_fts) VALUES ('rebuild')"
+        )
+
+    # Tables whose rows belong to a user directly; any write to them bumps
+    # that user's data version.
+    VERSIONED_TABLES = ("mood_entries", "goals", "goal_completions", "achievements")
+
+    def _migration_007_data_versions(self, conn: sqlite3.Connection) -> None:
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS user_data_versions (
+                user_id INTEGER PRIMARY KEY,
+                version INTEGER NOT NULL DEFAULT 0,
+                FOREIGN KEY (user_id) REFERENCES users (id) ON DELETE CASCADE
+            )
+            """
+        )
+        bump = "ON CONFLICT(user_id) DO UPDATE SET version = version + 1;"
+        for table in self.VERSIONED_TABLES:
+            for suffix, event, row in (
+                ("ai", "INSERT", "new"),
+                ("au", "UPDATE", "new"),
+                ("ad", "DELETE", "old"),
+            ):
+                conn.execute(
+                    f"""
+                    CREATE TRIGGER IF NOT EXISTS {table}_version_{suffix}
+                    AFTER {event} ON {table} BEGIN
+                        INSERT INTO user_data_versions (user_id, version)
+                        VALUES ({row}.user_id, 1) {bump}
+                    END
+                    """
+                )
+        # Selections reach their user through the entry. When the entry
+        # itself is being deleted the lookup finds nothing, which is fine:
+        # the entry's own trigger has bumped the version already.
+        for suffix, event, row in (("ai", "INSERT", "new"), ("ad", "DELETE", "old")):
+            conn.execute(
+                f"""
+                CREATE TRIGGER IF NOT EXISTS entry_selections_version_{suffix}
+                AFTER {event} ON entry_selections BEGIN
+                    INSERT INTO user_data_versions (user_id, version)
+                    SELECT user_id, 1 FROM mood_entries WHERE id = {row}.entry_id
+                    {bump}
+                END
+                """
+            )
+
+    def _migration_008_sync(self, conn: sqlite3.Connection) -> None:
+        # Every entry write stamps the row with the user's freshly bumped
+        # data version, so change_seq orders a user's changes strictly and
+        # is never reused; deletes leave a tombstone stamped the same way.
+        # Existing rows keep 0, which only a full sync (no token) returns.
+        columns = {row[1] for row in conn.execute("PRAGMA table_info(mood_entries)")}
+        if "change_seq" not in columns:
+            conn.execute(
+                "ALTER TABLE mood_entries "
+                "ADD COLUMN change_seq INTEGER NOT NULL DEFAULT 0"
+            )
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS mood_entry_tombstones (
+                entry_id INTEGER PRIMARY KEY,
+                user_id INTEGER NOT NULL,
+                change_seq INTEGER NOT NULL,
+                deleted_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                FOREIGN KEY (user_id) REFERENCES users (id) ON DELETE CASCADE
+            )
+            """
+        )
+        for statement in (
+            "CREATE INDEX IF NOT EXISTS idx_mood_entries_user_change "
+            "ON mood_entries(user_id, change_seq)",
+            "CREATE INDEX IF NOT EXISTS idx_mood_entry_tombstones_user_change "
+            "ON mood_entry_tombstones(user_id, change_seq)",
+        ):
+            conn.execute(statement)
+
+        bump = """
+            INSERT INTO user_data_versions (user_id, version) VALUES ({user}, 1)
+            ON CONFLICT(user_id) DO UPDATE SET version = version + 1;
+        """
+        current = "(SELECT version FROM user_data_versions WHERE user_id = {user})"
+        stamp = f"""
+            UPDATE mood_entries SET change_seq = {current}
+             WHERE id = {{entry}};
+        """
+        statements = (
+            f"""
+            CREATE TRIGGER IF NOT EXISTS mood_entries_change_ai
+            AFTER INSERT ON mood_entries BEGIN
+                {bump.format(user="new.user_id")}
+                {stamp.format(user="new.user_id", entry="new.id")}
+            END
+            """,
+            # The stamp itself is an UPDATE; the WHEN clause skips it.
+            f"""
+            CREATE TRIGGER IF NOT EXISTS mood_entries_change_au
+            AFTER UPDATE ON mood_entries
+            WHEN new.change_seq = old.change_seq BEGIN
+                {bump.format(user="new.user_id")}
+                {stamp.format(user="new.user_id", entry="new.id")}
+            END
+            """,
+            f"""
+            CREATE TRIGGER IF NOT EXISTS mood_entries_change_ad
+            AFTER DELETE ON mood_entries BEGIN
+                {bump.format(user="old.user_id")}
+                INSERT OR REPLACE INTO mood_entry_tombstones
+                    (entry_id, user_id, change_seq)
+                VALUES (old.id, old.user_id, {current.format(user="old.user_id")});
+            END
+            """,
+        )
+        # Changing an entry's selections counts as changing the entry.
+        for suffix, event, row in (("ai", "INSERT", "new"), ("ad", "DELETE", "old")):
+            owner = f"(SELECT user_id FROM mood_entries WHERE id = {row}.entry_id)"
+            statements += (
+                f"""
+                CREATE TRIGGER IF NOT EXISTS entry_selections_change_{suffix}
+                AFTER {event} ON entry_selections
+                WHEN {owner} IS NOT NULL BEGIN
+                    {bump.format(user=owner)}
+                    {stamp.format(user=owner, entry=f"{row}.entry_id")}
+                END
+                """,
+            )
+        for statement in statements:
+            conn.execute(statement)
+
+    def _migration_009_mood_summary(self, conn: sqlite3.Connection) -> None:
+        # Per-mood counts are the source of truth; the summary row (count,
+        # sum, min, max, first and last date) is recomputed from them after
+        # each entry write, so deletes never need a scan to find a new min.
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS user_mood_counts (
+                user_id INTEGER NOT NULL,
+                mood INTEGER NOT NULL,
+                entries INTEGER NOT NULL DEFAULT 0,
+                PRIMARY KEY (user_id, mood),
+                FOREIGN KEY (user_id) REFERENCES users (id) ON DELETE CASCADE
+            ) WITHOUT ROWID
+            """
+        )
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS user_mood_summary (
+                user_id INTEGER PRIMARY KEY,
+                entry_count INTEGER NOT NULL DEFAULT 0,
+                mood_sum INTEGER NOT NULL DEFAULT 0,
+                mood_min INTEGER,
+                mood_max INTEGER,
+                first_entry_date TEXT,
+                last_entry_date TEXT,
+                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                FOREIGN KEY (user_id) REFERENCES users (id) ON DELETE CASCADE
+            )
+            """
+        )
+
+        increment = """
+            INSERT INTO user_mood_counts (user_id, mood, entries)
+            VALUES (new.user_id, new.mood, 1)
+            ON CONFLICT(user_id, mood) DO UPDATE SET entries = entries + 1;
+        """
+        decrement = """
+            UPDATE user_mood_counts SET entries = entries - 1
+             WHERE user_id = old.user_id AND mood = old.mood;
+            DELETE FROM user_mood_counts
+             WHERE user_id = old.user_id AND mood = old.mood AND entries <= 0;
+        """
+        # Frozen copy of SQLQueries.REFRESH_MOOD_SUMMARY as released with
+        # this step; ``{user}`` is a row reference or ``:user_id``.
+        refresh = """
+            INSERT INTO user_mood_summary (
+                user_id, entry_count, mood_sum, mood_min, mood_max,
+                first_entry_date, last_entry_date
+            )
+            SELECT {user}, COALESCE(SUM(entries), 0),
+                   COALESCE(SUM(mood * entries), 0), MIN(mood), MAX(mood),
+                   (SELECT date FROM mood_entries
+                     WHERE user_id = {user} AND entry_day IS NOT NULL
+                     ORDER BY entry_day ASC LIMIT 1),
+                   (SELECT date FROM mood_entries
+                     WHERE user_id = {user} AND entry_day IS NOT NULL
+                     ORDER BY entry_day DESC LIMIT 1)
+              FROM user_mood_counts
+             WHERE user_id = {user}
+            ON CONFLICT(user_id) DO UPDATE SET
+                entry_count = excluded.entry_count,
+                mood_sum = excluded.mood_sum,
+                mood_min = excluded.mood_min,
+                mood_max = excluded.mood_max,
+                first_entry_date = excluded.first_entry_date,
+                last_entry_date = excluded.last_entry_date,
+                updated_at = CURRENT_TIMESTAMP;
+        """
+        statements = (
+            f"""
+            CREATE TRIGGER IF NOT EXISTS mood_entries_summary_ai
+            AFTER INSERT ON mood_entries BEGIN
+                {increment}
+                {refresh.format(user="new.user_id")}
+            END
+            """,
+            f"""
+            CREATE TRIGGER IF NOT EXISTS mood_entries_summary_ad
+            AFTER DELETE ON mood_entries BEGIN
+                {decrement}
+                {refresh.format(user="old.user_id")}
+            END
+            """,
+            f"""
+            CREATE TRIGGER IF NOT EXISTS mood_entries_summary_au
+            AFTER UPDATE OF user_id, mood, date, entry_day ON mood_entries BEGIN
+                {decrement}
+                {increment}
+                {refresh.format(user="old.user_id")}
+                {refresh.format(user="new.user_id")}
+            END
+            """,
+        )
+        for statement in statements:
+            conn.execute(statement)
+
+        # Summarise entries written before this migration
+        counts = conn.execute(
+            "SELECT user_id, mood, COUNT(*) FROM mood_entries GROUP BY user_id, mood"
+        ).fetchall()
+        conn.executemany(
+            "INSERT OR REPLACE INTO user_mood_counts (user_id, mood, entries) "
+            "VALUES (?, ?, ?)",
+            counts,
+        )
+        conn.executemany(
+            refresh.format(user=":user_id"),
+            [{"user_id": user_id} for user_id in sorted({row[0] for row in counts})],
+        )
+
+    def _migration_010_streaks(self, conn: sqlite3.Connection) -> None:
+        # Maintained by the mood write paths (see StreakMixin) rather than by
+        # triggers, since recomputing a run needs an ordered walk.
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS user_streaks (
+                user_id INTEGER PRIMARY KEY,
+                last_entry_day INTEGER,
+                current_run INTEGER NOT NULL DEFAULT 0,
+                longest_run INTEGER NOT NULL DEFAULT 0,
+                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                FOREIGN KEY (user_id) REFERENCES users (id) ON DELETE CASCADE
+            )
+            """
+        )
+        # Frozen copies of SQLQueries.COMPUTE_STREAK_STATE and
+        # UPSERT_STREAK_STATE as released with this step.
+        compute = """
+            WITH runs AS (
+                SELECT MAX(entry_day) AS end_day, COUNT(*) AS length
+                  FROM (
+                        SELECT entry_day,
+                               entry_day - ROW_NUMBER() OVER (
+                                   ORDER BY entry_day
+                               ) AS island
+                          FROM (
+                                SELECT DISTINCT entry_day FROM mood_entries
+                                 WHERE user_id = ? AND entry_day IS NOT NULL
+                               )
+                       )
+                 GROUP BY island
+            )
+            SELECT end_day, length, (SELECT MAX(length) FROM runs)
+              FROM runs
+             ORDER BY end_day DESC
+             LIMIT 1
+        """
+        upsert = """
+            INSERT INTO user_streaks
+                (user_id, last_entry_day, current_run, longest_run)
+            VALUES (?, ?, ?, ?)
+            ON CONFLICT(user_id) DO UPDATE SET
+                last_entry_day = excluded.last_entry_day,
+                current_run = excluded.current_run,
+                longest_run = excluded.longest_run,
+                updated_at = CURRENT_TIMESTAMP
+        """
+        user_ids = [
+            row[0]
+            for row in conn.execute("SELECT DISTINCT user_id FROM mood_entries")
+        ]
+        for user_id in user_ids:
+            row = conn.execute(compute, (user_id,)).fetchone()
+            conn.execute(upsert, (user_id, *(row if row else (None, 0, 0))))
+
+    def _migration_011_daily_rollups(self, conn: sqlite3.Connection) -> None:
+        # One row per user and day with entries: count, sum, min and max of
+        # the moods, so range statistics cost O(days in range).
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS user_daily_moods (
+                user_id INTEGER NOT NULL,
+                day INTEGER NOT NULL,
+                entries INTEGER NOT NULL,
+                mood_sum INTEGER NOT NULL,
+                mood_min INTEGER NOT NULL,
+                mood_max INTEGER NOT NULL,
+                PRIMARY KEY (user_id, day),
+                FOREIGN KEY (user_id) REFERENCES users (id) ON DELETE CASCADE
+            ) WITHOUT ROWID
+            """
+        )
+        # Frozen copy of SQLQueries.REFRESH_DAILY_ROLLUP as released with
+        # this step; ``{user}`` and ``{day}`` are trigger row references.
+        refresh = """
+            INSERT INTO user_daily_moods
+                (user_id, day, entries, mood_sum, mood_min, mood_max)
+            SELECT {user}, entry_day, COUNT(*), SUM(mood), MIN(mood), MAX(mood)
+              FROM mood_entries
+             WHERE user_id = {user} AND entry_day = {day}
+             GROUP BY entry_day
+            ON CONFLICT(user_id, day) DO UPDATE SET
+                entries = excluded.entries,
+                mood_sum = excluded.mood_sum,
+                mood_min = excluded.mood_min,
+                mood_max = excluded.mood_max;
+            DELETE FROM user_daily_moods
+             WHERE user_id = {user} AND day = {day}
+               AND NOT EXISTS (
+                   SELECT 1 FROM mood_entries
+                    WHERE user_id = {user} AND entry_day = {day}
+               );
+        """
+        statements = (
+            f"""
+            CREATE TRIGGER IF NOT EXISTS mood_entries_rollup_ai
+            AFTER INSERT ON mood_entries
+            WHEN new.entry_day IS NOT NULL BEGIN
+                {refresh.format(user="new.user_id", day="new.entry_day")}
+            END
+            """,
+            f"""
+            CREATE TRIGGER IF NOT EXISTS mood_entries_rollup_ad
+            AFTER DELETE ON mood_entries
+            WHEN old.entry_day IS NOT NULL BEGIN
+                {refresh.format(user="old.user_id", day="old.entry_day")}
+            END
+            """,
+            f"""
+            CREATE TRIGGER IF NOT EXISTS mood_entries_rollup_au
+            AFTER UPDATE OF user_id, mood, entry_day ON mood_entries BEGIN
+                {refresh.format(user="old.user_id", day="old.entry_day")}
+                {refresh.format(user="new.user_id", day="new.entry_day")}
+            END
+            """,
+        )
+        for statement in statements:
+            conn.execute(statement)
+
+        # Roll up entries written before this migration
+        conn.execute(
+            """
+            INSERT OR REPLACE INTO user_daily_moods
+                (user_id, day, entries, mood_sum, mood_min, mood_max)
+            SELECT user_id, entry_day, COUNT(*), SUM(mood), MIN(mood), MAX(mood)
+              FROM mood_entries
+             WHERE entry_day IS NOT NULL
+             GROUP BY user_id, entry_day
+            """
+        )
+
+    def _migration_012_day_index(self, conn: sqlite3.Connection) -> None:
+        # Carrying created_at lets the weekday x hour patterns read the
+        # index alone; every query served by the old prefix still is.
+        conn.execute("DROP INDEX IF EXISTS idx_mood_entries_user_day")
+        conn.execute(
+            "CREATE INDEX idx_mood_entries_user_day "
+            "ON mood_entries(user_id, entry_day, mood, created_at)"
+        )
+
+    def _migration_013_single_bump(self, conn: sqlite3.Connection) -> None:
+        # The change triggers from migration 8 bump the version themselves;
+        # the older entry and selection triggers bumped it again, and the
+        # change_seq stamp (an UPDATE) re-fired mood_entries_version_au.
+        for trigger in (
+            "mood_entries_version_ai",
+            "mood_entries_version_au",
+            "mood_entries_version_ad",
+            "entry_selections_version_ai",
+            "entry_selections_version_ad",
+        ):
+            conn.execute(f"DROP TRIGGER IF EXISTS {trigger}")
+
+    def _migration_014_rollup_insert(self, conn: sqlite3.Connection) -> None:
+        # Re-aggregating the whole day on every insert made bulk writes of
+        # same-day rows quadratic. An insert only adds to the day, so fold
+        # the new row in; updates and deletes still recompute the day.
+        conn.execute("DROP TRIGGER IF EXISTS mood_entries_rollup_ai")
+        conn.execute(
+            """
+            CREATE TRIGGER mood_entries_rollup_ai
+            AFTER INSERT ON mood_entries
+            WHEN new.entry_day IS NOT NULL BEGIN
+                INSERT INTO user_daily_moods
+                    (user_id, day, entries, mood_sum, mood_min, mood_max)
+                VALUES (new.user_id, new.entry_day, 1, new.mood, new.mood, new.mood)
+                ON CONFLICT(user_id, day) DO UPDATE SET
+                    entries = entries + 1,
+                    mood_sum = mood_sum + excluded.mood_sum,
+                    mood_min = MIN(mood_min, excluded.mood_min),
+                    mood_max = MAX(mood_max, excluded.mood_max);
+            END
+            """
+        )
+
+    def _migration_015_fts_owner(self, conn: sqlite3.Connection) -> None:
+        # One index serves every user, so a MATCH used to find and rank all
+        # users' hits before the user_id filter. Each row now also carries an
+        # "owner" token (u<user_id>) that searches match on, read through a
+        # view since the external content must supply every indexed column.
+        # Prefix indexes now reach eight characters, since expanding a
+        # longer prefix than the index covers costs a full doclist merge.
+        exists = conn.execute(
+            "SELECT 1 FROM sqlite_master "
+            "WHERE type = 'table' AND name = 'mood_entries_fts'"
+        ).fetchone()
+        if exists is None:  # FTS5 unavailable when migration 6 ran
+            return
+        for trigger in ("ai", "ad", "au"):
+            conn.execute(f"DROP TRIGGER IF EXISTS mood_entries_fts_{trigger}")
+        conn.execute("DROP TABLE mood_entries_fts")
+        statements = (
+            """
+            CREATE VIEW IF NOT EXISTS mood_entries_search AS
+            SELECT id, content, 'u' || user_id AS owner FROM mood_entries
+            """,
+            """
+            CREATE VIRTUAL TABLE mood_entries_fts USING fts5(
+                content,
+                owner,
+                content='mood_entries_search',
+                content_rowid='id',
+                tokenize='unicode61 remove_diacritics 2',
+                prefix='2 3 4 5 6 7 8'
+            )
+            """,
+            """
+            CREATE TRIGGER mood_entries_fts_ai
+            AFTER INSERT ON mood_entries BEGIN
+                INSERT INTO mood_entries_fts(rowid, content, owner)
+                VALUES (new.id, new.content, 'u' || new.user_id);
+            END
+            """,
+            """
+            CREATE TRIGGER mood_entries_fts_ad
+            AFTER DELETE ON mood_entries BEGIN
+                INSERT INTO mood_entries_fts(mood_entries_fts, rowid, content, owner)
+                VALUES ('delete', old.id, old.content, 'u' || old.user_id);
+            END
+            """,
+            """
+            CREATE TRIGGER mood_entries_fts_au
+            AFTER UPDATE OF content, user_id ON mood_entries BEGIN
+                INSERT INTO mood_entries_fts(mood_entries_fts, rowid, content, owner)
+                VALUES ('delete', old.id, old.content, 'u' || old.user_id);
+                INSERT INTO mood_entries_fts(rowid, content, owner)
+                VALUES (new.id, new.content, 'u' || new.user_id);
+            END
+            """,
+            "INSERT INTO mood_entries_fts(mood_entries_fts) VALUES ('rebuild')",
+        )
+        for statement in statements:
+            conn.execute(statement)
+
     # --- Table creation helpers -------------------------------------------------
     def _create_users_table(self, conn: sqlite3.Connection) -> None:
         conn.execute(
@@ -60,7 +770,7 @@ class DatabaseSchemaMixin(DatabaseConnectionMixin):
             )
             """
         )
-        logger.info("Users table ready")
+        logger.debug("Users table ready")
 
     def _create_mood_entries_table(self, conn: sqlite3.Connection) -> None:
         conn.execute(
@@ -77,7 +787,7 @@ class DatabaseSchemaMixin(DatabaseConnectionMixin):
             )
             """
         )
-        logger.info("Mood entries table ready")
+        logger.debug("Mood entries table ready")
 
     def _create_groups_table(self, conn: sqlite3.Connection) -> None:
         conn.execute(
@@ -89,7 +799,7 @@ class DatabaseSchemaMixin(DatabaseConnectionMixin):
             )
             """
         )
-        logger.info("Groups table ready")
+        logger.debug("Groups table ready")
 
     def _create_group_options_table(self, conn: sqlite3.Connection) -> None:
         conn.execute(
@@ -103,7 +813,7 @@ class DatabaseSchemaMixin(DatabaseConnectionMixin):
             )
             """
         )
-        logger.info("Group options table ready")
+        logger.debug("Group options table ready")
 
     def _create_entry_selections_table(self, conn: sqlite3.Connection) -> None:
         conn.execute(
@@ -118,7 +828,7 @@ class DatabaseSchemaMixin(DatabaseConnectionMixin):
             )
             """
         )
-        logger.info("Entry selections table ready")
+        logger.debug("Entry selections table ready")
 
     def _create_achievements_table(self, conn: sqlite3.Connection) -> None:
         conn.execute(
@@ -136,7 +846,7 @@ class DatabaseSchemaMixin(DatabaseConnectionMixin):
             )
             """
         )
-        logger.info("Achievements table ready")
+        logger.debug("Achievements table ready")
 
     def _create_goals_table(self, conn: sqlite3.Connection) -> None:
         try:
@@ -160,7 +870,7 @@ class DatabaseSchemaMixin(DatabaseConnectionMixin):
             )
             self._migrate_goals_table_schema(conn)
             conn.execute("CREATE INDEX IF NOT EXISTS idx_goals_user ON goals(user_id)")
-            logger.info("Goals table ready")
+            logger.debug("Goals table ready")
         except sqlite3.Error as exc:
             logger.warning("Goals table creation failed (non-critical): %s", exc)
 
@@ -170,7 +880,7 @@ class DatabaseSchemaMixin(DatabaseConnectionMixin):
             cols: Iterable[str] = {row[1] for row in cur.fetchall()}
             if "last_completed_date" not in cols:
                 conn.execute("ALTER TABLE goals ADD COLUMN last_completed_date TEXT")
-                logger.info("Goals table migrated to include last_completed_date")
+                logger.debug("Goals table migrated to include last_completed_date")
         except sqlite3.Error as exc:
             logger.warning("Goals table migration failed (non-critical): %s", exc)
 
@@ -196,7 +906,7 @@ class DatabaseSchemaMixin(DatabaseConnectionMixin):
             conn.execute(
                 "CREATE INDEX IF NOT EXISTS idx_goal_completions_date ON goal_completions(date)"
             )
-            logger.info("Goal completions table ready")
+            logger.debug("Goal completions table ready")
         except sqlite3.Error as exc:
             logger.warning(
                 "Goal completions table creation failed (non-critical): %s", exc
@@ -214,7 +924,7 @@ class DatabaseSchemaMixin(DatabaseConnectionMixin):
                 )
                 """
             )
-            logger.info("User metrics table ready")
+            logger.debug("User metrics table ready")
         except sqlite3.Error as exc:
             logger.warning("User metrics table creation failed (non-critical): %s", exc)
 
@@ -223,12 +933,12 @@ class DatabaseSchemaMixin(DatabaseConnectionMixin):
             conn.execute(
                 "CREATE INDEX IF NOT EXISTS idx_mood_entries_date ON mood_entries(date)"
             )
-            logger.info("Mood entries index ready")
+            logger.debug("Mood entries index ready")
         except sqlite3.Error as exc:
             logger.warning("Index creation failed (non-critical): %s", exc)
 
     # --- Seed helpers -----------------------------------------------------------
-    def _insert_default_groups(self) -> None:
+    def _insert_default_groups(self, conn: sqlite3.Connection) -> None:
         default_groups = {
             "Emotions": [
                 "happy",
@@ -265,28 +975,26 @@ class DatabaseSchemaMixin(DatabaseConnectionMixin):
             ],
         }
 
-        with self._connect() as conn:
-            for group_name, options in default_groups.items():
+        for group_name, options in default_groups.items():
+            cursor = conn.execute(
+                "SELECT id FROM groups WHERE name = ?",
+                (group_name,),
+            )
+            group_row = cursor.fetchone()
+
+            if not group_row:
                 cursor = conn.execute(
-                    "SELECT id FROM groups WHERE name = ?",
+                    "INSERT INTO groups (name) VALUES (?)",
                     (group_name,),
                 )
-                group_row = cursor.fetchone()
-
-                if not group_row:
-                    cursor = conn.execute(
-                        "INSERT INTO groups (name) VALUES (?)",
-                        (group_name,),
+                group_id = cursor.lastrowid
+                for option in options:
+                    conn.execute(
+                        "INSERT INTO group_options (group_id, name) VALUES (?, ?)",
+                        (group_id, option),
                     )
-                    group_id = cursor.lastrowid
-                    for option in options:
-                        conn.execute(
-                            "INSERT INTO group_options (group_id, name) VALUES (?, ?)",
-                            (group_id, option),
-                        )
 
-            conn.commit()
-            logger.info("Default groups ensured")
+        logger.debug("Default groups ensured")
 
 
 __all__ = ["DatabaseSchemaMixin"]
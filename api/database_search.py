@@ -0,0 +1,252 @@
+"""Full-text search over mood entry content."""
+
+from __future__ import annotations
+
+import html
+import json
+import re
+import sqlite3
+from typing import Dict, List, Optional, Sequence, Tuple
+
+try:  # pragma: no cover - allow top-level script usage
+    from .database_common import DatabaseConnectionMixin, parse_entry_day
+except ImportError:  # pragma: no cover
+    from database_common import DatabaseConnectionMixin, parse_entry_day  # type: ignore
+
+_TERM = re.compile(r"\w+", re.UNICODE)
+
+# Tokens of context on either side of a hit in a snippet.
+SNIPPET_TOKENS = 12
+HIGHLIGHT_OPEN = "<mark>"
+HIGHLIGHT_CLOSE = "</mark>"
+# Control characters FTS5 wraps around hits in place of the markup, so the
+# entry text can be HTML-escaped before the real tags are put in.
+_HIT_OPEN = "\x02"
+_HIT_CLOSE = "\x03"
+
+# Only the newest matches are ranked, which bounds the BM25 work for terms
+# that occur in most entries; older matches follow them, newest first.
+RANK_CANDIDATES = 500
+
+
+def build_match_query(text: str) -> str:
+    """Turn free text into a safe FTS5 MATCH expression.
+
+    Every term is quoted, so FTS5 operators and column filters typed by the
+    user are treated as plain words, and the last term matches as a prefix
+    to support search-as-you-type. Raises ``ValueError`` when nothing
+    searchable remains.
+    """
+    terms = _TERM.findall(text or "")
+    if not terms:
+        raise ValueError("Search query must contain at least one word")
+    quoted = [f'"{term}"' for term in terms]
+    quoted[-1] += "*"
+    return " ".join(quoted)
+
+
+def render_snippet(raw: str) -> str:
+    """HTML-escape snippet text and turn the hit sentinels into markup."""
+    text = html.escape(raw or "")
+    return text.replace(_HIT_OPEN, HIGHLIGHT_OPEN).replace(
+        _HIT_CLOSE, HIGHLIGHT_CLOSE
+    )
+
+
+class SearchMixin(DatabaseConnectionMixin):
+    """BM25-ranked search backed by the ``mood_entries_fts`` FTS5 table."""
+
+    _fts_available: Optional[bool] = None
+
+    def has_full_text_search(self) -> bool:
+        if self._fts_available is None:
+            with self._connect() as conn:
+                row = conn.execute(
+                    "SELECT 1 FROM sqlite_master "
+                    "WHERE type = 'table' AND name = 'mood_entries_fts'"
+                ).fetchone()
+            self._fts_available = row is not None
+        return self._fts_available
+
+    def search_mood_entries(
+        self,
+        user_id: int,
+        text: str,
+        limit: int = 20,
+        offset: int = 0,
+        moods: Optional[Sequence[int]] = None,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+    ) -> Tuple[List[Dict], bool]:
+        """Return one page of ranked hits and whether more hits follow.
+
+        Hits carry the entry fields plus an HTML-escaped ``snippet`` with
+        hits wrapped in ``<mark>`` and the BM25 ``score`` (lower is better).
+        The newest ``RANK_CANDIDATES`` matches come first, best score first;
+        any older matches follow newest first with a ``score`` of ``None``,
+        so every hit stays reachable by paging. Filters narrow by mood
+        values and by an inclusive date range.
+        """
+        filters = ["me.user_id = ?"]
+        params: List[object] = [user_id]
+        if moods:
+            filters.append(f"me.mood IN ({', '.join('?' for _ in moods)})")
+            params.extend(int(mood) for mood in moods)
+        # The FTS scan runs newest first; bounding it by the ids written in
+        # the date range skips the matches outside it without reading them.
+        span, span_params = "", []
+        if start_date is not None and end_date is not None:
+            days = [parse_entry_day(start_date), parse_entry_day(end_date)]
+            filters.append("me.entry_day BETWEEN ? AND ?")
+            params.extend(days)
+            in_range = (
+                "FROM mood_entries WHERE user_id = ? AND entry_day BETWEEN ? AND ?"
+            )
+            span = (
+                f"AND mood_entries_fts.rowid BETWEEN (SELECT MIN(id) {in_range}) "
+                f"AND (SELECT MAX(id) {in_range})"
+            )
+            span_params = [user_id, *days] * 2
+
+        if not self.has_full_text_search():  # pragma: no cover - no FTS5
+            return self._search_with_like(user_id, text, limit, offset, filters, params)
+
+        # The owner token confines the match to this user's rows, so the
+        # newest candidates are found without touching anyone else's.
+        terms = build_match_query(text)
+        match = f'owner : "u{int(user_id)}" AND content : ({terms})'
+        candidate_query = f"""
+            SELECT me.id
+              FROM mood_entries_fts
+              JOIN mood_entries me ON me.id = mood_entries_fts.rowid
+             WHERE mood_entries_fts MATCH ? {span}
+               AND {' AND '.join(filters)}
+             ORDER BY mood_entries_fts.rowid DESC
+             LIMIT ?
+        """
+        # bm25() first counts every row matching each phrase; leaving the
+        # owner phrase out of this match skips a pass over all of the user's
+        # rows. The rowid range keeps the scan to the candidates' span.
+        score_query = """
+            SELECT rowid, bm25(mood_entries_fts)
+              FROM mood_entries_fts
+             WHERE mood_entries_fts MATCH ?
+               AND rowid BETWEEN ? AND ?
+               AND +rowid IN (SELECT value FROM json_each(?))
+        """
+        # Scanning the page's rowid span once beats a rowid seek per hit,
+        # which re-reads every phrase's doclist.
+        snippet_query = """
+            SELECT rowid, snippet(mood_entries_fts, 0, ?, ?, '…', ?)
+              FROM mood_entries_fts
+             WHERE mood_entries_fts MATCH ?
+               AND rowid BETWEEN ? AND ?
+               AND +rowid IN (SELECT value FROM json_each(?))
+        """
+        # Entry fields are read for the page only, not for every candidate.
+        page_query = """
+            SELECT id, date, mood, created_at, updated_at
+              FROM mood_entries
+             WHERE id IN (SELECT value FROM json_each(?))
+        """
+
+        with self._connect() as conn:
+            candidates = [
+                row[0]
+                for row in conn.execute(
+                    candidate_query,
+                    [
+                        match,
+                        *span_params,
+                        *params,
+                        max(RANK_CANDIDATES, offset + limit + 1),
+                    ],
+                )
+            ]
+            ranked, older = (
+                candidates[:RANK_CANDIDATES],
+                candidates[RANK_CANDIDATES:],
+            )
+            scores: Dict[int, float] = {}
+            if ranked and offset < len(ranked):
+                scores = dict(
+                    conn.execute(
+                        score_query,
+                        (
+                            f"content : ({terms})",
+                            ranked[-1],
+                            ranked[0],
+                            json.dumps(ranked),
+                        ),
+                    ).fetchall()
+                )
+            ranked.sort(key=lambda entry_id: (scores.get(entry_id), -entry_id))
+            window = (ranked + older)[offset : offset + limit + 1]
+            page = window[:limit]
+            if not page:
+                return [], False
+
+            conn.row_factory = sqlite3.Row
+            entries = {
+                row["id"]: dict(row)
+                for row in conn.execute(page_query, (json.dumps(page),))
+            }
+            conn.row_factory = None
+            snippets = dict(
+                conn.execute(
+                    snippet_query,
+                    (
+                        _HIT_OPEN,
+                        _HIT_CLOSE,
+                        SNIPPET_TOKENS,
+                        f"content : ({terms})",
+                        min(page),
+                        max(page),
+                        json.dumps(page),
+                    ),
+                ).fetchall()
+            )
+        hits = []
+        for entry_id in page:
+            hit = entries[entry_id]
+            hit["score"] = scores.get(entry_id)
+            hit["snippet"] = render_snippet(snippets.get(entry_id, ""))
+            hits.append(hit)
+        return hits, len(window) > limit
+
+    def _search_with_like(
+        self,
+        user_id: int,
+        text: str,
+        limit: int,
+        offset: int,
+        filters: List[str],
+        params: List[object],
+    ) -> Tuple[List[Dict], bool]:  # pragma: no cover - only without FTS5
+        terms = _TERM.findall(text or "")
+        if not terms:
+            raise ValueError("Search query must contain at least one word")
+        for term in terms:
+            filters.append("me.content LIKE ? ESCAPE '\\'")
+            escaped = re.sub(r"([\\%_])", r"\\\1", term)
+            params.append(f"%{escaped}%")
+        query = f"""
+            SELECT me.id, me.date, me.mood, me.created_at, me.updated_at,
+                   substr(me.content, 1, 160) AS snippet, 0.0 AS score
+              FROM mood_entries me
+             WHERE {' AND '.join(filters)}
+             ORDER BY me.created_at DESC, me.id DESC
+             LIMIT ? OFFSET ?
+        """
+        params.extend([limit + 1, offset])
+
+        with self._connect() as conn:
+            conn.row_factory = sqlite3.Row
+            rows = conn.execute(query, params).fetchall()
+        hits = [dict(row) for row in rows[:limit]]
+        for hit in hits:
+            hit["snippet"] = html.escape(hit["snippet"] or "")
+        return hits, len(rows) > limit
+
+
+__all__ = ["SearchMixin", "build_match_query", "render_snippet"]
@@ -0,0 +1,161 @@
+"""Persisted per-user streak state."""
+
+from __future__ import annotations
+
+import sqlite3
+from datetime import date
+from typing import Dict, Iterable, Optional, Tuple
+
+try:  # pragma: no cover - allow top-level script usage
+    from .database_common import DatabaseConnectionMixin, SQLQueries
+except ImportError:  # pragma: no cover
+    from database_common import DatabaseConnectionMixin, SQLQueries  # type: ignore
+
+StreakState = Tuple[Optional[int], int, int]
+
+
+class StreakMixin(DatabaseConnectionMixin):
+    """Keeps ``user_streaks`` in step with the days a user has entries on.
+
+    The stored state is the newest entry day, the length of the run of
+    consecutive days ending there and the longest run ever. The mood write
+    paths report the days they add or remove inside their transaction:
+    appending today or a new day costs O(1), and edits that reach back into
+    history walk only the run they touch. A full recompute happens only when
+    a day leaves a run as long as the longest, or when one write backfills
+    several older days at once.
+    """
+
+    def get_streak_state(self, user_id: int, today: Optional[int] = None) -> Dict:
+        with self._connect() as conn:
+            row = conn.execute(SQLQueries.GET_STREAK_STATE, (user_id,)).fetchone()
+        last_day, run, longest = row if row else (None, 0, 0)
+        if today is None:
+            today = date.today().toordinal()
+        # A run stays current until a full day passes without an entry.
+        current = run if last_day is not None and today - last_day <= 1 else 0
+        return {
+            "current_streak": current,
+            "longest_streak": longest,
+            "last_entry_day": last_day,
+        }
+
+    def rebuild_streak(self, user_id: int) -> None:
+        """Recompute a user's streak state from their entries."""
+        self._run_write(lambda conn: self._rebuild_streak(conn, user_id))
+
+    # --- Write-path hooks -----------------------------------------------------
+    def _streak_days_added(
+        self, conn: sqlite3.Connection, user_id: int, days: Iterable[Optional[int]]
+    ) -> None:
+        added = sorted({day for day in days if day is not None})
+        if not added:
+            return
+        state = self._streak_state(conn, user_id)
+        if state is None or state[0] is None:
+            self._rebuild_streak(conn, user_id)
+            return
+        last, run, longest = state
+        if sum(1 for day in added if day <= last - run) > 1:
+            self._rebuild_streak(conn, user_id)
+            return
+
+        for day in added:
+            if day > last + 1:
+                last, run = day, 1
+            elif day == last + 1:
+                last, run = day, run + 1
+            elif day == last - run:
+                # Backfilled the day before the current run: it now extends
+                # back through whatever run ends on the previous day.
+                run += self._walk(conn, user_id, day, -1)
+            elif day < last - run:
+                longest = max(longest, self._run_length(conn, user_id, day))
+            longest = max(longest, run)
+        self._store_streak(conn, user_id, (last, run, longest))
+
+    def _streak_days_removed(
+        self, conn: sqlite3.Connection, user_id: int, days: Iterable[Optional[int]]
+    ) -> None:
+        for day in sorted({day for day in days if day is not None}, reverse=True):
+            if self._has_day(conn, user_id, day):
+                continue
+            state = self._streak_state(conn, user_id)
+            if state is None or state[0] is None:
+                self._rebuild_streak(conn, user_id)
+                return
+            last, run, longest = state
+            # The walks see the table as it is now, so they can only over-
+            # estimate the run the day left, which errs towards a rebuild.
+            if self._run_length(conn, user_id, day) >= longest:
+                self._rebuild_streak(conn, user_id)
+                return
+            if day == last:
+                row = conn.execute(
+                    "SELECT MAX(entry_day) FROM mood_entries WHERE user_id = ?",
+                    (user_id,),
+                ).fetchone()
+                last = row[0] if row else None
+                run = self._walk(conn, user_id, last, -1) if last is not None else 0
+            elif last - run < day < last:
+                run = last - day
+            else:
+                continue
+            self._store_streak(conn, user_id, (last, run, longest))
+
+    # --- Helpers --------------------------------------------------------------
+    def _streak_state(
+        self, conn: sqlite3.Connection, user_id: int
+    ) -> Optional[StreakState]:
+        row = conn.execute(SQLQueries.GET_STREAK_STATE, (user_id,)).fetchone()
+        return (row[0], row[1], row[2]) if row else None
+
+    def _store_streak(
+        self, conn: sqlite3.Connection, user_id: int, state: StreakState
+    ) -> None:
+        conn.execute(SQLQueries.UPSERT_STREAK_STATE, (user_id, *state))
+
+    def _rebuild_streak(self, conn: sqlite3.Connection, user_id: int) -> None:
+        row = conn.execute(SQLQueries.COMPUTE_STREAK_STATE, (user_id,)).fetchone()
+        state = (row[0], row[1], row[2]) if row else (None, 0, 0)
+        self._store_streak(conn, user_id, state)
+
+    def _has_day(self, conn: sqlite3.Connection, user_id: int, day: int) -> bool:
+        row = conn.execute(
+            "SELECT 1 FROM mood_entries WHERE user_id = ? AND entry_day = ? LIMIT 1",
+            (user_id, day),
+        ).fetchone()
+        return row is not None
+
+    def _walk(
+        self, conn: sqlite3.Connection, user_id: int, start: int, step: int
+    ) -> int:
+        """Count consecutive days from ``start`` (inclusive) in one direction."""
+        if step < 0:
+            sql = (
+                "SELECT DISTINCT entry_day FROM mood_entries "
+                "WHERE user_id = ? AND entry_day <= ? ORDER BY entry_day DESC"
+            )
+        else:
+            sql = (
+                "SELECT DISTINCT entry_day FROM mood_entries "
+                "WHERE user_id = ? AND entry_day >= ? ORDER BY entry_day ASC"
+            )
+        count = 0
+        expected = start
+        # The cursor is read lazily, so only the run itself is visited.
+        for (day,) in conn.execute(sql, (user_id, start)):
+            if day != expected:
+                break
+            count += 1
+            expected += step
+        return count
+
+    def _run_length(self, conn: sqlite3.Connection, user_id: int, day: int) -> int:
+        """Length of the run through ``day``, counting ``day`` as present."""
+        before = self._walk(conn, user_id, day - 1, -1)
+        after = self._walk(conn, user_id, day + 1, 1)
+        return before + 1 + after
+
+
+__all__ = ["StreakMixin"]
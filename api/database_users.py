@@ -21,14 +21,15 @@ class UsersMixin(DatabaseConnectionMixin):
         name: str,
         avatar_url: Optional[str] = None,
     ) -> int:
-        with self._connect() as conn:
+        def _write(conn: sqlite3.Connection) -> int:
             cursor = conn.execute(
                 SQLQueries.CREATE_USER,
                 (google_id, email, name, avatar_url),
             )
-            conn.commit()
             return int(cursor.lastrowid or 0)
 
+        return self._run_write(_write)
+
     def get_user_by_google_id(self, google_id: str) -> Optional[Dict]:
         with self._connect() as conn:
             conn.row_factory = sqlite3.Row
@@ -44,7 +45,7 @@ class UsersMixin(DatabaseConnectionMixin):
             return dict(row) if row else None
 
     def update_user_last_login(self, user_id: int) -> None:
-        with self._connect() as conn:
+        def _write(conn: sqlite3.Connection) -> None:
             conn.execute(
                 """
                 UPDATE users
@@ -53,7 +54,8 @@ class UsersMixin(DatabaseConnectionMixin):
                 """,
                 (user_id,),
             )
-            conn.commit()
+
+        self._run_write(_write)
 
     def upsert_user_by_google_id(
         self,
@@ -62,31 +64,27 @@ class UsersMixin(DatabaseConnectionMixin):
         name: Optional[str],
         avatar_url: Optional[str] = None,
     ) -> Optional[Dict]:
-        with self._connect() as conn:
+        def _write(conn: sqlite3.Connection) -> Optional[Dict]:
             conn.row_factory = sqlite3.Row
-            conn.execute("BEGIN IMMEDIATE")
             try:
-                try:
-                    cursor = conn.execute(
-                        SQLQueries.UPSERT_USER
-                        + " RETURNING id, google_id, email, name, avatar_url, created_at, last_login",
-                        (google_id, email, name, avatar_url),
-                    )
-                    row = cursor.fetchone()
-                except sqlite3.OperationalError:
-                    conn.execute(
-                        SQLQueries.UPSERT_USER,
-                        (google_id, email, name, avatar_url),
-                    )
-                    row = conn.execute(
-                        SQLQueries.GET_USER_BY_GOOGLE_ID,
-                        (google_id,),
-                    ).fetchone()
-                conn.commit()
-                return dict(row) if row else None
-            except Exception:
-                conn.rollback()
-                raise
+                cursor = conn.execute(
+                    SQLQueries.UPSERT_USER
+                    + " RETURNING id, google_id, email, name, avatar_url, created_at, last_login",
+                    (google_id, email, name, avatar_url),
+                )
+                row = cursor.fetchone()
+            except sqlite3.OperationalError:
+                conn.execute(
+                    SQLQueries.UPSERT_USER,
+                    (google_id, email, name, avatar_url),
+                )
+                row = conn.execute(
+                    SQLQueries.GET_USER_BY_GOOGLE_ID,
+                    (google_id,),
+                ).fetchone()
+            return dict(row) if row else None
+
+        return self._run_write(_write)
 
 
 __all__ = ["UsersMixin"]
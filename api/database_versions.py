@@ -0,0 +1,29 @@
+"""Per-user data versions for cheap change detection."""
+
+from __future__ import annotations
+
+try:  # pragma: no cover - allow top-level script usage
+    from .database_common import DatabaseConnectionMixin
+except ImportError:  # pragma: no cover
+    from database_common import DatabaseConnectionMixin  # type: ignore
+
+
+class DataVersionMixin(DatabaseConnectionMixin):
+    """Reads the counters maintained by the ``*_version_*`` triggers.
+
+    Every insert, update or delete of a user's entries, selections, goals,
+    goal completions or achievements bumps ``user_data_versions.version``
+    once (entries and selections through their ``*_change_*`` triggers), so
+    an unchanged version means unchanged data.
+    """
+
+    def get_data_version(self, user_id: int) -> int:
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT version FROM user_data_versions WHERE user_id = ?",
+                (user_id,),
+            ).fetchone()
+        return int(row[0]) if row else 0
+
+
+__all__ = ["DataVersionMixin"]
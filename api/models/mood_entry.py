@@ -1,36 +1,67 @@
 from dataclasses import dataclass
-from typing import List, Optional
+from typing import Any, Dict, List, Optional, Union
 from datetime import datetime
 
+Timestamp = Union[datetime, str]
 
-@dataclass
+
+def _isoformat(value: Optional[Timestamp]) -> Optional[str]:
+    # SQLite hands timestamps back as text already
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return value or None
+
+
+@dataclass(slots=True)
 class MoodEntry:
     id: Optional[int]
     date: str
     mood: int
     content: str
-    created_at: Optional[datetime] = None
-    updated_at: Optional[datetime] = None
+    created_at: Optional[Timestamp] = None
+    updated_at: Optional[Timestamp] = None
     selections: Optional[List] = None
 
+    # Select list matching the positional fields, for ``row_factory``.
+    COLUMNS = "id, date, mood, content, created_at, updated_at"
+
+    @staticmethod
+    def row_factory(cursor: Any, row: tuple) -> "MoodEntry":
+        """``sqlite3`` row factory for queries selecting :attr:`COLUMNS`."""
+        return MoodEntry(*row)
+
     def to_dict(self):
         return {
             "id": self.id,
             "date": self.date,
             "mood": self.mood,
             "content": self.content,
-            "created_at": self.created_at.isoformat() if self.created_at else None,
-            "updated_at": self.updated_at.isoformat() if self.updated_at else None,
+            "created_at": _isoformat(self.created_at),
+            "updated_at": _isoformat(self.updated_at),
             "selections": self.selections or [],
         }
 
+    def to_json(self) -> Dict[str, Any]:
+        """API representation: ``selections`` appears only once loaded."""
+        data = {
+            "id": self.id,
+            "date": self.date,
+            "mood": self.mood,
+            "content": self.content,
+            "created_at": self.created_at,
+            "updated_at": self.updated_at,
+        }
+        if self.selections is not None:
+            data["selections"] = self.selections
+        return data
+
 
-@dataclass
+@dataclass(slots=True)
 class Group:
     id: Optional[int]
     name: str
     options: Optional[List] = None
-    created_at: Optional[datetime] = None
+    created_at: Optional[Timestamp] = None
 
     def to_dict(self):
         return {
@@ -40,21 +71,21 @@ class Group:
                 option.to_dict() if hasattr(option, "to_dict") else option
                 for option in (self.options or [])
             ],
-            "created_at": self.created_at.isoformat() if self.created_at else None,
+            "created_at": _isoformat(self.created_at),
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class GroupOption:
     id: Optional[int]
     group_id: int
     name: str
-    created_at: Optional[datetime] = None
+    created_at: Optional[Timestamp] = None
 
     def to_dict(self):
         return {
             "id": self.id,
             "group_id": self.group_id,
             "name": self.name,
-            "created_at": self.created_at.isoformat() if self.created_at else None,
+            "created_at": _isoformat(self.created_at),
         }
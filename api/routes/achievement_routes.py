@@ -1,6 +1,7 @@
 from flask import Blueprint, request, jsonify
 from api.services.achievement_service import AchievementService
 from api.utils.auth_middleware import require_auth, get_current_user_id
+from api.utils.conditional import conditional_on_data_version
 from api.config import get_config
 
 
@@ -9,6 +10,7 @@ def create_achievement_routes(achievement_service: AchievementService):
 
     @achievement_bp.route("/achievements", methods=["GET"])
     @require_auth
+    @conditional_on_data_version(achievement_service.db)
     def get_user_achievements():
         try:
             user_id = get_current_user_id()
@@ -53,12 +55,13 @@ def create_achievement_routes(achievement_service: AchievementService):
         "/achievements/progress/", methods=["GET"], strict_slashes=False
     )
     @require_auth
+    @conditional_on_data_version(achievement_service.db, with_stats_views=True)
     def achievements_progress():
         try:
             user_id = get_current_user_id()
             if not isinstance(user_id, int):
                 return jsonify({"error": "Unauthorized"}), 401
-            progress = achievement_service.db.get_achievements_progress(user_id)
+            progress = achievement_service.get_achievements_progress(user_id)
             return jsonify(progress)
         except Exception as e:
             return jsonify({"error": str(e)}), 500
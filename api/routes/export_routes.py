@@ -0,0 +1,44 @@
+from datetime import datetime
+from flask import Blueprint, Response, request, jsonify
+from api.services.export_service import EXPORT_FORMATS, ExportService, gzip_stream
+from api.utils.auth_middleware import require_auth, get_current_user_id
+
+
+def _accepts_gzip() -> bool:
+    return "gzip" in request.headers.get("Accept-Encoding", "").lower()
+
+
+def create_export_routes(export_service: ExportService):
+    export_bp = Blueprint("export", __name__)
+
+    @export_bp.route("/export", methods=["GET"])
+    @require_auth
+    def export_entries():
+        try:
+            user_id = get_current_user_id()
+            if user_id is None:
+                return jsonify({"error": "Unauthorized"}), 401
+            fmt = (request.args.get("format") or "ndjson").lower()
+            start_date = request.args.get("start_date") or None
+            end_date = request.args.get("end_date") or None
+
+            body = export_service.export_entries(user_id, fmt, start_date, end_date)
+            headers = {
+                "Content-Disposition": (
+                    "attachment; filename="
+                    f"nightlio-export-{datetime.now():%Y%m%d}.{fmt}"
+                ),
+                "Cache-Control": "no-store",
+                "Vary": "Accept-Encoding",
+            }
+            if _accepts_gzip():
+                body = gzip_stream(body)
+                headers["Content-Encoding"] = "gzip"
+            return Response(body, mimetype=EXPORT_FORMATS[fmt], headers=headers)
+
+        except ValueError as e:
+            return jsonify({"error": str(e)}), 400
+        except Exception as e:
+            return jsonify({"error": str(e)}), 500
+
+    return export_bp
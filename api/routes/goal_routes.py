@@ -1,13 +1,17 @@
 from flask import Blueprint, request, jsonify
 from api.services.goal_service import GoalService
 from api.utils.auth_middleware import require_auth, get_current_user_id
+from api.utils.conditional import conditional_on_data_version
+from api.utils.unit_of_work import immediate_unit_of_work
 
 
 def create_goal_routes(goal_service: GoalService):
     bp = Blueprint("goals", __name__)
 
     @bp.route("/goals", methods=["GET"])
+    @immediate_unit_of_work  # reading rolls finished weeks over
     @require_auth
+    @conditional_on_data_version(goal_service.db)
     def list_goals():
         try:
             user_id = get_current_user_id()
@@ -43,6 +47,7 @@ def create_goal_routes(goal_service: GoalService):
             return jsonify({"error": str(e)}), 500
 
     @bp.route("/goals/<int:goal_id>", methods=["GET"])
+    @immediate_unit_of_work  # reading rolls finished weeks over
     @require_auth
     def get_goal(goal_id: int):
         try:
@@ -0,0 +1,66 @@
+import io
+from flask import Blueprint, request, jsonify
+from api.services.import_service import IMPORT_FORMATS, ImportService, detect_format
+from api.utils.auth_middleware import require_auth, get_current_user_id
+from api.utils.is_truthy import is_truthy
+from api.utils.unit_of_work import without_unit_of_work
+
+
+def create_import_routes(import_service: ImportService):
+    import_bp = Blueprint("import", __name__)
+
+    @import_bp.route("/import", methods=["POST"])
+    @without_unit_of_work
+    @require_auth
+    def import_entries():
+        try:
+            user_id = get_current_user_id()
+            if user_id is None:
+                return jsonify({"error": "Unauthorized"}), 401
+
+            # Multipart uploads are spooled to disk by Werkzeug; a raw body
+            # is read straight from the input stream. Either way the file is
+            # decoded and parsed line by line.
+            upload = request.files.get("file")
+            if upload is not None:
+                raw, filename = upload.stream, upload.filename
+            else:
+                raw, filename = request.stream, None
+            stream = io.TextIOWrapper(raw, encoding="utf-8-sig", newline="")
+            first_line = stream.readline()
+
+            fmt = (request.args.get("format") or "").lower() or detect_format(
+                filename, first_line
+            )
+            if fmt not in IMPORT_FORMATS:
+                return jsonify({"error": f"Unsupported import format: {fmt}"}), 400
+            if not first_line.strip():
+                return jsonify({"error": "Import file is empty"}), 400
+
+            try:
+                tz_offset = int(request.args.get("tz_offset") or 0)
+            except ValueError:
+                return jsonify({"error": "tz_offset must be an integer"}), 400
+
+            summary = import_service.import_entries(
+                user_id,
+                _chain(first_line, stream),
+                fmt,
+                create_missing=is_truthy(request.args.get("create_missing")),
+                tz_offset=tz_offset,
+            )
+            return jsonify({"status": "success", **summary})
+
+        except UnicodeDecodeError:
+            return jsonify({"error": "Import file must be UTF-8 encoded"}), 400
+        except ValueError as e:
+            return jsonify({"error": str(e)}), 400
+        except Exception as e:
+            return jsonify({"error": str(e)}), 500
+
+    return import_bp
+
+
+def _chain(first_line, stream):
+    yield first_line
+    yield from stream
@@ -2,6 +2,9 @@ from typing import Any, List, Optional
 from flask import Blueprint, request, jsonify
 from api.services.mood_service import MoodService
 from api.utils.auth_middleware import require_auth, get_current_user_id
+from api.utils.conditional import conditional_on_data_version
+from api.utils.pagination import parse_limit, wants_pagination
+from api.utils.unit_of_work import immediate_unit_of_work
 
 
 def _normalise_selected_options(
@@ -21,6 +24,7 @@ def _normalise_selected_options(
 
 def create_mood_routes(mood_service: MoodService):
     mood_bp = Blueprint("mood", __name__)
+    conditional = conditional_on_data_version(mood_service.db)
 
     @mood_bp.route("/mood", methods=["POST"])
     @require_auth
@@ -81,8 +85,45 @@ def create_mood_routes(mood_service: MoodService):
         except Exception as e:
             return jsonify({"error": str(e)}), 500
 
+    @mood_bp.route("/moods/bulk", methods=["POST"])
+    @require_auth
+    def create_mood_entries_bulk():
+        try:
+            user_id = get_current_user_id()
+            if user_id is None:
+                return jsonify({"error": "Unauthorized"}), 401
+            data = request.get_json(silent=True)
+            items = data.get("entries") if isinstance(data, dict) else data
+            if not isinstance(items, list) or not items:
+                return jsonify({"error": "entries must be a non-empty array"}), 400
+            if len(items) > mood_service.bulk_max_entries:
+                return (
+                    jsonify(
+                        {
+                            "error": "Too many entries",
+                            "max_entries": mood_service.bulk_max_entries,
+                        }
+                    ),
+                    413,
+                )
+
+            result = mood_service.create_mood_entries_bulk(user_id, items)
+            if result["failed"] == 0:
+                status, code = "success", 201
+            elif result["created"]:
+                status, code = "partial", 207
+            else:
+                status, code = "error", 400
+            return jsonify({"status": status, **result}), code
+
+        except ValueError as e:
+            return jsonify({"error": str(e)}), 400
+        except Exception as e:
+            return jsonify({"error": str(e)}), 500
+
     @mood_bp.route("/moods", methods=["GET"])
     @require_auth
+    @conditional
     def get_mood_entries():
         try:
             user_id = get_current_user_id()
@@ -90,15 +131,59 @@ def create_mood_routes(mood_service: MoodService):
                 return jsonify({"error": "Unauthorized"}), 401
             start_date = request.args.get("start_date")
             end_date = request.args.get("end_date")
+            if not (start_date and end_date):
+                start_date = end_date = None
+            include = {
+                part.strip() for part in request.args.get("include", "").split(",")
+            }
+            include_selections = "selections" in include
+
+            if wants_pagination(request.args):
+                page = mood_service.get_entries_page(
+                    user_id,
+                    parse_limit(request.args.get("limit")),
+                    request.args.get("cursor"),
+                    start_date,
+                    end_date,
+                    include_selections=include_selections,
+                )
+                return jsonify(page)
 
             if start_date and end_date:
                 entries = mood_service.get_entries_by_date_range(
-                    user_id, start_date, end_date
+                    user_id, start_date, end_date, include_selections=include_selections
                 )
             else:
-                entries = mood_service.get_all_entries(user_id)
+                entries = mood_service.get_all_entries(
+                    user_id, include_selections=include_selections
+                )
             return jsonify(entries)
 
+        except ValueError as e:
+            return jsonify({"error": str(e)}), 400
+        except Exception as e:
+            return jsonify({"error": str(e)}), 500
+
+    @mood_bp.route("/moods/changes", methods=["GET"])
+    @require_auth
+    def get_mood_entry_changes():
+        try:
+            user_id = get_current_user_id()
+            if user_id is None:
+                return jsonify({"error": "Unauthorized"}), 401
+            include = {
+                part.strip() for part in request.args.get("include", "").split(",")
+            }
+            changes = mood_service.get_changes(
+                user_id,
+                parse_limit(request.args.get("limit")),
+                request.args.get("since"),
+                include_selections="selections" in include,
+            )
+            return jsonify(changes)
+
+        except ValueError as e:
+            return jsonify({"error": str(e)}), 400
         except Exception as e:
             return jsonify({"error": str(e)}), 500
 
@@ -212,7 +297,12 @@ def create_mood_routes(mood_service: MoodService):
             return jsonify({"error": str(e)}), 500
 
     @mood_bp.route("/statistics", methods=["GET"])
+    # Unbuffered view counting writes on every request, even a 304
+    @immediate_unit_of_work(when=lambda: not mood_service.db.buffers_stats_views)
     @require_auth
+    @conditional_on_data_version(
+        mood_service.db, on_not_modified=mood_service.record_statistics_view
+    )
     def get_mood_statistics():
         try:
             user_id = get_current_user_id()
@@ -226,6 +316,7 @@ def create_mood_routes(mood_service: MoodService):
 
     @mood_bp.route("/streak", methods=["GET"])
     @require_auth
+    @conditional
     def get_current_streak():
         try:
             user_id = get_current_user_id()
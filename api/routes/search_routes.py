@@ -0,0 +1,56 @@
+from typing import List, Optional
+from flask import Blueprint, request, jsonify
+from api.services.search_service import (
+    DEFAULT_SEARCH_LIMIT,
+    MAX_SEARCH_LIMIT,
+    SearchService,
+)
+from api.utils.auth_middleware import require_auth, get_current_user_id
+
+
+def _parse_int(value: Optional[str], name: str, default: int) -> int:
+    if value is None or value == "":
+        return default
+    try:
+        return int(value)
+    except ValueError:
+        raise ValueError(f"{name} must be an integer") from None
+
+
+def _parse_moods(value: Optional[str]) -> Optional[List[int]]:
+    if not value:
+        return None
+    try:
+        return [int(part) for part in value.split(",") if part.strip()]
+    except ValueError:
+        raise ValueError("mood must be a comma-separated list of integers") from None
+
+
+def create_search_routes(search_service: SearchService):
+    search_bp = Blueprint("search", __name__)
+
+    @search_bp.route("/search", methods=["GET"])
+    @require_auth
+    def search_entries():
+        try:
+            user_id = get_current_user_id()
+            if user_id is None:
+                return jsonify({"error": "Unauthorized"}), 401
+            limit = _parse_int(request.args.get("limit"), "limit", DEFAULT_SEARCH_LIMIT)
+            result = search_service.search_entries(
+                user_id,
+                request.args.get("q", ""),
+                limit=min(limit, MAX_SEARCH_LIMIT),
+                offset=_parse_int(request.args.get("offset"), "offset", 0),
+                moods=_parse_moods(request.args.get("mood")),
+                start_date=request.args.get("start_date") or None,
+                end_date=request.args.get("end_date") or None,
+            )
+            return jsonify(result)
+
+        except ValueError as e:
+            return jsonify({"error": str(e)}), 400
+        except Exception as e:
+            return jsonify({"error": str(e)}), 500
+
+    return search_bp
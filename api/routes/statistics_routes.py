@@ -0,0 +1,105 @@
+from datetime import date
+from typing import List, Optional
+from flask import Blueprint, request, jsonify
+from api.services.statistics_service import (
+    DEFAULT_TREND_RANGE,
+    DEFAULT_TREND_WINDOW,
+    StatisticsService,
+)
+from api.utils.auth_middleware import require_auth, get_current_user_id
+from api.utils.conditional import conditional_on_data_version
+
+
+def _parse_int(value: Optional[str], name: str, default: int) -> int:
+    if value is None or value == "":
+        return default
+    try:
+        return int(value)
+    except ValueError:
+        raise ValueError(f"{name} must be an integer") from None
+
+
+def _parse_years(value: Optional[str]) -> List[int]:
+    if not value:
+        return [date.today().year]
+    try:
+        return [int(part) for part in value.split(",") if part.strip()]
+    except ValueError:
+        raise ValueError("year must be a comma-separated list of years") from None
+
+
+def create_statistics_routes(statistics_service: StatisticsService):
+    statistics_bp = Blueprint("statistics", __name__)
+    conditional = conditional_on_data_version(statistics_service.db)
+
+    @statistics_bp.route("/statistics/trend", methods=["GET"])
+    @require_auth
+    @conditional
+    def get_trend():
+        try:
+            user_id = get_current_user_id()
+            if user_id is None:
+                return jsonify({"error": "Unauthorized"}), 401
+            trend = statistics_service.get_trend(
+                user_id,
+                range_days=_parse_int(
+                    request.args.get("range"), "range", DEFAULT_TREND_RANGE
+                ),
+                bucket=request.args.get("bucket") or "day",
+                window=_parse_int(
+                    request.args.get("window"), "window", DEFAULT_TREND_WINDOW
+                ),
+            )
+            return jsonify(trend)
+
+        except ValueError as e:
+            return jsonify({"error": str(e)}), 400
+        except Exception as e:
+            return jsonify({"error": str(e)}), 500
+
+    @statistics_bp.route("/statistics/options", methods=["GET"])
+    @require_auth
+    @conditional
+    def get_option_stats():
+        try:
+            user_id = get_current_user_id()
+            if user_id is None:
+                return jsonify({"error": "Unauthorized"}), 401
+            return jsonify(statistics_service.get_option_stats(user_id))
+
+        except Exception as e:
+            return jsonify({"error": str(e)}), 500
+
+    @statistics_bp.route("/statistics/calendar", methods=["GET"])
+    @require_auth
+    @conditional
+    def get_calendar():
+        try:
+            user_id = get_current_user_id()
+            if user_id is None:
+                return jsonify({"error": "Unauthorized"}), 401
+            years = _parse_years(request.args.get("year"))
+            return jsonify(statistics_service.get_calendar(user_id, years))
+
+        except ValueError as e:
+            return jsonify({"error": str(e)}), 400
+        except Exception as e:
+            return jsonify({"error": str(e)}), 500
+
+    @statistics_bp.route("/statistics/patterns", methods=["GET"])
+    @require_auth
+    @conditional
+    def get_patterns():
+        try:
+            user_id = get_current_user_id()
+            if user_id is None:
+                return jsonify({"error": "Unauthorized"}), 401
+            offset = _parse_int(request.args.get("tz_offset"), "tz_offset", 0)
+            return jsonify(statistics_service.get_patterns(user_id, offset))
+
+        except ValueError as e:
+            return jsonify({"error": str(e)}), 400
+        except Exception as e:
+            return jsonify({"error": str(e)}), 500
+
+    return statistics_bp
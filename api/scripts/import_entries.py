@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+Import mood entries from a Daylio CSV export or a Nightlio NDJSON backup.
+- Streams the file and writes entries in chunked transactions
+- Idempotent: re-importing the same file skips rows already imported
+- Defaults to the self-host user (same as seed_selfhost_user.py)
+- Daylio times are local; --tz-offset (minutes east of UTC, e.g. 120 for
+  UTC+2) converts them to UTC like the rest of created_at. Default 0.
+
+Usage: python api/scripts/import_entries.py FILE [--format daylio|ndjson]
+       [--user-id ID] [--chunk-size N] [--create-missing] [--tz-offset MIN]
+       [--db PATH]
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from pathlib import Path
+from typing import Optional
+
+# Ensure imports resolve when executing as a script: python api/scripts/import_entries.py
+API_DIR = Path(__file__).resolve().parent.parent
+PROJECT_ROOT = API_DIR.parent
+for _path in (str(API_DIR), str(PROJECT_ROOT)):
+    if _path not in sys.path:
+        sys.path.insert(0, _path)
+
+from api.config import get_config  # noqa: E402
+from api.database import MoodDatabase  # noqa: E402
+from api.services.import_service import (  # noqa: E402
+    IMPORT_FORMATS,
+    ImportService,
+    detect_format,
+)
+from api.services.user_service import UserService  # noqa: E402
+
+
+def import_file(
+    path: str,
+    *,
+    fmt: Optional[str] = None,
+    user_id: Optional[int] = None,
+    chunk_size: int = 500,
+    create_missing: bool = False,
+    tz_offset: int = 0,
+    db_path: Optional[str] = None,
+    quiet: bool = False,
+) -> dict:
+    db = MoodDatabase(db_path)
+    try:
+        if user_id is None:
+            cfg = get_config()
+            user_id = UserService(db).ensure_local_user(
+                cfg.DEFAULT_SELF_HOST_ID,
+                default_name=cfg.SELFHOST_USER_NAME or "Me",
+                default_email=cfg.SELFHOST_USER_EMAIL
+                or f"{cfg.DEFAULT_SELF_HOST_ID}@localhost",
+            )["id"]
+
+        def report(progress: dict) -> None:
+            if not quiet:
+                print(
+                    f"{progress['rows']} rows read, {progress['inserted']} inserted, "
+                    f"{progress['skipped']} skipped, {progress['failed']} failed",
+                    file=sys.stderr,
+                )
+
+        with open(path, encoding="utf-8-sig", newline="") as handle:
+            first_line = handle.readline()
+            handle.seek(0)
+            return ImportService(db, chunk_size=chunk_size).import_entries(
+                user_id,
+                handle,
+                fmt or detect_format(path, first_line),
+                create_missing=create_missing,
+                tz_offset=tz_offset,
+                progress=report,
+            )
+    finally:
+        db.close()
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("file")
+    parser.add_argument("--format", choices=IMPORT_FORMATS)
+    parser.add_argument("--user-id", type=int)
+    parser.add_argument("--chunk-size", type=int, default=500)
+    parser.add_argument(
+        "--create-missing",
+        action="store_true",
+        help="create unknown activities under an 'Imported' group",
+    )
+    parser.add_argument(
+        "--tz-offset",
+        type=int,
+        default=0,
+        metavar="MINUTES",
+        help="offset of the Daylio export's local time from UTC, east positive",
+    )
+    parser.add_argument("--db", help="database path (default: data/nightlio.db)")
+    args = parser.parse_args(argv)
+
+    summary = import_file(
+        args.file,
+        fmt=args.format,
+        user_id=args.user_id,
+        chunk_size=args.chunk_size,
+        create_missing=args.create_missing,
+        tz_offset=args.tz_offset,
+        db_path=args.db,
+    )
+    print(json.dumps(summary, indent=2))
+    return 0 if summary["failed"] == 0 else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+"""
+Check the stored per-user mood summaries against the mood entries.
+- Recomputes every summary from scratch and lists users that drifted
+- With --repair, rebuilds the drifted summaries (or all with --all)
+
+Usage: python api/scripts/verify_mood_summary.py [--repair] [--all]
+       [--user-id ID ...] [--db PATH]
+"""
+from __future__ import annotations
+
+import argparse
+import sys
+from pathlib import Path
+
+# Ensure imports resolve when executing as a script
+API_DIR = Path(__file__).resolve().parent.parent
+PROJECT_ROOT = API_DIR.parent
+for _path in (str(API_DIR), str(PROJECT_ROOT)):
+    if _path not in sys.path:
+        sys.path.insert(0, _path)
+
+from api.database import MoodDatabase  # noqa: E402
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--user-id", type=int, action="append", dest="user_ids")
+    parser.add_argument("--repair", action="store_true", help="rebuild drifted users")
+    parser.add_argument(
+        "--all", action="store_true", help="with --repair, rebuild every user"
+    )
+    parser.add_argument("--db", help="database path (default: data/nightlio.db)")
+    args = parser.parse_args(argv)
+
+    db = MoodDatabase(args.db)
+    try:
+        drifted = db.verify_mood_summaries(args.user_ids)
+        for user_id in drifted:
+            print(f"user {user_id}: summary out of date")
+        if args.repair:
+            targets = args.user_ids if args.all else drifted
+            if args.all or targets:
+                rebuilt = db.rebuild_mood_summaries(targets)
+                print(f"rebuilt {rebuilt} summaries")
+            return 0
+        if not drifted:
+            print("all summaries match")
+        return 1 if drifted else 0
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
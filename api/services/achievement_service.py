@@ -1,10 +1,12 @@
-from typing import List, Dict
+from typing import List, Dict, Optional
 from api.database import MoodDatabase
+from api.utils.analytics_cache import AnalyticsCache
 
 
 class AchievementService:
-    def __init__(self, db: MoodDatabase):
+    def __init__(self, db: MoodDatabase, cache: Optional[AnalyticsCache] = None):
         self.db = db
+        self.cache = cache if cache is not None else AnalyticsCache(db, 0)
 
         # Achievement definitions
         self.achievements = {
@@ -57,6 +59,18 @@ class AchievementService:
 
         return achievements
 
+    def get_achievements_progress(self, user_id: int) -> Dict[str, Dict[str, int]]:
+        """Get progress towards each achievement"""
+        # Statistics views are not part of the data version, so they key
+        # the cached result alongside it.
+        stats_views = int(self.db.get_user_metrics(user_id).get("stats_views") or 0)
+        return self.cache.get_or_compute(
+            user_id,
+            "achievements_progress",
+            lambda: self.db.get_achievements_progress(user_id),
+            (stats_views,),
+        )
+
     def check_and_award_achievements(self, user_id: int) -> List[Dict]:
         """Check for new achievements and return them with metadata"""
         new_achievement_types = self.db.check_achievements(user_id)
@@ -0,0 +1,100 @@
+import csv
+import io
+import json
+import zlib
+from typing import Dict, Iterable, Iterator, Optional
+from api.database import MoodDatabase
+from api.database_common import parse_entry_day
+
+EXPORT_FORMATS = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv",
+}
+
+CSV_COLUMNS = [
+    "id",
+    "date",
+    "mood",
+    "content",
+    "created_at",
+    "updated_at",
+    "selections",
+]
+
+# Encoded rows are coalesced into chunks of roughly this size before being
+# handed to the WSGI server.
+CHUNK_BYTES = 64 * 1024
+
+
+class ExportService:
+    def __init__(self, db: MoodDatabase):
+        self.db = db
+
+    def export_entries(
+        self,
+        user_id: int,
+        fmt: str = "ndjson",
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+    ) -> Iterator[bytes]:
+        """Stream a user's journal as NDJSON or CSV bytes.
+
+        Arguments are validated eagerly (raising ``ValueError``) so callers
+        can reject a request before the response starts; rows are then read
+        lazily as the returned iterator is consumed.
+        """
+        if fmt not in EXPORT_FORMATS:
+            raise ValueError(f"Unsupported export format: {fmt}")
+        if (start_date is None) != (end_date is None):
+            raise ValueError("start_date and end_date must be given together")
+        if start_date is not None:
+            parse_entry_day(start_date)
+            parse_entry_day(end_date)
+
+        entries = self.db.iter_mood_entries_for_export(user_id, start_date, end_date)
+        encode = self._encode_ndjson if fmt == "ndjson" else self._encode_csv
+        return self._coalesce(encode(entries))
+
+    @staticmethod
+    def _encode_ndjson(entries: Iterable[Dict]) -> Iterator[bytes]:
+        for entry in entries:
+            yield (json.dumps(entry, ensure_ascii=False) + "\n").encode("utf-8")
+
+    @staticmethod
+    def _encode_csv(entries: Iterable[Dict]) -> Iterator[bytes]:
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        writer.writerow(CSV_COLUMNS)
+        for entry in entries:
+            selections = " | ".join(
+                f"{s['group_name']}: {s['name']}" for s in entry["selections"]
+            )
+            writer.writerow(
+                [entry[column] for column in CSV_COLUMNS[:-1]] + [selections]
+            )
+            yield buffer.getvalue().encode("utf-8")
+            buffer.seek(0)
+            buffer.truncate()
+
+    @staticmethod
+    def _coalesce(chunks: Iterable[bytes]) -> Iterator[bytes]:
+        pending = []
+        size = 0
+        for chunk in chunks:
+            pending.append(chunk)
+            size += len(chunk)
+            if size >= CHUNK_BYTES:
+                yield b"".join(pending)
+                pending, size = [], 0
+        if pending:
+            yield b"".join(pending)
+
+
+def gzip_stream(chunks: Iterable[bytes], level: int = 6) -> Iterator[bytes]:
+    """Compress an iterable of byte chunks into a single gzip stream."""
+    compressor = zlib.compressobj(level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+    for chunk in chunks:
+        data = compressor.compress(chunk)
+        if data:
+            yield data
+    yield compressor.flush()
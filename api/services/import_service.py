@@ -0,0 +1,328 @@
+import csv
+import hashlib
+import json
+import logging
+import re
+from datetime import datetime, time, timedelta
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+from api.database import MoodDatabase
+from api.database_common import parse_entry_day
+from api.services.statistics_service import MAX_TZ_OFFSET
+
+IMPORT_FORMATS = ("daylio", "ndjson")
+
+# Daylio's five default mood labels; numeric labels are accepted as-is.
+DAYLIO_MOODS = {"rad": 5, "good": 4, "meh": 3, "bad": 2, "awful": 1}
+DAYLIO_TIME_FORMATS = ("%H:%M", "%I:%M %p", "%I:%M%p", "%H:%M:%S")
+
+# Group that receives activities missing from the catalogue when the caller
+# asks for them to be created.
+IMPORTED_GROUP_NAME = "Imported"
+
+# Caps on what the summary keeps, so huge files cannot grow it unbounded.
+MAX_REPORTED_ERRORS = 20
+MAX_REPORTED_ACTIVITIES = 50
+
+ParsedRow = Tuple[int, Optional[Dict[str, Any]], Optional[str]]
+ProgressCallback = Callable[[Dict[str, Any]], None]
+
+
+def detect_format(filename: Optional[str], first_line: str = "") -> str:
+    """Guess the import format from a file name or its first line."""
+    name = (filename or "").lower()
+    if name.endswith((".ndjson", ".jsonl", ".json")):
+        return "ndjson"
+    if name.endswith(".csv"):
+        return "daylio"
+    return "ndjson" if first_line.lstrip("\ufeff \t").startswith("{") else "daylio"
+
+
+def _key(prefix: str, *parts: Any) -> str:
+    digest = hashlib.sha1("\x1f".join(str(p) for p in parts).encode("utf-8"))
+    return f"{prefix}:{digest.hexdigest()}"
+
+
+def _display_date(day: int) -> str:
+    return datetime.fromordinal(day).strftime("%m/%d/%Y")
+
+
+def _daylio_mood(label: str) -> int:
+    value = label.strip().lower()
+    if value in DAYLIO_MOODS:
+        return DAYLIO_MOODS[value]
+    try:
+        mood = int(value)
+    except ValueError:
+        raise ValueError(f"Unknown mood label: {label!r}") from None
+    if not 1 <= mood <= 5:
+        raise ValueError(f"Mood out of range: {label!r}")
+    return mood
+
+
+def _daylio_time(value: str) -> Optional[time]:
+    text = value.strip().upper()
+    if not text:
+        return None
+    for fmt in DAYLIO_TIME_FORMATS:
+        try:
+            return datetime.strptime(text, fmt).time()
+        except ValueError:
+            continue
+    raise ValueError(f"Invalid time: {value!r}")
+
+
+def _daylio_note(title: str, note: str) -> str:
+    # Daylio stores line breaks in notes as HTML.
+    body = re.sub(r"<br\s*/?>", "\n", note or "", flags=re.IGNORECASE).strip()
+    title = (title or "").strip()
+    if title and body:
+        return f"{title}\n\n{body}"
+    return title or body
+
+
+def iter_daylio_rows(lines: Iterable[str], tz_offset: int = 0) -> Iterator[ParsedRow]:
+    """Parse a Daylio CSV export row by row.
+
+    Expects Daylio's ``full_date, date, weekday, time, mood, activities,
+    note_title, note`` columns; activities are separated by `` | ``.
+    Daylio records local wall-clock times; they are moved back by
+    ``tz_offset`` minutes (east of UTC) so ``created_at`` holds UTC like
+    entries written by the app. The entry's date stays the local day.
+    """
+    reader = csv.DictReader(lines)
+    if reader.fieldnames:
+        reader.fieldnames = [
+            name.lstrip("\ufeff").strip().lower() for name in reader.fieldnames
+        ]
+    missing = {"full_date", "mood"} - set(reader.fieldnames or [])
+    if missing:
+        raise ValueError(
+            f"Not a Daylio CSV export (missing {', '.join(sorted(missing))})"
+        )
+
+    for row in reader:
+        line = reader.line_num
+        try:
+            day = parse_entry_day(row.get("full_date"))
+            mood = _daylio_mood(row.get("mood") or "")
+            clock = _daylio_time(row.get("time") or "")
+            activities = [
+                (None, name.strip())
+                for name in (row.get("activities") or "").split(" | ")
+                if name.strip()
+            ]
+            content = _daylio_note(row.get("note_title") or "", row.get("note") or "")
+        except ValueError as exc:
+            yield line, None, str(exc)
+            continue
+        created_at = None
+        if clock is not None:
+            local = datetime.combine(datetime.fromordinal(day).date(), clock)
+            created_at = (local - timedelta(minutes=tz_offset)).strftime(
+                "%Y-%m-%d %H:%M:%S"
+            )
+        yield line, {
+            "date": _display_date(day),
+            "mood": mood,
+            "content": content,
+            "time": created_at,
+            "activities": activities,
+            "import_key": _key(
+                "daylio",
+                row.get("full_date"),
+                row.get("time"),
+                row.get("mood"),
+                row.get("activities"),
+                content,
+            ),
+        }, None
+
+
+def iter_ndjson_rows(lines: Iterable[str]) -> Iterator[ParsedRow]:
+    """Parse a Nightlio NDJSON export (one entry object per line)."""
+    for line, text in enumerate(lines, start=1):
+        text = text.strip().lstrip("\ufeff")
+        if not text:
+            continue
+        try:
+            data = json.loads(text)
+            if not isinstance(data, dict):
+                raise ValueError("Line is not a JSON object")
+            date = data.get("date")
+            parse_entry_day(date)
+            mood = data.get("mood")
+            if isinstance(mood, bool) or not isinstance(mood, int):
+                raise ValueError("Mood must be an integer between 1 and 5")
+            if not 1 <= mood <= 5:
+                raise ValueError("Mood must be an integer between 1 and 5")
+            content = data.get("content") or ""
+            if not isinstance(content, str):
+                raise ValueError("content must be a string")
+            created_at = data.get("created_at")
+            activities = [
+                (s.get("group_name"), str(s.get("name") or "").strip())
+                for s in data.get("selections") or []
+                if isinstance(s, dict) and str(s.get("name") or "").strip()
+            ]
+        except ValueError as exc:
+            yield line, None, str(exc)
+            continue
+        yield line, {
+            "date": date,
+            "mood": mood,
+            "content": content,
+            "time": created_at if isinstance(created_at, str) else None,
+            "activities": activities,
+            "import_key": data.get("import_key")
+            or _key("nightlio", date, created_at, mood, content),
+        }, None
+
+
+class _OptionLookup:
+    """Activity name -> group option id, built once from get_all_groups."""
+
+    def __init__(self, db: MoodDatabase, create_missing: bool):
+        self.db = db
+        self.create_missing = create_missing
+        self.by_pair: Dict[Tuple[str, str], int] = {}
+        self.by_name: Dict[str, int] = {}
+        self.imported_group_id: Optional[int] = None
+        for group in db.get_all_groups():
+            group_name = group["name"].lower()
+            if group["name"] == IMPORTED_GROUP_NAME:
+                self.imported_group_id = group["id"]
+            for option in group.get("options", []):
+                option_name = option["name"].lower()
+                self.by_pair[(group_name, option_name)] = option["id"]
+                self.by_name.setdefault(option_name, option["id"])
+
+    def resolve(self, group: Optional[str], name: str) -> Optional[int]:
+        key = name.lower()
+        if group:
+            option_id = self.by_pair.get((group.lower(), key))
+            if option_id is not None:
+                return option_id
+        option_id = self.by_name.get(key)
+        if option_id is not None or not self.create_missing:
+            return option_id
+
+        if self.imported_group_id is None:
+            self.imported_group_id = self.db.create_group(IMPORTED_GROUP_NAME)
+        option_id = self.db.create_group_option(self.imported_group_id, name)
+        self.by_pair[(IMPORTED_GROUP_NAME.lower(), key)] = option_id
+        self.by_name[key] = option_id
+        return option_id
+
+
+class ImportService:
+    def __init__(self, db: MoodDatabase, chunk_size: int = 500):
+        self.db = db
+        self.chunk_size = chunk_size
+
+    def import_entries(
+        self,
+        user_id: int,
+        lines: Iterable[str],
+        fmt: str,
+        *,
+        create_missing: bool = False,
+        tz_offset: int = 0,
+        progress: Optional[ProgressCallback] = None,
+    ) -> Dict[str, Any]:
+        """Stream-import entries from ``lines`` and return a summary.
+
+        Rows are parsed lazily and written in transactions of
+        ``chunk_size`` entries; ``progress`` receives the running summary
+        after each one. Rows already imported (same import key) are skipped,
+        so importing a file twice is a no-op the second time. Achievements
+        are evaluated once at the end.
+
+        ``tz_offset`` is the exporting device's offset from UTC in minutes
+        (east positive) and converts Daylio's local times to UTC. Nightlio
+        NDJSON timestamps are UTC already and are kept as they are.
+        """
+        if fmt not in IMPORT_FORMATS:
+            raise ValueError(f"Unsupported import format: {fmt}")
+        if not -MAX_TZ_OFFSET <= tz_offset <= MAX_TZ_OFFSET:
+            raise ValueError(
+                f"tz_offset must be between -{MAX_TZ_OFFSET} and {MAX_TZ_OFFSET}"
+            )
+        rows = (
+            iter_daylio_rows(lines, tz_offset)
+            if fmt == "daylio"
+            else iter_ndjson_rows(lines)
+        )
+        lookup = _OptionLookup(self.db, create_missing)
+        summary: Dict[str, Any] = {
+            "format": fmt,
+            "rows": 0,
+            "inserted": 0,
+            "skipped": 0,
+            "failed": 0,
+            "errors": [],
+            "unknown_activities": {},
+        }
+
+        chunk: List[Dict[str, Any]] = []
+        for line, entry, error in rows:
+            summary["rows"] += 1
+            if error is not None or entry is None:
+                self._record_error(summary, line, error or "Invalid row")
+                continue
+            entry["selected_options"] = self._resolve_activities(
+                lookup, entry.pop("activities"), summary
+            )
+            chunk.append(entry)
+            if len(chunk) >= self.chunk_size:
+                self._flush(user_id, chunk, summary, progress)
+                chunk = []
+        if chunk:
+            self._flush(user_id, chunk, summary, progress)
+
+        summary["new_achievements"] = (
+            self.db.check_achievements(user_id) if summary["inserted"] else []
+        )
+        return summary
+
+    def _flush(
+        self,
+        user_id: int,
+        chunk: List[Dict[str, Any]],
+        summary: Dict[str, Any],
+        progress: Optional[ProgressCallback],
+    ) -> None:
+        inserted, skipped = self.db.import_mood_entries(user_id, chunk)
+        summary["inserted"] += inserted
+        summary["skipped"] += skipped
+        logging.info(
+            "Import for user %s: %s rows read, %s inserted, %s skipped",
+            user_id,
+            summary["rows"],
+            summary["inserted"],
+            summary["skipped"],
+        )
+        if progress is not None:
+            progress(dict(summary))
+
+    @staticmethod
+    def _resolve_activities(
+        lookup: _OptionLookup,
+        activities: List[Tuple[Optional[str], str]],
+        summary: Dict[str, Any],
+    ) -> List[int]:
+        option_ids: List[int] = []
+        unknown = summary["unknown_activities"]
+        for group, name in activities:
+            option_id = lookup.resolve(group, name)
+            if option_id is None:
+                if name in unknown or len(unknown) < MAX_REPORTED_ACTIVITIES:
+                    unknown[name] = unknown.get(name, 0) + 1
+            elif option_id not in option_ids:
+                option_ids.append(option_id)
+        return option_ids
+
+    @staticmethod
+    def _record_error(summary: Dict[str, Any], line: int, error: str) -> None:
+        summary["failed"] += 1
+        if len(summary["errors"]) < MAX_REPORTED_ERRORS:
+            summary["errors"].append({"line": line, "error": error})
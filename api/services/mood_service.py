@@ -1,11 +1,26 @@
-from typing import List, Optional, Dict
+from typing import Any, List, Optional, Dict, Set, Tuple
 from api.database import MoodDatabase
+from api.database_common import parse_entry_day
 from api.models.mood_entry import MoodEntry
+from api.utils.analytics_cache import AnalyticsCache
+from api.utils.pagination import (
+    decode_cursor,
+    decode_sync_token,
+    encode_cursor,
+    encode_sync_token,
+)
 
 
 class MoodService:
-    def __init__(self, db: MoodDatabase):
+    def __init__(
+        self,
+        db: MoodDatabase,
+        bulk_max_entries: int = 1000,
+        cache: Optional[AnalyticsCache] = None,
+    ):
         self.db = db
+        self.bulk_max_entries = bulk_max_entries
+        self.cache = cache if cache is not None else AnalyticsCache(db, 0)
 
     def create_mood_entry(
         self,
@@ -32,15 +47,164 @@ class MoodService:
 
         return {"entry_id": entry_id, "new_achievements": new_achievements}
 
-    def get_all_entries(self, user_id: int) -> List[Dict]:
+    def create_mood_entries_bulk(self, user_id: int, items: List[Any]) -> Dict:
+        """Validate and insert many entries, then check achievements once.
+
+        Every item is validated before anything is written; valid items are
+        inserted in a single transaction and invalid ones are reported by
+        index alongside the created ids.
+        """
+        if len(items) > self.bulk_max_entries:
+            raise ValueError(
+                f"Too many entries (max {self.bulk_max_entries} per request)"
+            )
+
+        known_options = {
+            option["id"]
+            for group in self.db.get_all_groups()
+            for option in group.get("options", [])
+        }
+        results: List[Dict] = []
+        valid: List[Tuple[int, Dict]] = []
+        for index, raw in enumerate(items):
+            entry, errors = self._normalise_bulk_item(raw, known_options)
+            if errors:
+                results.append({"index": index, "status": "error", "errors": errors})
+            else:
+                valid.append((index, entry))
+
+        entry_ids = self.db.add_mood_entries_bulk(user_id, [e for _, e in valid])
+        for (index, _), entry_id in zip(valid, entry_ids):
+            results.append({"index": index, "status": "created", "entry_id": entry_id})
+        results.sort(key=lambda result: result["index"])
+
+        new_achievements = self.db.check_achievements(user_id) if entry_ids else []
+        return {
+            "created": len(entry_ids),
+            "failed": len(items) - len(entry_ids),
+            "results": results,
+            "new_achievements": new_achievements,
+        }
+
+    @staticmethod
+    def _normalise_bulk_item(
+        raw: Any, known_options: Set[int]
+    ) -> Tuple[Dict, List[str]]:
+        if not isinstance(raw, dict):
+            return {}, ["Entry must be an object"]
+        errors: List[str] = []
+
+        mood = raw.get("mood")
+        try:
+            mood_value = int(mood)
+        except (TypeError, ValueError):
+            mood_value = 0
+        if isinstance(mood, bool) or not (1 <= mood_value <= 5):
+            errors.append("Mood must be an integer between 1 and 5")
+
+        content = raw.get("content")
+        if not isinstance(content, str) or not content.strip():
+            errors.append("Content cannot be empty")
+
+        date = raw.get("date")
+        if parse_entry_day(date, strict=False) is None:
+            errors.append("Invalid date (expected MM/DD/YYYY)")
+
+        time = raw.get("time")
+        if time is not None and not isinstance(time, str):
+            errors.append("time must be a string")
+
+        options = raw.get("selected_options") or []
+        if not isinstance(options, list):
+            errors.append("selected_options must be an array")
+            options = []
+        try:
+            option_ids = [int(option_id) for option_id in options]
+        except (TypeError, ValueError):
+            errors.append("selected_options must contain integers")
+            option_ids = []
+        unknown = sorted(set(option_ids) - known_options)
+        if unknown:
+            errors.append(f"Unknown option ids: {unknown}")
+
+        entry = {
+            "date": date,
+            "mood": mood_value,
+            "content": content,
+            "time": time or None,
+            "selected_options": list(dict.fromkeys(option_ids)),
+        }
+        return entry, errors
+
+    def get_all_entries(
+        self, user_id: int, include_selections: bool = False
+    ) -> List[MoodEntry]:
         """Get all mood entries for a user"""
-        return self.db.get_all_mood_entries(user_id)
+        entries = self.db.get_all_mood_entries(user_id)
+        if include_selections:
+            self._attach_selections(user_id, entries, whole_history=True)
+        return entries
 
     def get_entries_by_date_range(
-        self, user_id: int, start_date: str, end_date: str
-    ) -> List[Dict]:
+        self,
+        user_id: int,
+        start_date: str,
+        end_date: str,
+        include_selections: bool = False,
+    ) -> List[MoodEntry]:
         """Get mood entries within a date range for a user"""
-        return self.db.get_mood_entries_by_date_range(user_id, start_date, end_date)
+        entries = self.db.get_mood_entries_by_date_range(user_id, start_date, end_date)
+        if include_selections:
+            self._attach_selections(user_id, entries)
+        return entries
+
+    def get_entries_page(
+        self,
+        user_id: int,
+        limit: int,
+        cursor: Optional[str] = None,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        include_selections: bool = False,
+    ) -> Dict:
+        """Get one keyset-paginated page of mood entries for a user"""
+        entries, next_key = self.db.get_mood_entries_page(
+            user_id, limit, decode_cursor(cursor), start_date, end_date
+        )
+        if include_selections:
+            self._attach_selections(user_id, entries)
+        return {"entries": entries, "next_cursor": encode_cursor(next_key)}
+
+    def get_changes(
+        self,
+        user_id: int,
+        limit: int,
+        since: Optional[str] = None,
+        include_selections: bool = False,
+    ) -> Dict:
+        """Get entries changed and deleted since a sync token"""
+        entries, deleted, last_key, has_more = self.db.get_mood_entry_changes(
+            user_id, limit, decode_sync_token(since)
+        )
+        if include_selections:
+            self._attach_selections(user_id, entries)
+        return {
+            "entries": entries,
+            "deleted": deleted,
+            "next_token": encode_sync_token(last_key),
+            "has_more": has_more,
+        }
+
+    def _attach_selections(
+        self, user_id: int, entries: List[MoodEntry], whole_history: bool = False
+    ) -> None:
+        """Embed each entry's selections using one set-based query"""
+        if not entries:
+            return
+        entry_ids = None if whole_history else [entry.id for entry in entries]
+        by_entry = self.db.get_selections_for_entries(user_id, entry_ids)
+        for entry in entries:
+            entry.selections = by_entry.get(entry.id, [])
 
     def get_entry_by_id(self, user_id: int, entry_id: int) -> Optional[Dict]:
         """Get a specific mood entry by ID for a user"""
@@ -90,25 +254,36 @@ class MoodService:
 
     def get_statistics(self, user_id: int) -> Dict:
         """Get mood statistics for a user"""
-        # Track statistics view for achievements (Data Lover)
-        try:
-            self.db.increment_stats_view(user_id)
-        except Exception:
-            # Metrics should not break stats
-            pass
+        self.record_statistics_view(user_id)
+        return self.cache.get_or_compute(
+            user_id, "statistics", lambda: self._compute_statistics(user_id)
+        )
+
+    def _compute_statistics(self, user_id: int) -> Dict:
         stats = self.db.get_mood_statistics(user_id)
         mood_counts = self.db.get_mood_counts(user_id)
-        current_streak = self.db.get_current_streak(user_id)
+        streak = self.db.get_streak_state(user_id)
 
         return {
             "statistics": stats,
             "mood_distribution": mood_counts,
-            "current_streak": current_streak,
+            "current_streak": streak["current_streak"],
+            "longest_streak": streak["longest_streak"],
         }
 
+    def record_statistics_view(self, user_id: int) -> None:
+        """Track statistics views for achievements (Data Lover)"""
+        try:
+            self.db.increment_stats_view(user_id)
+        except Exception:
+            # Metrics should not break stats
+            pass
+
     def get_current_streak(self, user_id: int) -> int:
         """Get current consecutive days streak for a user"""
-        return self.db.get_current_streak(user_id)
+        return self.cache.get_or_compute(
+            user_id, "streak", lambda: self.db.get_current_streak(user_id)
+        )
 
     def get_entry_selections(self, user_id: int, entry_id: int) -> List[Dict]:
         """Get selected options for an entry (with user verification)"""
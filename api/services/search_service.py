@@ -0,0 +1,56 @@
+from typing import Dict, List, Optional
+from api.database import MoodDatabase
+
+# Result pages are small: search is interactive and each hit carries a snippet.
+DEFAULT_SEARCH_LIMIT = 20
+MAX_SEARCH_LIMIT = 100
+MAX_QUERY_LENGTH = 200
+
+
+class SearchService:
+    def __init__(self, db: MoodDatabase):
+        self.db = db
+
+    def search_entries(
+        self,
+        user_id: int,
+        query: str,
+        limit: int = DEFAULT_SEARCH_LIMIT,
+        offset: int = 0,
+        moods: Optional[List[int]] = None,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+    ) -> Dict:
+        """Search a user's entries, best match first.
+
+        Returns ``{"results": [...], "next_offset": int | None}`` where each
+        result has the entry fields, an HTML-escaped ``snippet`` with
+        ``<mark>``-wrapped matches and its BM25 ``score``.
+        """
+        query = (query or "").strip()
+        if not query:
+            raise ValueError("q is required")
+        if len(query) > MAX_QUERY_LENGTH:
+            raise ValueError(f"q must be at most {MAX_QUERY_LENGTH} characters")
+        if not 1 <= limit <= MAX_SEARCH_LIMIT:
+            raise ValueError(f"limit must be between 1 and {MAX_SEARCH_LIMIT}")
+        if offset < 0:
+            raise ValueError("offset must be a non-negative integer")
+        if moods and any(not 1 <= mood <= 5 for mood in moods):
+            raise ValueError("mood must be between 1 and 5")
+        if (start_date is None) != (end_date is None):
+            raise ValueError("start_date and end_date must be given together")
+
+        hits, has_more = self.db.search_mood_entries(
+            user_id,
+            query,
+            limit=limit,
+            offset=offset,
+            moods=moods,
+            start_date=start_date,
+            end_date=end_date,
+        )
+        return {
+            "results": hits,
+            "next_offset": offset + len(hits) if has_more else None,
+        }
@@ -0,0 +1,274 @@
+import base64
+from datetime import date, timedelta
+from typing import Dict, List, Optional, Sequence
+from api.database import MoodDatabase
+from api.utils.analytics_cache import AnalyticsCache
+from api.utils.option_stats import option_totals
+
+TREND_BUCKETS = ("day", "week", "month")
+DEFAULT_TREND_RANGE = 30
+MAX_TREND_RANGE = 3660
+DEFAULT_TREND_WINDOW = 7
+MAX_TREND_WINDOW = 90
+MAX_CALENDAR_YEARS = 10
+MAX_TZ_OFFSET = 14 * 60
+
+
+def _bucket_start(day: date, bucket: str) -> date:
+    if bucket == "week":
+        return day - timedelta(days=day.weekday())
+    if bucket == "month":
+        return day.replace(day=1)
+    return day
+
+
+class StatisticsService:
+    """Range-bound analytics read from the per-day rollups.
+
+    Results are read through the analytics cache, so repeat requests
+    against unchanged data skip the queries entirely.
+    """
+
+    def __init__(self, db: MoodDatabase, cache: Optional[AnalyticsCache] = None):
+        self.db = db
+        self.cache = cache if cache is not None else AnalyticsCache(db, 0)
+
+    def get_trend(
+        self,
+        user_id: int,
+        range_days: int = DEFAULT_TREND_RANGE,
+        bucket: str = "day",
+        window: int = DEFAULT_TREND_WINDOW,
+        today: Optional[date] = None,
+    ) -> Dict:
+        return self.cache.get_or_compute(
+            user_id,
+            "trend",
+            lambda: self._trend(user_id, range_days, bucket, window, today),
+            (range_days, bucket, window, today),
+        )
+
+    def get_option_stats(self, user_id: int) -> Dict:
+        return self.cache.get_or_compute(
+            user_id, "options", lambda: self._option_stats(user_id)
+        )
+
+    def get_calendar(self, user_id: int, years: Sequence[int]) -> Dict:
+        return self.cache.get_or_compute(
+            user_id, "calendar", lambda: self._calendar(user_id, years), tuple(years)
+        )
+
+    def get_patterns(self, user_id: int, offset_minutes: int = 0) -> Dict:
+        return self.cache.get_or_compute(
+            user_id,
+            "patterns",
+            lambda: self._patterns(user_id, offset_minutes),
+            (offset_minutes,),
+        )
+
+    def _trend(
+        self,
+        user_id: int,
+        range_days: int,
+        bucket: str,
+        window: int,
+        today: Optional[date],
+    ) -> Dict:
+        """Bucketed mood averages over the last ``range_days`` days.
+
+        Every bucket in the range is present, empty ones with ``entries`` 0
+        and null moods. Weeks start on Monday. ``moving_average`` is the mean
+        of the non-empty bucket averages among the last ``window`` buckets,
+        matching the chart's smoothing. Cost depends on the range only.
+        """
+        if bucket not in TREND_BUCKETS:
+            raise ValueError(f"bucket must be one of: {', '.join(TREND_BUCKETS)}")
+        if not 1 <= range_days <= MAX_TREND_RANGE:
+            raise ValueError(f"range must be between 1 and {MAX_TREND_RANGE} days")
+        if not 1 <= window <= MAX_TREND_WINDOW:
+            raise ValueError(f"window must be between 1 and {MAX_TREND_WINDOW}")
+
+        end = today or date.today()
+        start = end - timedelta(days=range_days - 1)
+        rollups = self.db.get_daily_rollups(
+            user_id, start.toordinal(), end.toordinal()
+        )
+
+        points: Dict[date, Dict] = {}
+        day = start
+        while day <= end:
+            key = _bucket_start(day, bucket)
+            if key not in points:
+                points[key] = {"entries": 0, "sum": 0, "min": None, "max": None}
+            day += timedelta(days=1)
+        for ordinal, entries, mood_sum, mood_min, mood_max in rollups:
+            point = points[_bucket_start(date.fromordinal(ordinal), bucket)]
+            point["entries"] += entries
+            point["sum"] += mood_sum
+            point["min"] = min(mood_min, point["min"] or mood_min)
+            point["max"] = max(mood_max, point["max"] or mood_max)
+
+        series: List[Dict] = []
+        averages: List[Optional[float]] = []
+        for key, point in points.items():
+            average = point["sum"] / point["entries"] if point["entries"] else None
+            averages.append(average)
+            recent = [value for value in averages[-window:] if value is not None]
+            series.append(
+                {
+                    "date": key.isoformat(),
+                    "entries": point["entries"],
+                    "average_mood": round(average, 2) if average is not None else None,
+                    "lowest_mood": point["min"],
+                    "highest_mood": point["max"],
+                    "moving_average": (
+                        round(sum(recent) / len(recent), 2) if recent else None
+                    ),
+                }
+            )
+
+        return {
+            "bucket": bucket,
+            "window": window,
+            "start_date": start.isoformat(),
+            "end_date": end.isoformat(),
+            "points": series,
+        }
+
+    def _option_stats(self, user_id: int) -> Dict:
+        """Per-option counts, mean mood and lift, plus pairwise co-occurrence.
+
+        ``lift`` is the option's mean mood minus the user's overall mean
+        (``baseline``), so positive values mark options that come with
+        better days. Options are ordered by count, most used first, and
+        ``co_occurrence.matrix`` follows the same order.
+        """
+        total, mood_sum = self.db.get_mood_totals(user_id)
+        baseline = mood_sum / total if total else None
+
+        option_ids, counts, sums, pairs = option_totals(
+            self.db.get_option_mood_rows(user_id)
+        )
+        labels = {
+            option["id"]: (option["name"], group["name"])
+            for group in self.db.get_all_groups()
+            for option in group["options"]
+        }
+        order = sorted(
+            range(len(option_ids)), key=lambda i: (-counts[i], option_ids[i])
+        )
+
+        options = []
+        for i in order:
+            name, group_name = labels.get(option_ids[i], (None, None))
+            average = sums[i] / counts[i]
+            options.append(
+                {
+                    "id": option_ids[i],
+                    "name": name,
+                    "group_name": group_name,
+                    "count": counts[i],
+                    "average_mood": round(average, 2),
+                    "lift": round(average - baseline, 2),
+                }
+            )
+        return {
+            "baseline": {
+                "entries": total,
+                "average_mood": round(baseline, 2) if total else None,
+            },
+            "options": options,
+            "co_occurrence": {
+                "option_ids": [option_ids[i] for i in order],
+                "matrix": [[pairs[i][j] for j in order] for i in order],
+            },
+        }
+
+    def _calendar(self, user_id: int, years: Sequence[int]) -> Dict:
+        """One byte per day of each year: the day's mood, 0 when empty.
+
+        The value is the day's mean mood rounded half up, so a year packs
+        into 365 or 366 bytes, sent base64-encoded. Byte ``i`` is day ``i``
+        counted from 1 January.
+        """
+        if not years:
+            raise ValueError("year is required")
+        if len(years) > MAX_CALENDAR_YEARS:
+            raise ValueError(f"At most {MAX_CALENDAR_YEARS} years per request")
+        if any(not 1 <= year <= 9999 for year in years):
+            raise ValueError("year must be between 1 and 9999")
+
+        calendars = []
+        for year in sorted(set(years)):
+            first = date(year, 1, 1).toordinal()
+            last = date(year, 12, 31).toordinal()
+            moods = bytearray(last - first + 1)
+            for day, entries, mood_sum, _, _ in self.db.get_daily_rollups(
+                user_id, first, last
+            ):
+                moods[day - first] = (2 * mood_sum + entries) // (2 * entries)
+            calendars.append(
+                {
+                    "year": year,
+                    "days": len(moods),
+                    "moods": base64.b64encode(moods).decode("ascii"),
+                }
+            )
+        return {"encoding": "base64", "calendars": calendars}
+
+    def _patterns(self, user_id: int, offset_minutes: int) -> Dict:
+        """Mean mood and counts by weekday, by hour and by weekday x hour.
+
+        Weekdays run Monday (0) to Sunday (6) and follow the entry's date;
+        hours are creation times moved ``offset_minutes`` east of UTC.
+        ``matrix`` rows are weekdays and columns hours. The whole result
+        comes from a single grouped pass of at most 168 rows.
+        """
+        if not -MAX_TZ_OFFSET <= offset_minutes <= MAX_TZ_OFFSET:
+            raise ValueError(
+                f"tz_offset must be between -{MAX_TZ_OFFSET} and {MAX_TZ_OFFSET}"
+            )
+
+        counts = [[0] * 24 for _ in range(7)]
+        sums = [[0] * 24 for _ in range(7)]
+        for weekday, hour, entries, mood_sum in self.db.get_mood_patterns(
+            user_id, offset_minutes
+        ):
+            counts[weekday][hour] = entries
+            sums[weekday][hour] = mood_sum
+
+        def cell(entries: int, mood_sum: int) -> Optional[float]:
+            return round(mood_sum / entries, 2) if entries else None
+
+        weekdays = []
+        for weekday in range(7):
+            entries = sum(counts[weekday])
+            weekdays.append(
+                {
+                    "weekday": weekday,
+                    "entries": entries,
+                    "average_mood": cell(entries, sum(sums[weekday])),
+                }
+            )
+        hours = []
+        for hour in range(24):
+            entries = sum(row[hour] for row in counts)
+            hours.append(
+                {
+                    "hour": hour,
+                    "entries": entries,
+                    "average_mood": cell(entries, sum(row[hour] for row in sums)),
+                }
+            )
+        return {
+            "tz_offset": offset_minutes,
+            "weekdays": weekdays,
+            "hours": hours,
+            "matrix": {
+                "entries": counts,
+                "average_mood": [
+                    [cell(n, total) for n, total in zip(*row)]
+                    for row in zip(counts, sums)
+                ],
+            },
+        }
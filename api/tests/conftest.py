@@ -1,8 +1,74 @@
 # Ensure the api package is importable during tests
+import os
 import sys
 from pathlib import Path
 
+import pytest
+
 root = Path(__file__).resolve().parent.parent
 api_dir = root / "api"
 if str(api_dir) not in sys.path:
     sys.path.insert(0, str(api_dir))
+
+from api.app import create_app  # noqa: E402
+from api.database import MoodDatabase  # noqa: E402
+
+# Matches TestingConfig.DATABASE_PATH
+TEST_DB_PATH = "/tmp/nightlio_test.db"
+
+
+def _remove_test_db():
+    if os.path.exists(TEST_DB_PATH):
+        os.remove(TEST_DB_PATH)
+
+
+@pytest.fixture()
+def app_factory():
+    """Build testing apps on a fresh database, closing the previous one first."""
+    apps = []
+
+    def close_all():
+        # Flush buffered counters and release pooled connections before the
+        # file goes, so nothing writes to a deleted database later on.
+        while apps:
+            apps.pop().extensions["user_service"].db.close()
+
+    def make():
+        close_all()
+        _remove_test_db()
+        application = create_app("testing")
+        apps.append(application)
+        return application
+
+    yield make
+    close_all()
+    _remove_test_db()
+
+
+@pytest.fixture()
+def app(app_factory):
+    return app_factory()
+
+
+@pytest.fixture()
+def client(app):
+    with app.test_client() as test_client:
+        yield test_client
+
+
+@pytest.fixture()
+def headers(client):
+    token = client.post("/api/auth/local/login").get_json()["token"]
+    return {"Authorization": f"Bearer {token}"}
+
+
+@pytest.fixture()
+def db(tmp_path):
+    database = MoodDatabase(str(tmp_path / "test.db"))
+    yield database
+    database.close()
+
+
+@pytest.fixture()
+def user_id(db):
+    return db.upsert_user_by_google_id("test-user", "test@example.com", "Test")["id"]
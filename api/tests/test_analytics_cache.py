@@ -0,0 +1,89 @@
+import pytest
+
+from api.services.achievement_service import AchievementService
+from api.services.mood_service import MoodService
+from api.services.statistics_service import StatisticsService
+from api.utils.analytics_cache import AnalyticsCache
+
+
+def test_results_are_reused_until_the_data_version_moves(db, user_id):
+    cache = AnalyticsCache(db)
+    calls = []
+
+    def compute():
+        calls.append(1)
+        return {"entries": len(calls)}
+
+    assert cache.get_or_compute(user_id, "x", compute) == {"entries": 1}
+    assert cache.get_or_compute(user_id, "x", compute) == {"entries": 1}
+    assert cache.get_or_compute(user_id, "x", compute, (2,)) == {"entries": 2}
+
+    db.add_mood_entry(user_id, "01/01/2024", 3, "write")
+    assert cache.get_or_compute(user_id, "x", compute) == {"entries": 3}
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 3
+
+
+def test_lru_respects_entry_and_byte_budgets(db, user_id):
+    cache = AnalyticsCache(db, max_entries=2, max_bytes=100)
+    for endpoint in ("a", "b", "c"):
+        cache.get_or_compute(user_id, endpoint, lambda: [endpoint])
+    stats = cache.stats()
+    assert (stats["entries"], stats["evictions"]) == (2, 1)
+
+    # "b" is the least recently used once "c" has been read again
+    cache.get_or_compute(user_id, "c", lambda: pytest.fail("should hit"))
+    cache.get_or_compute(user_id, "big", lambda: "x" * 60)
+    assert cache.stats()["entries"] == 2
+    cache.get_or_compute(user_id, "c", lambda: pytest.fail("should hit"))
+
+    cache.get_or_compute(user_id, "huge", lambda: "x" * 200)
+    assert cache.stats()["bytes"] <= 100
+    assert cache.stats()["entries"] == 2
+
+
+def test_disabled_cache_always_computes(db, user_id):
+    cache = AnalyticsCache(db, max_entries=0)
+    values = iter(range(10))
+    assert cache.get_or_compute(user_id, "x", lambda: next(values)) == 0
+    assert cache.get_or_compute(user_id, "x", lambda: next(values)) == 1
+    assert cache.stats()["misses"] == 0
+
+
+def test_services_share_results_and_see_writes(db, user_id):
+    cache = AnalyticsCache(db)
+    moods = MoodService(db, cache=cache)
+    achievements = AchievementService(db, cache=cache)
+    statistics = StatisticsService(db, cache=cache)
+    db.add_mood_entry(user_id, "01/01/2024", 4, "first")
+
+    first = moods.get_statistics(user_id)
+    assert moods.get_statistics(user_id) is first
+    assert statistics.get_patterns(user_id) is statistics.get_patterns(user_id)
+
+    # Views are counted on every call but are not part of the data version
+    progress = achievements.get_achievements_progress(user_id)
+    assert progress["data_lover"]["current"] == 2
+    moods.get_statistics(user_id)
+    progress = achievements.get_achievements_progress(user_id)
+    assert progress["data_lover"]["current"] == 3
+
+    moods.create_mood_entry(user_id, "01/02/2024", 2, "second")
+    assert moods.get_statistics(user_id)["statistics"]["total_entries"] == 2
+    patterns = statistics.get_patterns(user_id)
+    assert sum(day["entries"] for day in patterns["weekdays"]) == 2
+    assert cache.stats()["hits"] == 3
+
+
+def test_progress_endpoint_reads_through_the_cache(client, headers):
+    client.post(
+        "/api/mood",
+        json={"mood": 5, "date": "01/01/2024", "content": "x"},
+        headers=headers,
+    )
+    cache = client.application.extensions["analytics_cache"]
+    for _ in range(2):
+        response = client.get("/api/achievements/progress", headers=headers)
+        assert response.status_code == 200
+        assert response.get_json()["first_entry"] == {"current": 1, "max": 1}
+    assert cache.stats()["hits"] >= 1
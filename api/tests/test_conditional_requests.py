@@ -0,0 +1,165 @@
+import sqlite3
+from datetime import date
+
+import pytest
+
+from api.utils import conditional
+
+CONDITIONAL_ENDPOINTS = [
+    "/api/moods",
+    "/api/statistics",
+    "/api/streak",
+    "/api/goals",
+    "/api/achievements",
+    "/api/achievements/progress",
+]
+
+
+def _etag(client, headers, path="/api/moods"):
+    response = client.get(path, headers=headers)
+    assert response.status_code == 200
+    assert response.headers["ETag"].startswith('W/"')
+    return response.headers["ETag"]
+
+
+def _revalidate(client, headers, path, etag):
+    return client.get(path, headers={**headers, "If-None-Match": etag})
+
+
+def _create_entry(client, headers, **fields):
+    payload = {"mood": 4, "date": "06/01/2024", "content": "hello", **fields}
+    response = client.post("/api/mood", json=payload, headers=headers)
+    assert response.status_code == 201
+    return response.get_json()["entry_id"]
+
+
+@pytest.mark.parametrize("path", CONDITIONAL_ENDPOINTS)
+def test_unchanged_data_answers_304(client, headers, path):
+    _create_entry(client, headers)
+    etag = _etag(client, headers, path)
+
+    response = _revalidate(client, headers, path, etag)
+    assert response.status_code == 304
+    assert response.data == b""
+    assert response.headers["ETag"] == etag
+    assert "private" in response.headers["Cache-Control"]
+    assert "Authorization" in response.headers["Vary"]
+
+
+def _entry_mutations(client, headers):
+    entry_id = _create_entry(client, headers, selected_options=[1])
+    yield
+    client.put(f"/api/mood/{entry_id}", json={"mood": 2}, headers=headers)
+    yield
+    client.put(f"/api/mood/{entry_id}", json={"selected_options": [2]}, headers=headers)
+    yield
+    client.post(
+        "/api/moods/bulk",
+        json=[{"mood": 3, "date": "06/02/2024", "content": "bulk"}],
+        headers=headers,
+    )
+    yield
+    client.post(
+        "/api/import?format=ndjson",
+        data=b'{"date": "06/03/2024", "mood": 5, "content": "imported"}\n',
+        headers=headers,
+    )
+    yield
+    client.delete(f"/api/mood/{entry_id}", headers=headers)
+    yield
+
+
+def test_every_entry_mutation_invalidates_the_etag(client, headers):
+    etag = _etag(client, headers)
+    for _ in _entry_mutations(client, headers):
+        assert _revalidate(client, headers, "/api/moods", etag).status_code == 200
+        etag = _etag(client, headers)
+
+
+def test_goal_mutations_invalidate_the_etag(client, headers):
+    etag = _etag(client, headers, "/api/goals")
+    response = client.post(
+        "/api/goals", json={"title": "Walk", "frequency_per_week": 3}, headers=headers
+    )
+    goal_id = response.get_json()["id"]
+    mutations = [
+        lambda: client.put(
+            f"/api/goals/{goal_id}", json={"title": "Run"}, headers=headers
+        ),
+        lambda: client.post(f"/api/goals/{goal_id}/progress", headers=headers),
+        lambda: client.delete(f"/api/goals/{goal_id}", headers=headers),
+    ]
+    for mutate in [lambda: None] + mutations:
+        mutate()
+        assert _revalidate(client, headers, "/api/goals", etag).status_code == 200
+        etag = _etag(client, headers, "/api/goals")
+
+
+def test_awarding_an_achievement_invalidates_the_etag(client, headers):
+    etag = _etag(client, headers, "/api/achievements")
+    _create_entry(client, headers)  # awards first_entry
+    achievements = client.get("/api/achievements", headers=headers).get_json()
+    assert any(a["achievement_type"] == "first_entry" for a in achievements)
+    assert _revalidate(client, headers, "/api/achievements", etag).status_code == 200
+
+
+def test_deleting_an_option_invalidates_entries_using_it(client, headers):
+    group = client.post("/api/groups", json={"name": "Weather"}, headers=headers)
+    group_id = group.get_json()["group_id"]
+    option = client.post(
+        f"/api/groups/{group_id}/options", json={"name": "Sunny"}, headers=headers
+    )
+    option_id = option.get_json()["option_id"]
+    _create_entry(client, headers, selected_options=[option_id])
+    etag = _etag(client, headers)
+
+    client.delete(f"/api/options/{option_id}", headers=headers)
+    assert _revalidate(client, headers, "/api/moods", etag).status_code == 200
+
+
+def test_not_modified_statistics_still_count_the_view(client, headers):
+    etag = _etag(client, headers, "/api/statistics")
+    progress_etag = _etag(client, headers, "/api/achievements/progress")
+
+    assert _revalidate(client, headers, "/api/statistics", etag).status_code == 304
+    progress = _revalidate(client, headers, "/api/achievements/progress", progress_etag)
+    assert progress.status_code == 200
+    assert progress.get_json()["data_lover"]["current"] == 2
+
+
+def test_etag_rolls_over_at_midnight(client, headers, monkeypatch):
+    etag = _etag(client, headers, "/api/streak")
+
+    class Tomorrow(date):
+        @classmethod
+        def today(cls):
+            return date.fromordinal(date.today().toordinal() + 1)
+
+    monkeypatch.setattr(conditional, "date", Tomorrow)
+    assert _revalidate(client, headers, "/api/streak", etag).status_code == 200
+
+
+def test_users_do_not_share_versions(client, headers):
+    db = client.application.extensions["user_service"].db
+    other = db.upsert_user_by_google_id("other", "o@example.com", "Other")["id"]
+    etag = _etag(client, headers)
+    db.add_mood_entry(other, "06/05/2024", 3, "someone else")
+    assert _revalidate(client, headers, "/api/moods", etag).status_code == 304
+
+
+def test_each_entry_write_bumps_the_version_once(db, user_id):
+    entry_id = db.add_mood_entry(user_id, "06/05/2024", 3, "hello")
+    assert db.get_data_version(user_id) == 1
+    assert db.update_mood_entry(user_id, entry_id, mood=4) is True
+    assert db.get_data_version(user_id) == 2
+    assert db.delete_mood_entry(user_id, entry_id) is True
+    assert db.get_data_version(user_id) == 3
+
+    # Each selection row is a write of its own; the stamp still matches.
+    entry_id = db.add_mood_entry(user_id, "06/06/2024", 3, "", None, [1, 2])
+    assert db.get_data_version(user_id) == 6
+    with sqlite3.connect(db.db_path) as conn:
+        seq = conn.execute(
+            "SELECT change_seq FROM mood_entries WHERE id = ?", (entry_id,)
+        ).fetchone()[0]
+    assert seq == 6
@@ -0,0 +1,89 @@
+import sqlite3
+import threading
+
+import pytest
+
+from api.database import MoodDatabase
+
+
+@pytest.fixture()
+def db(tmp_path):
+    database = MoodDatabase(str(tmp_path / "pool.db"), pool_size=2, pool_max_uses=50)
+    yield database
+    database.close()
+
+
+def test_sequential_calls_reuse_one_connection(db, user_id):
+    opened = db._pool.stats()["opened"]
+    entry_id = db.add_mood_entry(user_id, "2024-01-02", 3, "hello")
+    for _ in range(3):
+        assert db.get_mood_entry_by_id(user_id, entry_id)["mood"] == 3
+    assert db._pool.stats()["opened"] == opened
+
+
+def test_pooled_connections_have_pragmas_and_clean_state(db, user_id):
+    with db._connect() as conn:
+        conn.row_factory = sqlite3.Row
+        assert conn.execute("PRAGMA foreign_keys").fetchone()[0] == 1
+    with db._connect() as conn:
+        assert conn.row_factory is None
+        assert not conn.in_transaction
+
+
+def test_connections_recycled_after_max_uses(db, user_id):
+    db._pool.max_uses = 5
+    for _ in range(12):
+        db.get_user_by_id(user_id)
+    assert db._pool.stats()["recycled"] >= 2
+
+
+def test_connection_recycled_after_error(db, user_id):
+    recycled = db._pool.stats()["recycled"]
+    with pytest.raises(sqlite3.Error):
+        with db._connect() as conn:
+            conn.execute("SELECT * FROM missing_table")
+    assert db._pool.stats()["recycled"] == recycled + 1
+
+
+def test_rollback_on_error_returns_clean_connection(db, user_id):
+    with pytest.raises(RuntimeError):
+        with db._connect() as conn:
+            conn.execute(
+                "INSERT INTO mood_entries (user_id, date, mood, content) VALUES (?, ?, ?, ?)",
+                (user_id, "2024-01-03", 2, "rolled back"),
+            )
+            raise RuntimeError("boom")
+    assert db.get_all_mood_entries(user_id) == []
+
+
+def test_pool_is_safe_across_threads(db, user_id):
+    errors = []
+
+    def worker(n):
+        try:
+            for i in range(10):
+                entry_id = db.add_mood_entry(
+                    user_id, "2024-02-01", 1 + (i % 5), f"t{n}-{i}"
+                )
+                assert db.get_mood_entry_by_id(user_id, entry_id)
+        except Exception as exc:  # pragma: no cover - surfaced below
+            errors.append(exc)
+
+    threads = [threading.Thread(target=worker, args=(n,)) for n in range(6)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert errors == []
+    assert len(db.get_all_mood_entries(user_id)) == 60
+    assert db._pool.stats()["idle"] <= db._pool.max_size
+
+
+def test_pool_drops_connections_inherited_across_fork(db, user_id):
+    db.get_user_by_id(user_id)
+    assert db._pool.stats()["idle"] == 1
+    db._pool._pid = -1  # pretend we are now running in a forked child
+    opened = db._pool.stats()["opened"]
+    db.get_user_by_id(user_id)
+    assert db._pool.stats()["opened"] == opened + 1
@@ -0,0 +1,77 @@
+import sqlite3
+from datetime import date, timedelta
+
+import pytest
+
+from api.database import MoodDatabase
+
+
+def test_date_range_spans_year_boundary(db, user_id):
+    # Lexically "12/31/2023" sorts after "01/02/2024"; by day it does not.
+    for day in ("12/30/2023", "12/31/2023", "01/01/2024", "2024-01-02", "02/01/2024"):
+        db.add_mood_entry(user_id, day, 3, day)
+
+    entries = db.get_mood_entries_by_date_range(user_id, "12/31/2023", "01/02/2024")
+    assert sorted(e.date for e in entries) == [
+        "01/01/2024",
+        "12/31/2023",
+        "2024-01-02",
+    ]
+
+
+def test_invalid_range_bound_raises(db, user_id):
+    with pytest.raises(ValueError):
+        db.get_mood_entries_by_date_range(user_id, "yesterday", "01/02/2024")
+
+
+def test_update_recomputes_entry_day(db, user_id):
+    entry_id = db.add_mood_entry(user_id, "01/05/2024", 3, "x")
+    db.update_mood_entry(user_id, entry_id, date="03/05/2024")
+    assert db.get_mood_entries_by_date_range(user_id, "03/01/2024", "03/31/2024")
+    assert not db.get_mood_entries_by_date_range(user_id, "01/01/2024", "01/31/2024")
+
+
+def test_statistics_first_and_last_dates_are_chronological(db, user_id):
+    for day in ("02/01/2024", "12/31/2023", "2024-01-15"):
+        db.add_mood_entry(user_id, day, 3, day)
+    stats = db.get_mood_statistics(user_id)
+    assert stats["first_entry_date"] == "12/31/2023"
+    assert stats["last_entry_date"] == "02/01/2024"
+
+
+def test_streak_counts_mixed_formats_once_per_day(db, user_id):
+    today = date.today()
+    db.add_mood_entry(user_id, today.strftime("%m/%d/%Y"), 4, "a")
+    db.add_mood_entry(user_id, today.isoformat(), 4, "same day")
+    db.add_mood_entry(user_id, (today - timedelta(days=1)).strftime("%m/%d/%Y"), 4, "b")
+    db.add_mood_entry(user_id, (today - timedelta(days=3)).strftime("%m/%d/%Y"), 4, "c")
+    assert db.get_current_streak(user_id) == 2
+
+
+def test_migration_backfills_existing_rows_in_chunks(tmp_path, monkeypatch):
+    path = str(tmp_path / "legacy.db")
+    legacy = MoodDatabase(path)
+    legacy.close()
+    with sqlite3.connect(path) as conn:
+        conn.execute("DROP INDEX idx_mood_entries_user_day")
+        for name in ("summary", "rollup"):
+            for suffix in ("ai", "ad", "au"):
+                conn.execute(f"DROP TRIGGER mood_entries_{name}_{suffix}")
+        conn.execute("ALTER TABLE mood_entries DROP COLUMN entry_day")
+        conn.execute(
+            "INSERT INTO users (google_id, email, name) VALUES ('legacy', 'l@x', 'L')"
+        )
+        conn.executemany(
+            "INSERT INTO mood_entries (user_id, date, mood, content) VALUES (1, ?, 3, '')",
+            [("01/%02d/2024" % d,) for d in range(1, 26)] + [("not a date",)],
+        )
+        conn.execute("PRAGMA user_version = 2")
+
+    monkeypatch.setattr(MoodDatabase, "BACKFILL_CHUNK_SIZE", 4)
+    db = MoodDatabase(path)
+    with sqlite3.connect(path) as conn:
+        days = dict(conn.execute("SELECT date, entry_day FROM mood_entries"))
+    assert days["01/10/2024"] == date(2024, 1, 10).toordinal()
+    assert days["not a date"] is None
+    assert len(db.get_mood_entries_by_date_range(1, "2024-01-01", "2024-01-31")) == 25
+    db.close()
@@ -0,0 +1,72 @@
+import csv
+import gzip
+import io
+import json
+
+import pytest
+
+
+@pytest.fixture()
+def seeded(client, headers):
+    entries = [
+        {
+            "mood": 1 + day % 5,
+            "date": f"04/{day:02d}/2024",
+            "content": f"line one\nline, two \"{day}\"",
+            "selected_options": [1, 2] if day % 2 else [],
+        }
+        for day in range(1, 13)
+    ]
+    response = client.post("/api/moods/bulk", json=entries, headers=headers)
+    assert response.status_code == 201
+    return entries
+
+
+def _get(client, headers, query, **extra):
+    return client.get(f"/api/export?{query}", headers={**headers, **extra})
+
+
+def test_ndjson_export_streams_every_entry_with_selections(client, headers, seeded):
+    response = _get(client, headers, "format=ndjson")
+    assert response.status_code == 200
+    assert response.is_streamed
+    assert response.mimetype == "application/x-ndjson"
+    assert "attachment" in response.headers["Content-Disposition"]
+
+    rows = [json.loads(line) for line in response.data.decode().splitlines()]
+    assert [r["date"] for r in rows] == [e["date"] for e in seeded]
+    assert rows[0]["content"] == seeded[0]["content"]
+    assert sorted(s["id"] for s in rows[0]["selections"]) == [1, 2]
+    assert rows[1]["selections"] == []
+
+
+def test_csv_export_round_trips_through_csv_reader(client, headers, seeded):
+    response = _get(client, headers, "format=csv")
+    assert response.status_code == 200
+    reader = csv.DictReader(io.StringIO(response.data.decode()))
+    rows = list(reader)
+    assert len(rows) == len(seeded)
+    assert rows[2]["content"] == seeded[2]["content"]
+    assert rows[0]["selections"].count(" | ") == 1
+
+
+def test_export_date_range_and_gzip(client, headers, seeded):
+    response = _get(
+        client,
+        headers,
+        "start_date=04/03/2024&end_date=04/05/2024",
+        **{"Accept-Encoding": "gzip"},
+    )
+    assert response.headers["Content-Encoding"] == "gzip"
+    lines = gzip.decompress(response.data).decode().splitlines()
+    assert [json.loads(line)["date"] for line in lines] == [
+        "04/03/2024",
+        "04/04/2024",
+        "04/05/2024",
+    ]
+
+
+def test_export_rejects_bad_arguments(client, headers):
+    assert _get(client, headers, "format=xml").status_code == 400
+    assert _get(client, headers, "start_date=04/03/2024").status_code == 400
+    assert _get(client, headers, "start_date=x&end_date=y").status_code == 400
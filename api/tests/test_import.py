@@ -0,0 +1,112 @@
+import io
+
+import pytest
+
+from api.database import MoodDatabase
+from api.scripts.import_entries import import_file
+
+DAYLIO_CSV = (
+    "\ufefffull_date,date,weekday,time,mood,activities,note_title,note\n"
+    "2024-02-03,February 3,Saturday,9:15 PM,rad,Happy | Productive,Great day,"
+    '"Went out<br>Had fun, really"\n'
+    "2024-02-02,February 2,Friday,08:00,meh,Tired | Gardening,,\n"
+    "2024-02-01,February 1,Thursday,7:30 AM,awful,,,Rough\n"
+    "2024-01-31,January 31,Wednesday,7:30 AM,sleepy,,,Unknown mood\n"
+)
+
+
+def _upload(client, headers, text, name="daylio.csv", query=""):
+    return client.post(
+        f"/api/import{query}",
+        headers=headers,
+        data={"file": (io.BytesIO(text.encode("utf-8")), name)},
+        content_type="multipart/form-data",
+    )
+
+
+def test_daylio_import_maps_moods_activities_and_is_idempotent(client, headers):
+    first = _upload(client, headers, DAYLIO_CSV).get_json()
+    assert first["format"] == "daylio"
+    assert (first["rows"], first["inserted"], first["failed"]) == (4, 3, 1)
+    assert first["errors"][0]["line"] == 5
+    assert first["unknown_activities"] == {"Productive": 1, "Gardening": 1}
+    assert "first_entry" in first["new_achievements"]
+
+    again = _upload(client, headers, DAYLIO_CSV).get_json()
+    assert (again["inserted"], again["skipped"]) == (0, 3)
+
+    entries = client.get("/api/moods?include=selections", headers=headers).get_json()
+    assert len(entries) == 3
+    by_date = {e["date"]: e for e in entries}
+    best = by_date["02/03/2024"]
+    assert best["mood"] == 5
+    assert best["content"] == "Great day\n\nWent out\nHad fun, really"
+    assert best["created_at"] == "2024-02-03 21:15:00"
+    assert [s["name"] for s in best["selections"]] == ["happy"]
+    assert [s["name"] for s in by_date["02/02/2024"]["selections"]] == ["tired"]
+    assert by_date["02/01/2024"]["mood"] == 1
+
+
+@pytest.mark.parametrize(
+    "tz_offset, created_at",
+    [("120", "2024-02-03 19:15:00"), ("-300", "2024-02-04 02:15:00")],
+)
+def test_daylio_times_are_stored_as_utc(client, headers, tz_offset, created_at):
+    summary = _upload(client, headers, DAYLIO_CSV, query=f"?tz_offset={tz_offset}")
+    assert summary.get_json()["inserted"] == 3
+    entries = client.get("/api/moods", headers=headers).get_json()
+    by_date = {e["date"]: e for e in entries}
+    # The wall-clock day stays the entry's date even when UTC has moved on
+    assert by_date["02/03/2024"]["created_at"] == created_at
+
+    bad = _upload(client, headers, DAYLIO_CSV, query="?tz_offset=9000")
+    assert bad.status_code == 400
+
+
+def test_create_missing_adds_imported_options(client, headers):
+    summary = _upload(client, headers, DAYLIO_CSV, query="?create_missing=1").get_json()
+    assert summary["unknown_activities"] == {}
+    groups = {g["name"]: g for g in client.get("/api/groups").get_json()}
+    assert {o["name"] for o in groups["Imported"]["options"]} == {"Productive", "Gardening"}
+
+
+def test_ndjson_export_round_trips_through_import(client, headers):
+    _upload(client, headers, DAYLIO_CSV)
+    exported = client.get("/api/export?format=ndjson", headers=headers).data.decode()
+
+    raw = client.post(
+        "/api/import?format=ndjson", headers=headers, data=exported.encode()
+    ).get_json()
+    # Rows created by the Daylio import are keyed differently from the export
+    assert raw["inserted"] == 3
+    repeat = client.post("/api/import", headers=headers, data=exported.encode())
+    assert repeat.get_json()["skipped"] == 3
+
+
+def test_import_rejects_unsupported_input(client, headers):
+    assert _upload(client, headers, "").status_code == 400
+    assert _upload(client, headers, "a,b\n1,2\n").status_code == 400
+    assert _upload(client, headers, "x", query="?format=xml").status_code == 400
+
+
+def test_cli_imports_in_chunks_with_progress(tmp_path, capsys):
+    path = tmp_path / "daylio.csv"
+    rows = [
+        f"2023-03-{d:02d},March {d},Day,10:00,good,Happy,,note {d}"
+        for d in range(1, 29)
+    ]
+    header = "full_date,date,weekday,time,mood,activities,note_title,note\n"
+    path.write_text(header + "\n".join(rows) + "\n", encoding="utf-8")
+    db_path = str(tmp_path / "cli.db")
+    db = MoodDatabase(db_path)
+    user_id = db.upsert_user_by_google_id("cli", "c@example.com", "CLI")["id"]
+    db.close()
+
+    summary = import_file(str(path), user_id=user_id, chunk_size=10, db_path=db_path)
+    assert summary["inserted"] == 28
+    progress = capsys.readouterr().err.strip().splitlines()
+    assert len(progress) == 3
+    assert progress[-1].startswith("28 rows read, 28 inserted")
+
+    again = import_file(str(path), user_id=user_id, chunk_size=10, db_path=db_path)
+    assert (again["inserted"], again["skipped"]) == (0, 28)
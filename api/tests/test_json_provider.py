@@ -0,0 +1,112 @@
+import json
+from datetime import date, datetime
+
+import pytest
+from flask import Flask
+from flask.json.provider import DefaultJSONProvider
+
+from api.utils import json_provider
+from api.utils.json_provider import FastJSONProvider, install_json_provider
+
+pytest.importorskip("orjson")
+
+
+def _bodies(obj, debug=False):
+    fast = Flask(__name__)
+    install_json_provider(fast)
+    stdlib = Flask(__name__)
+    fast.debug = stdlib.debug = debug
+    with fast.app_context():
+        fast_body = fast.json.response(obj).get_data()
+    with stdlib.app_context():
+        stdlib_body = stdlib.json.response(obj).get_data()
+    return fast_body, stdlib_body
+
+
+def test_installs_fast_provider():
+    app = Flask(__name__)
+    install_json_provider(app)
+    assert isinstance(app.json, FastJSONProvider)
+    assert isinstance(app.json, DefaultJSONProvider)
+
+
+@pytest.mark.parametrize(
+    "obj",
+    [
+        {"id": 1, "note": None, "mood": 4, "zeta": [1, 2, {"b": 0, "a": -7}]},
+        [{"created_at": datetime(2024, 3, 1, 9, 30, 5), "day": date(2024, 3, 1)}],
+        {"entries": [], "next_cursor": None, "has_more": False, "ratio": 0.25},
+        {"average_mood": 3.5, "total": 2**63 - 1},
+        None,
+        [],
+    ],
+)
+def test_matches_stdlib_output_byte_for_byte(obj):
+    fast, stdlib = _bodies(obj)
+    assert fast == stdlib
+
+
+def test_falls_back_for_values_orjson_rejects():
+    fast, stdlib = _bodies({"big": 2**70})
+    assert fast == stdlib
+
+
+@pytest.mark.parametrize(
+    "obj",
+    [
+        {"content": "Café ☕ with Zoë 😀", "ключ": "\u2028\x7f\x00"},
+        {"mood_distribution": {5: 1, 1: 0, 3: 2}, "total": 3},
+        {"notes": {1: "naïve", 2: "日本語"}},
+    ],
+)
+def test_non_ascii_and_int_keys_match_stdlib_bytes(obj):
+    fast, stdlib = _bodies(obj)
+    assert fast == stdlib
+    assert fast.isascii()
+
+
+def test_int_keys_sort_by_their_text():
+    fast, stdlib = _bodies({1: "one", 10: "ten", 2: "two"})
+    assert fast == b'{"1":"one","10":"ten","2":"two"}\n'
+    assert json.loads(fast) == json.loads(stdlib)
+
+
+def test_non_ascii_is_sent_as_utf8_without_ensure_ascii():
+    app = Flask(__name__)
+    install_json_provider(app)
+    app.json.ensure_ascii = False
+    with app.app_context():
+        body = app.json.response({"content": "Café ☕"}).get_data()
+    assert body == '{"content":"Café ☕"}\n'.encode("utf-8")
+
+
+def test_debug_output_stays_indented():
+    fast, stdlib = _bodies({"b": 1, "a": [1, 2]}, debug=True)
+    assert fast == stdlib
+    assert b"\n  " in fast
+
+
+def test_stdlib_fallback_when_orjson_is_missing(monkeypatch):
+    monkeypatch.setattr(json_provider, "orjson", None)
+    obj = {"content": "Café", "when": date(2024, 1, 2)}
+    fast, stdlib = _bodies(obj)
+    assert fast == stdlib
+
+
+@pytest.mark.parametrize("with_orjson", [True, False])
+def test_models_serialize_like_the_dicts_they_replace(monkeypatch, with_orjson):
+    from api.models.mood_entry import MoodEntry
+
+    if not with_orjson:
+        monkeypatch.setattr(json_provider, "orjson", None)
+    entries = [
+        MoodEntry(1, "03/01/2024", 4, "hi", "2024-03-01 09:00:00", None),
+        MoodEntry(2, "03/02/2024", 2, "meh", "2024-03-02 09:00:00", None, []),
+    ]
+    app = Flask(__name__)
+    install_json_provider(app)
+    with app.app_context():
+        body = app.json.response(entries).get_data()
+    _, expected = _bodies([entry.to_json() for entry in entries])
+    assert body == expected
+    assert b'"selections"' in body and body.count(b'"selections"') == 1
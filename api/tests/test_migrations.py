@@ -0,0 +1,104 @@
+import sqlite3
+import threading
+
+from api.database import MoodDatabase
+
+
+def _user_version(path):
+    with sqlite3.connect(path) as conn:
+        return conn.execute("PRAGMA user_version").fetchone()[0]
+
+
+def test_fresh_database_is_migrated_to_latest(tmp_path):
+    path = str(tmp_path / "fresh.db")
+    db = MoodDatabase(path)
+    assert _user_version(path) == MoodDatabase.schema_version()
+    names = [g["name"] for g in db.get_all_groups()]
+    assert names == ["Emotions", "Productivity", "Sleep"]
+    db.close()
+
+
+def test_legacy_unversioned_database_is_upgraded(tmp_path):
+    path = str(tmp_path / "legacy.db")
+    with sqlite3.connect(path) as conn:
+        conn.execute(
+            """
+            CREATE TABLE goals (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                user_id INTEGER NOT NULL,
+                title TEXT NOT NULL,
+                description TEXT,
+                frequency_per_week INTEGER NOT NULL,
+                completed INTEGER NOT NULL DEFAULT 0,
+                streak INTEGER NOT NULL DEFAULT 0,
+                period_start TEXT,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )
+            """
+        )
+        conn.execute(
+            "INSERT INTO goals (user_id, title, frequency_per_week) VALUES (1, 'Walk', 3)"
+        )
+
+    MoodDatabase(path).close()
+
+    assert _user_version(path) == MoodDatabase.schema_version()
+    with sqlite3.connect(path) as conn:
+        cols = {row[1] for row in conn.execute("PRAGMA table_info(goals)")}
+        assert "last_completed_date" in cols
+        assert conn.execute("SELECT title FROM goals").fetchone()[0] == "Walk"
+
+
+def test_up_to_date_boot_is_a_single_pragma_read(tmp_path):
+    path = str(tmp_path / "warm.db")
+    db = MoodDatabase(path)
+    statements = []
+    conn = db._pool.acquire()
+    conn.set_trace_callback(statements.append)
+    db._pool.release(conn)
+
+    db.init_database()
+
+    conn = db._pool.acquire()
+    conn.set_trace_callback(None)
+    db._pool.release(conn)
+    assert [s for s in statements if s != "SELECT 1"] == ["PRAGMA user_version"]
+    db.close()
+
+
+def test_concurrent_workers_migrate_once(tmp_path):
+    path = str(tmp_path / "race.db")
+    errors = []
+
+    def boot():
+        try:
+            MoodDatabase(path).close()
+        except Exception as exc:  # pragma: no cover - surfaced below
+            errors.append(exc)
+
+    threads = [threading.Thread(target=boot) for _ in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert errors == []
+    assert _user_version(path) == MoodDatabase.schema_version()
+    with sqlite3.connect(path) as conn:
+        assert conn.execute("SELECT COUNT(*) FROM groups").fetchone()[0] == 3
+
+
+def test_released_steps_do_not_read_shared_queries(tmp_path, monkeypatch):
+    from api.database_common import SQLQueries
+
+    for name in (
+        "REFRESH_MOOD_SUMMARY",
+        "COMPUTE_STREAK_STATE",
+        "UPSERT_STREAK_STATE",
+        "REFRESH_DAILY_ROLLUP",
+    ):
+        monkeypatch.setattr(SQLQueries, name, "not sql {user} {day}")
+    path = str(tmp_path / "frozen.db")
+    MoodDatabase(path).close()
+    assert _user_version(path) == MoodDatabase.schema_version()
@@ -40,3 +40,19 @@ def test_group_to_dict():
     assert len(result["options"]) == 1
     assert result["options"][0]["id"] == 1
     assert result["options"][0]["name"] == "Option 1"
+
+def test_mood_entry_is_slotted_and_built_from_rows():
+    entry = MoodEntry.row_factory(
+        None, (7, "10/10/2023", 3, "Fine", "2023-10-10 12:00:00", None)
+    )
+    assert not hasattr(entry, "__dict__")
+    assert entry.id == 7
+    assert entry.created_at == "2023-10-10 12:00:00"
+    assert entry.to_dict()["created_at"] == "2023-10-10 12:00:00"
+    assert entry.to_dict()["selections"] == []
+
+def test_mood_entry_to_json_includes_selections_only_when_loaded():
+    entry = MoodEntry(id=1, date="10/10/2023", mood=4, content="Good day")
+    assert "selections" not in entry.to_json()
+    entry.selections = []
+    assert entry.to_json()["selections"] == []
@@ -0,0 +1,53 @@
+def _entry(day, **overrides):
+    entry = {"mood": 4, "date": f"03/{day:02d}/2024", "content": f"day {day}"}
+    entry.update(overrides)
+    return entry
+
+
+def test_bulk_insert_creates_all_entries_and_selections(app, client, headers):
+    db = app.extensions["user_service"].db
+    db.BULK_INSERT_CHUNK_SIZE = 7
+    entries = [_entry(d, selected_options=[1, 2]) for d in range(1, 26)]
+
+    response = client.post("/api/moods/bulk", json=entries, headers=headers)
+    body = response.get_json()
+
+    assert response.status_code == 201, body
+    assert body["created"] == 25 and body["failed"] == 0
+    ids = [r["entry_id"] for r in body["results"]]
+    assert [r["index"] for r in body["results"]] == list(range(25))
+    assert len(set(ids)) == 25
+    assert "first_entry" in body["new_achievements"]
+
+    listing = client.get("/api/moods?include=selections", headers=headers).get_json()
+    by_id = {e["id"]: e for e in listing}
+    assert by_id[ids[3]]["content"] == "day 4"
+    assert sorted(s["id"] for s in by_id[ids[3]]["selections"]) == [1, 2]
+
+
+def test_bulk_reports_invalid_items_by_index(client, headers):
+    entries = [
+        _entry(1),
+        _entry(2, mood=9),
+        _entry(3, date="someday"),
+        _entry(4, selected_options=[99999]),
+        "not an object",
+        _entry(5, content=" "),
+        _entry(6),
+    ]
+    response = client.post("/api/moods/bulk", json={"entries": entries}, headers=headers)
+    body = response.get_json()
+
+    assert response.status_code == 207
+    assert body["created"] == 2 and body["failed"] == 5
+    statuses = [r["status"] for r in body["results"]]
+    assert statuses == ["created", "error", "error", "error", "error", "error", "created"]
+    assert len(client.get("/api/moods", headers=headers).get_json()) == 2
+
+
+def test_bulk_rejects_empty_and_oversized_payloads(client, headers):
+    assert client.post("/api/moods/bulk", json=[], headers=headers).status_code == 400
+    too_many = [_entry(1)] * 1001
+    response = client.post("/api/moods/bulk", json=too_many, headers=headers)
+    assert response.status_code == 413
+    assert client.get("/api/moods", headers=headers).get_json() == []
@@ -0,0 +1,100 @@
+import sqlite3
+
+from api.utils.pagination import decode_sync_token, encode_sync_token
+
+
+def _create(client, headers, day, **fields):
+    payload = {"mood": 3, "date": f"07/{day:02d}/2024", "content": f"day {day}"}
+    response = client.post("/api/mood", json={**payload, **fields}, headers=headers)
+    assert response.status_code == 201
+    return response.get_json()["entry_id"]
+
+
+def _changes(client, headers, query=""):
+    response = client.get(f"/api/moods/changes?{query}", headers=headers)
+    assert response.status_code == 200
+    return response.get_json()
+
+
+def test_full_sync_then_only_changes(client, headers):
+    ids = [_create(client, headers, day) for day in range(1, 4)]
+    full = _changes(client, headers)
+    assert [e["id"] for e in full["entries"]] == ids
+    assert full["deleted"] == []
+    assert full["has_more"] is False
+
+    token = full["next_token"]
+    assert _changes(client, headers, f"since={token}")["entries"] == []
+
+    new_id = _create(client, headers, 4)
+    client.put(f"/api/mood/{ids[0]}", json={"mood": 5}, headers=headers)
+    client.delete(f"/api/mood/{ids[1]}", headers=headers)
+
+    delta = _changes(client, headers, f"since={token}")
+    assert [e["id"] for e in delta["entries"]] == [new_id, ids[0]]
+    assert delta["entries"][1]["mood"] == 5
+    assert delta["deleted"] == [ids[1]]
+    assert _changes(client, headers, f"since={delta['next_token']}") == {
+        "entries": [],
+        "deleted": [],
+        "next_token": delta["next_token"],
+        "has_more": False,
+    }
+
+
+def test_selection_changes_count_as_entry_changes(client, headers):
+    entry_id = _create(client, headers, 1, selected_options=[1])
+    token = _changes(client, headers)["next_token"]
+
+    client.put(
+        f"/api/mood/{entry_id}", json={"selected_options": [2, 3]}, headers=headers
+    )
+    delta = _changes(client, headers, f"since={token}&include=selections")
+    assert [e["id"] for e in delta["entries"]] == [entry_id]
+    assert sorted(s["id"] for s in delta["entries"][0]["selections"]) == [2, 3]
+
+
+def test_changes_are_paged_in_order(client, headers):
+    token = _changes(client, headers)["next_token"]
+    ids = [_create(client, headers, day) for day in range(1, 6)]
+    client.delete(f"/api/mood/{ids[0]}", headers=headers)
+
+    seen, deleted = [], []
+    while True:
+        page = _changes(client, headers, f"since={token}&limit=2")
+        seen += [e["id"] for e in page["entries"]]
+        deleted += page["deleted"]
+        token = page["next_token"]
+        if not page["has_more"]:
+            break
+    assert seen == ids[1:]
+    assert deleted == [ids[0]]
+
+
+def test_full_sync_pages_through_rows_written_before_the_migration(client, headers):
+    ids = [_create(client, headers, day) for day in range(1, 6)]
+    db_path = client.application.extensions["user_service"].db.db_path
+    with sqlite3.connect(db_path) as conn:
+        conn.execute("UPDATE mood_entries SET change_seq = 0")
+
+    page = _changes(client, headers, "limit=3")
+    assert page["has_more"] is True
+    rest = _changes(client, headers, f"limit=3&since={page['next_token']}")
+    assert [e["id"] for e in page["entries"] + rest["entries"]] == ids
+
+
+def test_changes_are_private_to_the_user(client, headers):
+    db = client.application.extensions["user_service"].db
+    other = db.upsert_user_by_google_id("other", "o@example.com", "Other")["id"]
+    token = _changes(client, headers)["next_token"]
+    other_entry = db.add_mood_entry(other, "07/01/2024", 3, "not yours")
+    db.delete_mood_entry(other, other_entry)
+    delta = _changes(client, headers, f"since={token}")
+    assert delta["entries"] == [] and delta["deleted"] == []
+
+
+def test_sync_tokens_round_trip_and_reject_garbage(client, headers):
+    assert decode_sync_token(encode_sync_token((12, 7))) == (12, 7)
+    for bad in ["nope", encode_sync_token((1, 2))[:-2] + "!!", "WzEsIngiXQ"]:
+        response = client.get(f"/api/moods/changes?since={bad}", headers=headers)
+        assert response.status_code == 400
@@ -0,0 +1,36 @@
+def _option_ids(client):
+    groups = client.get("/api/groups").get_json()
+    return [option["id"] for group in groups for option in group["options"]]
+
+
+def test_include_selections_matches_per_entry_endpoint(client, headers):
+    options = _option_ids(client)
+    for i in range(6):
+        client.post(
+            "/api/mood",
+            headers=headers,
+            json={
+                "mood": 3,
+                "date": f"02/{1 + i:02d}/2024",
+                "content": f"entry {i}",
+                "selected_options": options[i : i + (i % 3)],
+            },
+        )
+
+    plain = client.get("/api/moods", headers=headers).get_json()
+    assert all("selections" not in entry for entry in plain)
+
+    embedded = client.get("/api/moods?include=selections", headers=headers).get_json()
+    assert [e["id"] for e in embedded] == [e["id"] for e in plain]
+    for entry in embedded:
+        expected = client.get(
+            f"/api/mood/{entry['id']}/selections", headers=headers
+        ).get_json()
+        assert entry["selections"] == expected
+
+    page = client.get(
+        "/api/moods?include=selections&limit=2&start_date=02/02/2024&end_date=02/05/2024",
+        headers=headers,
+    ).get_json()
+    assert len(page["entries"]) == 2
+    assert all("selections" in entry for entry in page["entries"])
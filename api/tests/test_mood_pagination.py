@@ -0,0 +1,62 @@
+import pytest
+
+from api.utils.pagination import decode_cursor, encode_cursor
+
+
+def _seed(client, headers, count):
+    for i in range(count):
+        # Several entries share a created_at so the id tie-break matters
+        response = client.post(
+            "/api/mood",
+            headers=headers,
+            json={
+                "mood": 1 + i % 5,
+                "date": f"01/{1 + i:02d}/2024",
+                "content": f"entry {i}",
+                "time": f"2024-01-{1 + i // 3:02d} 09:00:00",
+            },
+        )
+        assert response.status_code == 201
+
+
+def _walk(client, headers, query):
+    seen, cursor = [], None
+    while True:
+        url = f"/api/moods?{query}" + (f"&cursor={cursor}" if cursor else "")
+        page = client.get(url, headers=headers).get_json()
+        seen.extend(page["entries"])
+        cursor = page["next_cursor"]
+        if cursor is None:
+            return seen
+
+
+def test_pages_cover_history_once_in_order(client, headers):
+    _seed(client, headers, 11)
+    everything = client.get("/api/moods", headers=headers).get_json()
+    assert isinstance(everything, list) and len(everything) == 11
+
+    paged = _walk(client, headers, "limit=4")
+    assert len(paged) == 11
+    assert len({e["id"] for e in paged}) == 11
+    keys = [(e["created_at"], e["id"]) for e in paged]
+    assert keys == sorted(keys, reverse=True)
+
+
+def test_date_range_is_paginated(client, headers):
+    _seed(client, headers, 11)
+    paged = _walk(client, headers, "limit=2&start_date=01/03/2024&end_date=01/07/2024")
+    assert sorted(e["date"] for e in paged) == [f"01/{d:02d}/2024" for d in range(3, 8)]
+
+
+def test_invalid_limit_and_cursor_are_rejected(client, headers):
+    assert client.get("/api/moods?limit=0", headers=headers).status_code == 400
+    assert client.get("/api/moods?limit=abc", headers=headers).status_code == 400
+    assert client.get("/api/moods?cursor=!!", headers=headers).status_code == 400
+
+
+def test_cursor_round_trip():
+    key = ("2024-01-01 09:00:00", 42)
+    assert decode_cursor(encode_cursor(key)) == key
+    assert encode_cursor(None) is None
+    with pytest.raises(ValueError):
+        decode_cursor(encode_cursor(("x", 1))[:-2] + "**")
@@ -0,0 +1,100 @@
+import sqlite3
+
+from api.database import MoodDatabase
+from api.scripts import verify_mood_summary
+
+
+def test_summary_tracks_inserts_updates_and_deletes(db, user_id):
+    low = db.add_mood_entry(user_id, "01/10/2024", 1, "low")
+    db.add_mood_entry(user_id, "2024-01-05", 4, "first")
+    db.add_mood_entries_bulk(
+        user_id, [{"date": "02/01/2024", "mood": 5, "content": "last"}]
+    )
+    db.add_mood_entry(user_id, "not a date", 3, "undated")
+
+    stats = db.get_mood_statistics(user_id)
+    assert stats == {
+        "total_entries": 4,
+        "average_mood": 3.25,
+        "lowest_mood": 1,
+        "highest_mood": 5,
+        "first_entry_date": "2024-01-05",
+        "last_entry_date": "02/01/2024",
+    }
+    assert db.get_mood_counts(user_id) == {1: 1, 3: 1, 4: 1, 5: 1}
+
+    db.update_mood_entry(user_id, low, mood=4, date="03/01/2024")
+    stats = db.get_mood_statistics(user_id)
+    assert stats["lowest_mood"] == 3
+    assert stats["last_entry_date"] == "03/01/2024"
+    assert db.get_mood_counts(user_id) == {3: 1, 4: 2, 5: 1}
+
+    db.delete_mood_entry(user_id, low)
+    assert db.get_mood_statistics(user_id)["last_entry_date"] == "02/01/2024"
+    assert db.verify_mood_summaries() == []
+
+
+def test_summary_is_empty_after_last_delete(db, user_id):
+    entry_id = db.add_mood_entry(user_id, "01/01/2024", 2, "only")
+    db.delete_mood_entry(user_id, entry_id)
+    assert db.get_mood_statistics(user_id)["total_entries"] == 0
+    assert db.get_mood_statistics(user_id)["lowest_mood"] is None
+    assert db.get_mood_counts(user_id) == {}
+
+
+def test_summary_stays_per_user(db, user_id):
+    other = db.upsert_user_by_google_id("other", "o@example.com", "Other")["id"]
+    db.add_mood_entry(user_id, "01/01/2024", 2, "mine")
+    db.add_mood_entry(other, "01/02/2024", 5, "theirs")
+    assert db.get_mood_statistics(user_id)["highest_mood"] == 2
+    assert db.get_mood_statistics(other)["total_entries"] == 1
+
+
+def test_verify_reports_drift_and_rebuild_repairs_it(db, user_id):
+    db.add_mood_entry(user_id, "01/01/2024", 2, "a")
+    db.add_mood_entry(user_id, "01/02/2024", 4, "b")
+    with sqlite3.connect(db.db_path) as conn:
+        conn.execute("UPDATE user_mood_summary SET entry_count = 7")
+        conn.execute("DELETE FROM user_mood_counts WHERE mood = 4")
+
+    assert db.verify_mood_summaries() == [user_id]
+    assert db.rebuild_mood_summaries([user_id]) == 1
+    assert db.verify_mood_summaries() == []
+    assert db.get_mood_statistics(user_id)["total_entries"] == 2
+    assert db.get_mood_counts(user_id) == {2: 1, 4: 1}
+
+
+def test_migration_summarises_existing_entries(tmp_path):
+    path = str(tmp_path / "legacy.db")
+    legacy = MoodDatabase(path)
+    user_id = legacy.upsert_user_by_google_id("legacy", "l@x", "L")["id"]
+    for day, mood in (("01/01/2024", 2), ("01/03/2024", 5), ("01/02/2024", 5)):
+        legacy.add_mood_entry(user_id, day, mood, "")
+    legacy.close()
+    with sqlite3.connect(path) as conn:
+        for suffix in ("ai", "ad", "au"):
+            conn.execute(f"DROP TRIGGER mood_entries_summary_{suffix}")
+        conn.execute("DROP TABLE user_mood_summary")
+        conn.execute("DROP TABLE user_mood_counts")
+        conn.execute("PRAGMA user_version = 8")
+
+    db = MoodDatabase(path)
+    try:
+        assert db.get_mood_statistics(user_id)["total_entries"] == 3
+        assert db.get_mood_statistics(user_id)["last_entry_date"] == "01/03/2024"
+        assert db.get_mood_counts(user_id) == {2: 1, 5: 2}
+        assert db.verify_mood_summaries() == []
+    finally:
+        db.close()
+
+
+def test_cli_verifies_and_repairs(db, user_id, capsys):
+    db.add_mood_entry(user_id, "01/01/2024", 3, "a")
+    assert verify_mood_summary.main(["--db", db.db_path]) == 0
+    with sqlite3.connect(db.db_path) as conn:
+        conn.execute("UPDATE user_mood_summary SET mood_sum = 0")
+
+    assert verify_mood_summary.main(["--db", db.db_path]) == 1
+    assert verify_mood_summary.main(["--db", db.db_path, "--repair"]) == 0
+    assert verify_mood_summary.main(["--db", db.db_path]) == 0
+    assert f"user {user_id}: summary out of date" in capsys.readouterr().out
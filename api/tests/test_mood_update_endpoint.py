@@ -1,25 +1,3 @@
-import os
-import pytest
-
-from api.app import create_app
-
-TEST_DB_PATH = "/tmp/nightlio_test.db"
-
-
-def _reset_test_db():
-    if os.path.exists(TEST_DB_PATH):
-        os.remove(TEST_DB_PATH)
-
-
-@pytest.fixture()
-def client():
-    _reset_test_db()
-    app = create_app("testing")
-    with app.test_client() as test_client:
-        yield test_client
-    _reset_test_db()
-
-
 def _auth_headers(client):
     resp = client.post("/api/auth/local/login")
     assert resp.status_code == 200
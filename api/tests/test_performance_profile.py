@@ -0,0 +1,51 @@
+import pytest
+
+from api.database import MoodDatabase
+from api.database_common import (
+    DEFAULT_PERFORMANCE_PROFILE,
+    PERFORMANCE_PROFILES,
+    performance_profile_pragmas,
+)
+
+
+def _pragma(db, name):
+    with db._connect() as conn:
+        return conn.execute(f"PRAGMA {name}").fetchone()[0]
+
+
+def test_balanced_profile_enables_wal_and_tuning(tmp_path):
+    db = MoodDatabase(str(tmp_path / "balanced.db"), performance_profile="balanced")
+    assert _pragma(db, "journal_mode") == "wal"
+    assert _pragma(db, "synchronous") == 1  # NORMAL
+    assert _pragma(db, "cache_size") == PERFORMANCE_PROFILES["balanced"]["cache_size"]
+    assert _pragma(db, "temp_store") == 2  # MEMORY
+    assert _pragma(db, "busy_timeout") == 5000
+    assert _pragma(db, "foreign_keys") == 1
+    db.close()
+
+
+def test_durable_profile_keeps_existing_journal_mode(tmp_path):
+    path = str(tmp_path / "shared.db")
+    MoodDatabase(path, performance_profile="throughput").close()
+    db = MoodDatabase(path, performance_profile="durable")
+    assert _pragma(db, "journal_mode") == "wal"
+    assert _pragma(db, "synchronous") == 2  # FULL
+    db.close()
+
+
+def test_unknown_profile_is_rejected(tmp_path):
+    with pytest.raises(ValueError):
+        performance_profile_pragmas("ludicrous")
+    with pytest.raises(ValueError):
+        MoodDatabase(str(tmp_path / "x.db"), performance_profile="ludicrous")
+
+
+def test_default_profile_is_balanced(tmp_path, monkeypatch):
+    from api.config import _load_config_from_env
+
+    monkeypatch.delenv("DB_PERFORMANCE_PROFILE", raising=False)
+    assert _load_config_from_env().DB_PERFORMANCE_PROFILE is None
+    db = MoodDatabase(str(tmp_path / "default.db"))
+    assert db.performance_profile == DEFAULT_PERFORMANCE_PROFILE == "balanced"
+    assert _pragma(db, "journal_mode") == "wal"
+    db.close()
@@ -0,0 +1,195 @@
+"""Query-plan regression tests.
+
+Every statement the database layer issues is captured with a trace callback
+while exercising the public API, then run through ``EXPLAIN QUERY PLAN``.
+A plain ``SCAN <table>`` (a full-table scan without an index) fails the test.
+"""
+
+import re
+import sqlite3
+
+import pytest
+
+from api.database import MoodDatabase
+from api.database_common import ConnectionPool, SQLQueries
+
+# Tables small and global enough that scanning them is expected.
+SCAN_ALLOWLIST = {"groups", "sqlite_master"}
+
+_SKIP_PREFIXES = (
+    "PRAGMA",
+    "BEGIN",
+    "COMMIT",
+    "ROLLBACK",
+    "SAVEPOINT",
+    "RELEASE",
+    "CREATE",
+    "DROP",
+    "ALTER",
+    "--",  # statements run inside triggers and virtual table modules
+)
+_FULL_SCAN = re.compile(r"^SCAN (\w+)$")
+
+
+@pytest.fixture()
+def traced(tmp_path, monkeypatch):
+    statements = []
+    original_open = ConnectionPool._open
+
+    def _open(self):
+        conn = original_open(self)
+        conn.set_trace_callback(statements.append)
+        return conn
+
+    monkeypatch.setattr(ConnectionPool, "_open", _open)
+    db = MoodDatabase(str(tmp_path / "plans.db"))
+    yield db, statements
+    db.close()
+
+
+def _exercise(db):
+    user = db.upsert_user_by_google_id("plan-user", "p@example.com", "Plan")
+    user_id = user["id"]
+    db.create_user("plan-user-2", "q@example.com", "Other")
+    db.get_user_by_google_id("plan-user")
+    db.get_user_by_id(user_id)
+    db.update_user_last_login(user_id)
+
+    groups = db.get_all_groups()
+    group_id = db.create_group("Weather")
+    option_id = db.create_group_option(group_id, "Sunny")
+    option_ids = [groups[0]["options"][0]["id"], option_id]
+
+    entry_id = db.add_mood_entry(user_id, "2024-03-01", 4, "hi", "09:00", option_ids)
+    db.add_mood_entry(user_id, "2024-03-02", 2, "meh")
+    db.add_mood_entries_bulk(
+        user_id,
+        [{"date": "03/03/2024", "mood": 3, "content": "bulk", "selected_options": [option_id]}],
+    )
+    db.get_all_mood_entries(user_id)
+    db.import_mood_entries(
+        user_id,
+        [{"date": "03/04/2024", "mood": 3, "content": "imported", "import_key": "k1"}],
+    )
+    db.get_mood_entries_by_date_range(user_id, "2024-03-01", "2024-03-31")
+    _, after = db.get_mood_entries_page(user_id, 1)
+    db.get_mood_entries_page(user_id, 1, after)
+    db.get_mood_entries_page(user_id, 1, after, "2024-03-01", "2024-03-31")
+    db.get_mood_entry_by_id(user_id, entry_id)
+    _, _, checkpoint, _ = db.get_mood_entry_changes(user_id, 2)
+    db.get_mood_entry_changes(user_id, 2, checkpoint)
+    db.update_mood_entry(user_id, entry_id, mood=5, content="better")
+    db.get_entry_selections(entry_id)
+    list(db.iter_mood_entries_for_export(user_id))
+    list(db.iter_mood_entries_for_export(user_id, "03/01/2024", "03/31/2024"))
+    db.get_selections_for_entries(user_id)
+    db.get_selections_for_entries(user_id, [entry_id])
+    db.get_option_mood_rows(user_id)
+    db.get_mood_patterns(user_id, 60)
+    db.add_entry_selections(entry_id, [option_id])
+    db.search_mood_entries(user_id, "bett")
+    db.search_mood_entries(
+        user_id, "bulk", moods=[3], start_date="2024-03-01", end_date="2024-03-31"
+    )
+
+    goal_id = db.create_goal(user_id, "Walk", "daily", 3)
+    db.get_goals(user_id)
+    db.get_goal_by_id(user_id, goal_id)
+    db.update_goal(user_id, goal_id, title="Run")
+    db.increment_goal_progress(user_id, goal_id)
+    db.get_goal_completions(user_id, goal_id, "2024-01-01", "2030-12-31")
+
+    db.increment_stats_view(user_id)
+    db.get_user_metrics(user_id)
+    db.get_mood_statistics(user_id)
+    db.get_mood_counts(user_id)
+    db.get_daily_rollups(user_id, 738000, 739000)
+    db.verify_mood_summaries([user_id])
+    db.rebuild_mood_summaries([user_id])
+    db.get_current_streak(user_id)
+    db.get_streak_state(user_id)
+    db.rebuild_streak(user_id)
+    db.check_achievements(user_id)
+    db.add_achievement(user_id, "first_entry")
+    achievements = db.get_user_achievements(user_id)
+    if achievements:
+        db.update_achievement_nft(achievements[0]["id"], 1, "0xabc")
+    db.get_achievements_progress(user_id)
+
+    db.delete_mood_entry(user_id, entry_id)
+    db.get_mood_entry_changes(user_id, 50, checkpoint)
+    db.delete_goal(user_id, goal_id)
+    db.delete_group_option(option_id)
+    db.delete_group(group_id)
+    return user_id
+
+
+def _full_scans(conn, sql, params=()):
+    plan = conn.execute(f"EXPLAIN QUERY PLAN {sql}", params).fetchall()
+    # Scans of subqueries are bounded by their own (checked) plan rows.
+    tables = {r[0] for r in conn.execute("SELECT name FROM sqlite_master")}
+    scans = []
+    for row in plan:
+        match = _FULL_SCAN.match(row[3])
+        if match and match.group(1) in tables - SCAN_ALLOWLIST:
+            scans.append(row[3])
+    return scans
+
+
+def test_traced_statements_use_indexes(traced):
+    db, statements = traced
+    _exercise(db)
+
+    offenders = {}
+    with sqlite3.connect(db.db_path) as conn:
+        for sql in dict.fromkeys(statements):
+            statement = sql.strip()
+            if statement.upper().startswith(_SKIP_PREFIXES) or statement == "SELECT 1":
+                continue
+            scans = _full_scans(conn, sql)
+            if scans:
+                offenders[sql] = scans
+
+    assert len(statements) > 50
+    assert offenders == {}
+
+
+@pytest.mark.parametrize(
+    "name",
+    [n for n in vars(SQLQueries) if n.isupper() and n.startswith(("GET_", "UPSERT"))],
+)
+def test_sql_query_constants_use_indexes(traced, name):
+    db, _ = traced
+    sql = getattr(SQLQueries, name)
+    with sqlite3.connect(db.db_path) as conn:
+        params = (1,) * sql.count("?")
+        assert _full_scans(conn, sql, params) == []
+
+
+def test_foreign_keys_are_indexed(traced):
+    db, _ = traced
+    with sqlite3.connect(db.db_path) as conn:
+        tables = [
+            r[0]
+            for r in conn.execute(
+                "SELECT name FROM sqlite_master WHERE type = 'table' "
+                "AND name NOT LIKE 'sqlite_%'"
+            )
+        ]
+        missing = []
+        for table in tables:
+            leading = set()
+            for index in conn.execute(f"PRAGMA index_list({table})").fetchall():
+                cols = conn.execute(f"PRAGMA index_info({index[1]})").fetchall()
+                if cols:
+                    leading.add(cols[0][2])
+            pk = [
+                c[1]
+                for c in conn.execute(f"PRAGMA table_info({table})")
+                if c[5] == 1
+            ]
+            leading.update(pk)
+            for fk in conn.execute(f"PRAGMA foreign_key_list({table})"):
+                if fk[3] not in leading:
+                    missing.append(f"{table}.{fk[3]}")
+    assert missing == []
@@ -0,0 +1,191 @@
+import pytest
+
+from api.database_search import build_match_query
+
+
+@pytest.fixture()
+def entry_ids(client, headers):
+    entries = [
+        {"mood": 4, "date": "05/01/2024", "content": "Long run by the river"},
+        {"mood": 2, "date": "05/02/2024", "content": "Rain all day, skipped my run"},
+        {"mood": 5, "date": "05/03/2024", "content": "Running running running!"},
+        {"mood": 3, "date": "05/04/2024", "content": "Café with Zoë, nothing else"},
+        {"mood": 3, "date": "05/05/2024", "content": "Quiet evening reading"},
+    ]
+    response = client.post("/api/moods/bulk", json=entries, headers=headers)
+    assert response.status_code == 201
+    return [r["entry_id"] for r in response.get_json()["results"]]
+
+
+def _search(client, headers, query):
+    return client.get(f"/api/search?{query}", headers=headers)
+
+
+def test_build_match_query_quotes_terms_and_prefixes_the_last():
+    assert build_match_query("long run") == '"long" "run"*'
+    assert build_match_query('NEAR(a b) OR content:"x"') == (
+        '"NEAR" "a" "b" "OR" "content" "x"*'
+    )
+    with pytest.raises(ValueError):
+        build_match_query("  -- ** ")
+
+
+def test_search_ranks_hits_and_highlights_snippets(client, headers, entry_ids):
+    response = _search(client, headers, "q=running")
+    assert response.status_code == 200
+    body = response.get_json()
+    assert body["next_offset"] is None
+
+    results = body["results"]
+    # The entry repeating the term ranks first; prefix match finds the rest.
+    assert results[0]["id"] == entry_ids[2]
+    assert "<mark>Running</mark>" in results[0]["snippet"]
+    assert [r["score"] for r in results] == sorted(r["score"] for r in results)
+    assert {r["id"] for r in results} == {entry_ids[2]}
+
+    run_ids = {r["id"] for r in _search(client, headers, "q=run").get_json()["results"]}
+    assert run_ids == {entry_ids[0], entry_ids[1], entry_ids[2]}
+
+
+def test_search_ignores_diacritics_and_operators(client, headers, entry_ids):
+    results = _search(client, headers, "q=cafe zoe").get_json()["results"]
+    assert [r["id"] for r in results] == [entry_ids[3]]
+
+    response = _search(client, headers, "q=run OR reading")
+    assert response.status_code == 200
+    assert response.get_json()["results"] == []
+
+
+def test_search_filters_by_mood_and_date(client, headers, entry_ids):
+    results = _search(client, headers, "q=run&mood=4,5").get_json()["results"]
+    assert {r["id"] for r in results} == {entry_ids[0], entry_ids[2]}
+
+    results = _search(
+        client, headers, "q=run&start_date=2024-05-02&end_date=2024-05-02"
+    ).get_json()["results"]
+    assert [r["id"] for r in results] == [entry_ids[1]]
+
+
+def test_search_paginates_with_offsets(client, headers, entry_ids):
+    first = _search(client, headers, "q=run&limit=2").get_json()
+    assert len(first["results"]) == 2
+    assert first["next_offset"] == 2
+
+    second = _search(client, headers, "q=run&limit=2&offset=2").get_json()
+    assert second["next_offset"] is None
+    ids = [r["id"] for r in first["results"] + second["results"]]
+    assert sorted(ids) == sorted(entry_ids[:3])
+
+
+def test_search_index_follows_updates_and_deletes(client, headers, entry_ids):
+    response = client.put(
+        f"/api/mood/{entry_ids[4]}",
+        json={"content": "Evening swim instead"},
+        headers=headers,
+    )
+    assert response.status_code == 200
+    assert _search(client, headers, "q=reading").get_json()["results"] == []
+    results = _search(client, headers, "q=swim").get_json()["results"]
+    assert [r["id"] for r in results] == [entry_ids[4]]
+
+    client.delete(f"/api/mood/{entry_ids[4]}", headers=headers)
+    assert _search(client, headers, "q=swim").get_json()["results"] == []
+
+
+@pytest.mark.parametrize(
+    "query",
+    [
+        "q=",
+        "q=%2A%2A",
+        "q=run&limit=0",
+        "q=run&offset=-1",
+        "q=run&mood=9",
+        "q=run&mood=x",
+        "q=run&start_date=2024-05-01",
+        "q=run&start_date=bad&end_date=bad",
+    ],
+)
+def test_search_rejects_bad_parameters(client, headers, query):
+    assert _search(client, headers, query).status_code == 400
+
+
+def test_search_requires_auth(client):
+    assert client.get("/api/search?q=run").status_code == 401
+
+
+def test_ranking_covers_every_match(client, headers):
+    entries = [
+        {"mood": 3, "date": f"06/{day:02d}/2024", "content": "tea " * (10 - day)}
+        for day in range(1, 10)
+    ]
+    response = client.post("/api/moods/bulk", json=entries, headers=headers)
+    ids = [r["entry_id"] for r in response.get_json()["results"]]
+
+    # The oldest entry repeats the term most, so it ranks first.
+    results = _search(client, headers, "q=tea&limit=3").get_json()
+    assert [r["id"] for r in results["results"]] == ids[:3]
+    last = _search(client, headers, "q=tea&limit=3&offset=6").get_json()
+    assert [r["id"] for r in last["results"]] == ids[6:]
+    assert last["next_offset"] is None
+
+
+def test_snippets_escape_entry_html(client, headers):
+    content = "<script>alert('run')</script> & <b>run</b>"
+    response = client.post(
+        "/api/mood",
+        json={"mood": 3, "date": "06/01/2024", "content": content},
+        headers=headers,
+    )
+    assert response.status_code == 201
+
+    snippet = _search(client, headers, "q=run").get_json()["results"][0]["snippet"]
+    assert "<script>" not in snippet and "<b>" not in snippet
+    assert "&lt;script&gt;" in snippet and "&amp;" in snippet
+    assert "<mark>run</mark>" in snippet
+
+
+def test_older_hits_follow_the_ranked_ones_newest_first(db, user_id, monkeypatch):
+    monkeypatch.setattr("api.database_search.RANK_CANDIDATES", 3)
+    ids = db.add_mood_entries_bulk(
+        user_id,
+        [
+            {"date": f"06/{day:02d}/2024", "mood": 3, "content": "tea " * day}
+            for day in range(1, 7)
+        ],
+    )
+
+    hits, more = db.search_mood_entries(user_id, "tea")
+    assert not more
+    # The three newest are ranked; the rest follow unscored, newest first.
+    assert [hit["id"] for hit in hits] == [ids[5], ids[4], ids[3], *ids[2::-1]]
+    assert all(hit["score"] is not None for hit in hits[:3])
+    assert [hit["score"] for hit in hits[3:]] == [None, None, None]
+
+    page, more = db.search_mood_entries(user_id, "tea", limit=2, offset=2)
+    assert [hit["id"] for hit in page] == [ids[3], ids[2]]
+    assert more
+
+
+def test_search_only_returns_the_users_own_entries(db, user_id):
+    other_id = db.upsert_user_by_google_id("other", "other@example.com", "Other")["id"]
+    own = db.add_mood_entry(user_id, "06/01/2024", 3, "walk in the park")
+    db.add_mood_entry(other_id, "06/01/2024", 3, "walk walk walk")
+
+    hits, _ = db.search_mood_entries(user_id, "walk")
+    assert [hit["id"] for hit in hits] == [own]
+
+
+def test_date_filter_skips_entries_written_outside_the_range(db, user_id):
+    ids = db.add_mood_entries_bulk(
+        user_id,
+        [
+            {"date": f"06/{day:02d}/2024", "mood": 3, "content": "rain"}
+            for day in (1, 2, 3, 4)
+        ],
+    )
+    late = db.add_mood_entry(user_id, "06/02/2024", 3, "rain again, written late")
+
+    hits, _ = db.search_mood_entries(
+        user_id, "rain", start_date="2024-06-02", end_date="2024-06-03"
+    )
+    assert sorted(hit["id"] for hit in hits) == [ids[1], ids[2], late]
@@ -0,0 +1,59 @@
+import base64
+from datetime import date
+
+import pytest
+
+from api.services.statistics_service import StatisticsService
+
+
+def _decode(calendar):
+    return base64.b64decode(calendar["moods"])
+
+
+def test_calendar_packs_one_byte_per_day(db):
+    user_id = db.upsert_user_by_google_id("cal", "c@example.com", "C")["id"]
+    db.add_mood_entry(user_id, "01/01/2024", 4, "")
+    db.add_mood_entry(user_id, "02/29/2024", 2, "")
+    db.add_mood_entry(user_id, "2024-02-29", 3, "")  # mean 2.5 rounds up
+    db.add_mood_entry(user_id, "12/31/2024", 1, "")
+    db.add_mood_entry(user_id, "06/15/2023", 5, "")
+
+    result = StatisticsService(db).get_calendar(user_id, [2024, 2023])
+    assert result["encoding"] == "base64"
+    assert [c["year"] for c in result["calendars"]] == [2023, 2024]
+
+    last_year, leap_year = result["calendars"]
+    assert last_year["days"] == 365
+    assert leap_year["days"] == 366
+    moods = _decode(leap_year)
+    assert len(moods) == 366
+    assert moods[0] == 4
+    assert moods[date(2024, 2, 29).timetuple().tm_yday - 1] == 3
+    assert moods[365] == 1
+    assert sum(1 for value in moods if value) == 3
+    assert _decode(last_year)[date(2023, 6, 15).timetuple().tm_yday - 1] == 5
+
+
+@pytest.mark.parametrize("years", [[], list(range(2000, 2011)), [0]])
+def test_calendar_rejects_bad_years(db, years):
+    with pytest.raises(ValueError):
+        StatisticsService(db).get_calendar(1, years)
+
+
+def test_calendar_endpoint(client, headers):
+    client.post(
+        "/api/mood",
+        json={"mood": 5, "date": "03/01/2022", "content": "x"},
+        headers=headers,
+    )
+    response = client.get("/api/statistics/calendar?year=2021,2022", headers=headers)
+    assert response.status_code == 200
+    calendars = response.get_json()["calendars"]
+    assert [len(_decode(c)) for c in calendars] == [365, 365]
+    assert _decode(calendars[1])[59] == 5
+
+    default = client.get("/api/statistics/calendar", headers=headers).get_json()
+    assert default["calendars"][0]["year"] == date.today().year
+
+    bad = client.get("/api/statistics/calendar?year=soon", headers=headers)
+    assert bad.status_code == 400
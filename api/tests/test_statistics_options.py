@@ -0,0 +1,111 @@
+import random
+
+import pytest
+
+from api.services.statistics_service import StatisticsService
+from api.utils import option_stats
+
+
+def _random_rows(seed):
+    rng = random.Random(seed)
+    rows = []
+    # Rows of an entry stay adjacent; entries themselves come in any order.
+    for entry_id in rng.sample(range(1, 300), 299):
+        mood = rng.randint(1, 5)
+        for option_id in rng.sample(range(1, 40), rng.randint(0, 6)):
+            rows.append((entry_id, option_id, mood))
+    return rows
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_vectorized_totals_match_python_loops(monkeypatch, seed):
+    pytest.importorskip("numpy")
+    rows = _random_rows(seed)
+    vectorized = option_stats.option_totals(rows)
+    monkeypatch.setattr(option_stats, "np", None)
+    assert vectorized == option_stats.option_totals(rows)
+
+
+def test_repeated_selections_count_once(monkeypatch):
+    pytest.importorskip("numpy")
+    rows = [(1, 5, 3), (1, 5, 3), (1, 7, 3), (2, 7, 4)]
+    assert option_stats.option_totals(rows) == (
+        [5, 7],
+        [1, 2],
+        [3, 7],
+        [[1, 1], [1, 2]],
+    )
+    monkeypatch.setattr(option_stats, "np", None)
+    assert option_stats.option_totals(rows)[3] == [[1, 1], [1, 2]]
+
+
+@pytest.mark.parametrize("with_numpy", [True, False])
+def test_option_stats(db, monkeypatch, with_numpy):
+    if with_numpy:
+        pytest.importorskip("numpy")
+    else:
+        monkeypatch.setattr(option_stats, "np", None)
+    user_id = db.upsert_user_by_google_id("opt-user", "o@example.com", "O")["id"]
+    group_id = db.create_group("Activities")
+    run = db.create_group_option(group_id, "Run")
+    read = db.create_group_option(group_id, "Read")
+    db.add_mood_entry(user_id, "01/01/2024", 5, "", selected_options=[run, read])
+    db.add_mood_entry(user_id, "01/02/2024", 4, "", selected_options=[run])
+    db.add_mood_entry(user_id, "01/03/2024", 1, "", selected_options=[read])
+    db.add_mood_entry(user_id, "01/04/2024", 2, "")
+
+    result = StatisticsService(db).get_option_stats(user_id)
+    assert result["baseline"] == {"entries": 4, "average_mood": 3.0}
+    assert result["options"] == [
+        {
+            "id": run,
+            "name": "Run",
+            "group_name": "Activities",
+            "count": 2,
+            "average_mood": 4.5,
+            "lift": 1.5,
+        },
+        {
+            "id": read,
+            "name": "Read",
+            "group_name": "Activities",
+            "count": 2,
+            "average_mood": 3.0,
+            "lift": 0.0,
+        },
+    ]
+    assert result["co_occurrence"] == {
+        "option_ids": [run, read],
+        "matrix": [[2, 1], [1, 2]],
+    }
+
+
+def test_option_stats_without_entries(db):
+    user_id = db.upsert_user_by_google_id("empty", "e@example.com", "E")["id"]
+    assert StatisticsService(db).get_option_stats(user_id) == {
+        "baseline": {"entries": 0, "average_mood": None},
+        "options": [],
+        "co_occurrence": {"option_ids": [], "matrix": []},
+    }
+
+
+def test_option_stats_endpoint(client, headers):
+    groups = client.get("/api/groups", headers=headers).get_json()
+    option_id = groups[0]["options"][0]["id"]
+    client.post(
+        "/api/mood",
+        json={
+            "mood": 4,
+            "date": "01/01/2024",
+            "content": "x",
+            "selected_options": [option_id],
+        },
+        headers=headers,
+    )
+    response = client.get("/api/statistics/options", headers=headers)
+    assert response.status_code == 200
+    body = response.get_json()
+    assert body["options"][0]["id"] == option_id
+    assert body["options"][0]["lift"] == 0.0
+    assert response.headers["ETag"].startswith("W/")
+    assert client.get("/api/statistics/options").status_code == 401
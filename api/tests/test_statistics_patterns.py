@@ -0,0 +1,83 @@
+import sqlite3
+
+import pytest
+
+from api.database_common import SQLQueries
+from api.services.statistics_service import StatisticsService
+
+
+def _add(db, user_id, day, mood, created_at):
+    items = [{"date": day, "mood": mood, "content": "", "time": created_at}]
+    return db.add_mood_entries_bulk(user_id, items)
+
+
+def test_patterns_group_by_weekday_and_hour(db):
+    user_id = db.upsert_user_by_google_id("p", "p@example.com", "P")["id"]
+    # 2024-03-11 is a Monday, 2024-03-17 a Sunday
+    _add(db, user_id, "2024-03-11", 4, "2024-03-11T09:15:00.000Z")
+    _add(db, user_id, "2024-03-11", 1, "2024-03-11 09:45:00")
+    _add(db, user_id, "2024-03-17", 5, "2024-03-17T23:30:00.000Z")
+    db.add_mood_entry(user_id, "someday", 3, "undated")
+
+    result = StatisticsService(db).get_patterns(user_id)
+    assert result["weekdays"][0] == {"weekday": 0, "entries": 2, "average_mood": 2.5}
+    assert result["weekdays"][6]["entries"] == 1
+    assert result["weekdays"][3] == {"weekday": 3, "entries": 0, "average_mood": None}
+    assert result["hours"][9] == {"hour": 9, "entries": 2, "average_mood": 2.5}
+    assert result["matrix"]["entries"][6][23] == 1
+    assert result["matrix"]["average_mood"][0][9] == 2.5
+    assert sum(map(sum, result["matrix"]["entries"])) == 3
+
+    # Half an hour east moves 23:30 past midnight; the weekday stays put.
+    shifted = StatisticsService(db).get_patterns(user_id, 30)
+    assert shifted["matrix"]["entries"][6][0] == 1
+    assert shifted["hours"][10]["entries"] == 1
+    west = StatisticsService(db).get_patterns(user_id, -600)
+    assert west["hours"][23]["entries"] == 2
+
+
+def test_patterns_read_the_covering_index(db):
+    with sqlite3.connect(db.db_path) as conn:
+        plan = [
+            row[3]
+            for row in conn.execute(
+                "EXPLAIN QUERY PLAN " + SQLQueries.GET_MOOD_PATTERNS,
+                (0, 1),
+            )
+        ]
+    assert any("COVERING INDEX idx_mood_entries_user_day" in step for step in plan)
+
+
+@pytest.mark.parametrize("offset", [-841, 841])
+def test_patterns_reject_bad_offsets(db, offset):
+    with pytest.raises(ValueError):
+        StatisticsService(db).get_patterns(1, offset)
+
+
+def test_patterns_endpoint(client, headers):
+    client.post(
+        "/api/mood",
+        json={
+            "mood": 4,
+            "date": "03/13/2024",
+            "content": "x",
+            "time": "2024-03-13T08:00:00.000Z",
+        },
+        headers=headers,
+    )
+    response = client.get("/api/statistics/patterns?tz_offset=120", headers=headers)
+    assert response.status_code == 200
+    body = response.get_json()
+    assert body["tz_offset"] == 120
+    assert body["weekdays"][2]["entries"] == 1
+    assert body["hours"][10]["average_mood"] == 4.0
+
+    revalidated = client.get(
+        "/api/statistics/patterns?tz_offset=120",
+        headers={**headers, "If-None-Match": response.headers["ETag"]},
+    )
+    assert revalidated.status_code == 304
+
+    bad = client.get("/api/statistics/patterns?tz_offset=east", headers=headers)
+    assert bad.status_code == 400
+    assert client.get("/api/statistics/patterns").status_code == 401
@@ -0,0 +1,151 @@
+import sqlite3
+from datetime import date, timedelta
+
+import pytest
+
+from api.database import MoodDatabase
+from api.services.statistics_service import StatisticsService
+
+TODAY = date(2024, 3, 13)  # a Wednesday
+
+
+def _label(day):
+    return day.strftime("%m/%d/%Y")
+
+
+def test_rollups_follow_inserts_updates_and_deletes(db, user_id):
+    day = TODAY.toordinal()
+    first = db.add_mood_entry(user_id, _label(TODAY), 2, "a")
+    db.add_mood_entries_bulk(
+        user_id, [{"date": TODAY.isoformat(), "mood": 5, "content": "b"}]
+    )
+    db.add_mood_entry(user_id, "someday", 1, "undated")
+    assert db.get_daily_rollups(user_id, day - 1, day) == [(day, 2, 7, 2, 5)]
+
+    db.update_mood_entry(user_id, first, date=_label(TODAY - timedelta(days=1)))
+    assert db.get_daily_rollups(user_id, day - 1, day) == [
+        (day - 1, 1, 2, 2, 2),
+        (day, 1, 5, 5, 5),
+    ]
+    db.delete_mood_entry(user_id, first)
+    assert db.get_daily_rollups(user_id, day - 1, day) == [(day, 1, 5, 5, 5)]
+
+
+def test_bulk_rows_on_one_day_roll_up_like_a_group_by(db, user_id):
+    days = [_label(TODAY - timedelta(days=1)), _label(TODAY)]
+    items = [
+        {"date": days[i % 2], "mood": 1 + i % 5, "content": ""} for i in range(2000)
+    ]
+    ids = db.add_mood_entries_bulk(user_id, items)
+    db.delete_mood_entry(user_id, ids[0])
+    db.update_mood_entry(user_id, ids[1], mood=5)
+
+    day = TODAY.toordinal()
+    with sqlite3.connect(db.db_path) as conn:
+        expected = conn.execute(
+            "SELECT entry_day, COUNT(*), SUM(mood), MIN(mood), MAX(mood) "
+            "FROM mood_entries WHERE user_id = ? GROUP BY entry_day "
+            "ORDER BY entry_day",
+            (user_id,),
+        ).fetchall()
+    assert db.get_daily_rollups(user_id, day - 1, day) == expected
+
+
+def test_migration_rolls_up_existing_entries(tmp_path):
+    path = str(tmp_path / "legacy.db")
+    legacy = MoodDatabase(path)
+    user_id = legacy.upsert_user_by_google_id("legacy", "l@x", "L")["id"]
+    for mood in (1, 4):
+        legacy.add_mood_entry(user_id, _label(TODAY), mood, "")
+    legacy.close()
+    with sqlite3.connect(path) as conn:
+        for suffix in ("ai", "ad", "au"):
+            conn.execute(f"DROP TRIGGER mood_entries_rollup_{suffix}")
+        conn.execute("DROP TABLE user_daily_moods")
+        conn.execute("PRAGMA user_version = 10")
+
+    db = MoodDatabase(path)
+    try:
+        day = TODAY.toordinal()
+        assert db.get_daily_rollups(user_id, day, day) == [(day, 2, 5, 1, 4)]
+    finally:
+        db.close()
+
+
+def test_daily_trend_fills_gaps_and_smooths(db, user_id):
+    for offset, mood in ((0, 4), (0, 2), (2, 5), (3, 1)):
+        db.add_mood_entry(user_id, _label(TODAY - timedelta(days=offset)), mood, "")
+
+    trend = StatisticsService(db).get_trend(user_id, 4, "day", 2, today=TODAY)
+    assert trend["start_date"] == "2024-03-10"
+    assert trend["end_date"] == "2024-03-13"
+    assert [(p["date"], p["entries"], p["average_mood"]) for p in trend["points"]] == [
+        ("2024-03-10", 1, 1.0),
+        ("2024-03-11", 1, 5.0),
+        ("2024-03-12", 0, None),
+        ("2024-03-13", 2, 3.0),
+    ]
+    assert [p["moving_average"] for p in trend["points"]] == [1.0, 3.0, 5.0, 3.0]
+    assert trend["points"][-1]["lowest_mood"] == 2
+    assert trend["points"][-1]["highest_mood"] == 4
+
+
+def test_week_and_month_buckets(db, user_id):
+    for day, mood in ((date(2024, 2, 28), 1), (date(2024, 3, 4), 3), (TODAY, 5)):
+        db.add_mood_entry(user_id, _label(day), mood, "")
+    service = StatisticsService(db)
+
+    weeks = service.get_trend(user_id, 21, "week", today=TODAY)["points"]
+    assert [(p["date"], p["entries"]) for p in weeks] == [
+        ("2024-02-19", 0),
+        ("2024-02-26", 1),
+        ("2024-03-04", 1),
+        ("2024-03-11", 1),
+    ]
+
+    months = service.get_trend(user_id, 21, "month", today=TODAY)["points"]
+    assert [(p["date"], p["average_mood"]) for p in months] == [
+        ("2024-02-01", 1.0),
+        ("2024-03-01", 4.0),
+    ]
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [{"bucket": "year"}, {"range_days": 0}, {"range_days": 99999}, {"window": 0}],
+)
+def test_trend_rejects_bad_parameters(db, user_id, kwargs):
+    with pytest.raises(ValueError):
+        StatisticsService(db).get_trend(user_id, **kwargs)
+
+
+def test_trend_endpoint(client, headers):
+    today = date.today()
+    client.post(
+        "/api/mood",
+        json={"mood": 4, "date": _label(today), "content": "today"},
+        headers=headers,
+    )
+
+    response = client.get("/api/statistics/trend?range=7&bucket=day", headers=headers)
+    assert response.status_code == 200
+    body = response.get_json()
+    assert len(body["points"]) == 7
+    assert body["points"][-1] == {
+        "date": today.isoformat(),
+        "entries": 1,
+        "average_mood": 4.0,
+        "lowest_mood": 4,
+        "highest_mood": 4,
+        "moving_average": 4.0,
+    }
+
+    revalidated = client.get(
+        "/api/statistics/trend?range=7&bucket=day",
+        headers={**headers, "If-None-Match": response.headers["ETag"]},
+    )
+    assert revalidated.status_code == 304
+
+    bad = client.get("/api/statistics/trend?range=abc", headers=headers)
+    assert bad.status_code == 400
+    assert client.get("/api/statistics/trend").status_code == 401
@@ -0,0 +1,121 @@
+import sqlite3
+import time
+
+import pytest
+
+from api.database import MoodDatabase
+from api.database_common import CounterBuffer
+
+
+@pytest.fixture()
+def db(tmp_path):
+    database = MoodDatabase(
+        str(tmp_path / "metrics.db"),
+        stats_view_flush_interval=60,
+        stats_view_flush_threshold=25,
+    )
+    yield database
+    database.close()
+
+
+def _stored_views(db, user_id):
+    with sqlite3.connect(db.db_path) as conn:
+        row = conn.execute(
+            "SELECT stats_views FROM user_metrics WHERE user_id = ?", (user_id,)
+        ).fetchone()
+    return row[0] if row else 0
+
+
+def test_views_are_buffered_but_visible(db, user_id):
+    for _ in range(3):
+        db.increment_stats_view(user_id)
+    assert _stored_views(db, user_id) == 0
+    assert db.get_user_metrics(user_id)["stats_views"] == 3
+
+    db._stats_view_buffer.flush()
+    assert _stored_views(db, user_id) == 3
+    assert db.get_user_metrics(user_id)["stats_views"] == 3
+
+
+def _wait_for_views(db, user_id, expected, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while _stored_views(db, user_id) != expected and time.monotonic() < deadline:
+        time.sleep(0.01)
+    return _stored_views(db, user_id)
+
+
+def test_threshold_triggers_flush(db, user_id):
+    for _ in range(25):
+        db.increment_stats_view(user_id)
+    assert _wait_for_views(db, user_id, 25) == 25
+
+
+def test_threshold_flush_survives_a_rolled_back_request(db, user_id):
+    with pytest.raises(RuntimeError):
+        with db.unit_of_work():
+            db.get_user_metrics(user_id)
+            for _ in range(25):
+                db.increment_stats_view(user_id)
+            raise RuntimeError("request failed")
+    assert _wait_for_views(db, user_id, 25) == 25
+    assert db.get_user_metrics(user_id)["stats_views"] == 25
+
+
+def test_close_flushes_pending_views(db, user_id):
+    db.increment_stats_view(user_id)
+    db.close()
+    assert _stored_views(db, user_id) == 1
+
+
+def test_data_lover_sees_unflushed_views(db, user_id):
+    for _ in range(10):
+        db.increment_stats_view(user_id)
+    assert "data_lover" in db.check_achievements(user_id)
+    assert db.get_achievements_progress(user_id)["data_lover"]["current"] == 10
+
+
+def test_failed_flush_keeps_deltas():
+    calls = []
+
+    def flaky(items):
+        calls.append(items)
+        if len(calls) == 1:
+            raise sqlite3.OperationalError("database is locked")
+
+    buffer = CounterBuffer(flaky, interval=60)
+    buffer.add(7, 2)
+    buffer.flush()
+    assert buffer.pending(7) == 2
+    buffer.flush()
+    assert calls[-1] == [(7, 2)]
+    assert buffer.pending(7) == 0
+
+
+def test_deltas_stay_pending_until_the_write_commits():
+    seen = []
+    buffer = CounterBuffer(lambda items: seen.append(buffer.pending(7)), interval=60)
+    buffer.add(7, 2)
+    buffer.flush()
+    assert seen == [2]
+    assert buffer.pending(7) == 0
+
+
+def test_failed_write_is_retried_on_the_timer(db, user_id, monkeypatch):
+    db.increment_stats_view(user_id)
+    buffer = db._stats_view_buffer
+    buffer.interval = 0.05
+    write = db._run_write
+    failures = []
+
+    def failing_write(*args, **kwargs):
+        if not failures:
+            failures.append(True)
+            raise sqlite3.OperationalError("disk I/O error")
+        return write(*args, **kwargs)
+
+    monkeypatch.setattr(db, "_run_write", failing_write)
+    buffer.flush()
+    assert failures and _stored_views(db, user_id) == 0
+    assert db.get_user_metrics(user_id)["stats_views"] == 1
+    assert _wait_for_views(db, user_id, 1) == 1
+    assert buffer.pending(user_id) == 0
@@ -0,0 +1,140 @@
+import random
+import sqlite3
+from datetime import date, datetime, timedelta
+
+import pytest
+
+from api.database import MoodDatabase
+
+TODAY = date.today().toordinal()
+
+
+def _label(day):
+    return date.fromordinal(day).strftime("%m/%d/%Y")
+
+
+def _parsed_entry_dates(db, user_id):
+    """Entry dates read and parsed as get_current_streak did before user_streaks."""
+    with sqlite3.connect(db.db_path) as conn:
+        rows = conn.execute(
+            "SELECT DISTINCT date FROM mood_entries WHERE user_id = ?", (user_id,)
+        ).fetchall()
+    parsed = []
+    for (text,) in rows:
+        for fmt in ("%m/%d/%Y", "%Y-%m-%d"):
+            try:
+                parsed.append(datetime.strptime(text, fmt).date())
+                break
+            except ValueError:
+                continue
+    return sorted(parsed, reverse=True)
+
+
+def _expected_current(parsed, today):
+    """The old _calculate_streak_from_dates, with today passed in."""
+    if not parsed or (today - parsed[0]).days > 1:
+        return 0
+    streak = 0
+    expected = parsed[0]
+    for entry_date in parsed:
+        if entry_date != expected:
+            break
+        streak += 1
+        expected = entry_date - timedelta(days=1)
+    return streak
+
+
+def _expected_longest(parsed):
+    longest = run = 0
+    previous = None
+    for entry_date in reversed(parsed):
+        run = run + 1 if previous and entry_date - previous == timedelta(1) else 1
+        longest = max(longest, run)
+        previous = entry_date
+    return longest
+
+
+def _state(db, user_id, today=TODAY):
+    state = db.get_streak_state(user_id, today=today)
+    return state["current_streak"], state["longest_streak"]
+
+
+def test_appending_days_extends_the_streak(db, user_id):
+    for offset in (3, 2, 1, 0):
+        db.add_mood_entry(user_id, _label(TODAY - offset), 3, "x")
+    db.add_mood_entry(user_id, _label(TODAY), 4, "same day")
+    assert db.get_streak_state(user_id, today=TODAY) == {
+        "current_streak": 4,
+        "longest_streak": 4,
+        "last_entry_day": TODAY,
+    }
+    assert db.get_streak_state(user_id, today=TODAY + 2)["current_streak"] == 0
+
+
+def test_deleting_inside_the_streak_shortens_it(db, user_id):
+    ids = [db.add_mood_entry(user_id, _label(TODAY - o), 3, "x") for o in range(5)]
+    db.delete_mood_entry(user_id, ids[2])
+    assert _state(db, user_id) == (2, 2)
+    db.update_mood_entry(user_id, ids[4], date=_label(TODAY - 2))
+    assert _state(db, user_id) == (4, 4)
+
+
+def test_migration_backfills_streak_state(tmp_path):
+    path = str(tmp_path / "legacy.db")
+    legacy = MoodDatabase(path)
+    user_id = legacy.upsert_user_by_google_id("legacy", "l@x", "L")["id"]
+    for offset in (0, 1, 5, 6, 7):
+        legacy.add_mood_entry(user_id, _label(TODAY - offset), 3, "")
+    legacy.close()
+    with sqlite3.connect(path) as conn:
+        conn.execute("DROP TABLE user_streaks")
+        conn.execute("PRAGMA user_version = 9")
+
+    db = MoodDatabase(path)
+    try:
+        assert _state(db, user_id) == (2, 3)
+    finally:
+        db.close()
+
+
+@pytest.mark.parametrize("seed", range(30))
+def test_incremental_state_matches_the_old_date_walk(db, user_id, seed):
+    # A seeded mix of adds, bulk adds, deletes and edits; after each write
+    # the stored streaks must agree with the pre-user_streaks computation.
+    rng = random.Random(seed)
+    entries = []
+
+    def random_day():
+        # Mostly near today so the current run keeps being touched.
+        return TODAY - rng.choice([rng.randint(-1, 6), rng.randint(0, 40)])
+
+    for _ in range(60):
+        action = rng.random()
+        if action < 0.4 or not entries:
+            entries.append(
+                db.add_mood_entry(user_id, _label(random_day()), 3, "add")
+            )
+        elif action < 0.55:
+            items = [
+                {"date": _label(random_day()), "mood": 2, "content": "bulk"}
+                for _ in range(rng.randint(1, 6))
+            ]
+            entries.extend(db.add_mood_entries_bulk(user_id, items))
+        elif action < 0.75:
+            entry_id = entries.pop(rng.randrange(len(entries)))
+            assert db.delete_mood_entry(user_id, entry_id)
+        elif action < 0.9:
+            entry_id = rng.choice(entries)
+            db.update_mood_entry(user_id, entry_id, date=_label(random_day()))
+        else:
+            db.update_mood_entry(user_id, rng.choice(entries), mood=5)
+        parsed = _parsed_entry_dates(db, user_id)
+        longest = _expected_longest(parsed)
+        for day in (TODAY, TODAY + 1, TODAY + 2):
+            assert _state(db, user_id, day) == (
+                _expected_current(parsed, date.fromordinal(day)),
+                longest,
+            )
+        assert db.get_current_streak(user_id) == _expected_current(
+            parsed, date.today()
+        )
@@ -0,0 +1,131 @@
+import dataclasses
+import sqlite3
+
+import pytest
+
+import api.config as config_module
+from api.database import MoodDatabase
+from api.database_common import DatabaseError
+
+
+def _make_client(app_factory, monkeypatch, unit_of_work, **overrides):
+    cfg = dataclasses.replace(
+        config_module.get_config(), DB_REQUEST_UNIT_OF_WORK=unit_of_work, **overrides
+    )
+    monkeypatch.setattr(config_module, "_CONFIG_SINGLETON", cfg)
+    app = app_factory()
+    client = app.test_client()
+    token = client.post("/api/auth/local/login").get_json()["token"]
+    headers = {"Authorization": f"Bearer {token}"}
+    return client, app.extensions["user_service"].db, headers
+
+
+def _checkouts(db, call):
+    before = db._pool.stats()["checkouts"]
+    response = call()
+    assert response.status_code < 400, response.get_json()
+    return db._pool.stats()["checkouts"] - before
+
+
+def _connections_per_endpoint(client, db, headers):
+    payload = {"mood": 4, "date": "2024-01-02", "content": "hi", "selected_options": [1]}
+    counts = {
+        "POST /api/mood": _checkouts(
+            db, lambda: client.post("/api/mood", json=payload, headers=headers)
+        )
+    }
+    entry_id = db.get_all_mood_entries(1)[0].id
+    counts["PUT /api/mood"] = _checkouts(
+        db,
+        lambda: client.put(
+            f"/api/mood/{entry_id}", json={"mood": 2, "selected_options": [2]}, headers=headers
+        ),
+    )
+    counts["GET /api/statistics"] = _checkouts(
+        db, lambda: client.get("/api/statistics", headers=headers)
+    )
+    counts["GET /api/achievements/progress"] = _checkouts(
+        db, lambda: client.get("/api/achievements/progress", headers=headers)
+    )
+    return counts
+
+
+def test_one_connection_per_request(app_factory, monkeypatch):
+    client, db, headers = _make_client(app_factory, monkeypatch, unit_of_work=False)
+    before = _connections_per_endpoint(client, db, headers)
+
+    client, db, headers = _make_client(app_factory, monkeypatch, unit_of_work=True)
+    after = _connections_per_endpoint(client, db, headers)
+
+    assert before["POST /api/mood"] >= 5
+    assert before["PUT /api/mood"] >= 3
+    assert all(count == 1 for count in after.values()), after
+
+
+def test_write_queue_takes_precedence_over_unit_of_work(app_factory, monkeypatch):
+    client, db, headers = _make_client(
+        app_factory, monkeypatch, unit_of_work=True, ENABLE_DB_WRITE_QUEUE=True
+    )
+    for i in range(5):
+        response = client.post(
+            "/api/mood",
+            json={"mood": 3, "date": "2024-01-02", "content": f"queued {i}"},
+            headers=headers,
+        )
+        assert response.status_code == 201, response.get_json()
+    assert db._writer.operations >= 5
+    assert db._writer.batches >= 1
+    assert len(db.get_all_mood_entries(1)) == 5
+    with pytest.raises(DatabaseError):
+        db.begin_unit_of_work()
+
+
+@pytest.mark.parametrize(
+    "path, flush_interval, immediate",
+    [
+        ("/api/goals", 5.0, True),
+        ("/api/groups", 5.0, False),
+        ("/api/statistics", 5.0, False),
+        ("/api/statistics", 0.0, True),
+    ],
+)
+def test_get_routes_that_write_take_the_write_lock(
+    app_factory, monkeypatch, path, flush_interval, immediate
+):
+    client, db, headers = _make_client(
+        app_factory,
+        monkeypatch,
+        unit_of_work=True,
+        STATS_VIEW_FLUSH_INTERVAL=flush_interval,
+    )
+    modes = []
+    begin = db.begin_unit_of_work
+
+    def spy(**kwargs):
+        modes.append(kwargs.get("immediate", False))
+        return begin(**kwargs)
+
+    monkeypatch.setattr(db, "begin_unit_of_work", spy)
+    assert client.get(path, headers=headers).status_code == 200
+    assert modes == [immediate]
+
+
+def test_unit_of_work_rolls_back_on_error(tmp_path):
+    db = MoodDatabase(str(tmp_path / "uow.db"))
+    user_id = db.upsert_user_by_google_id("uow", "u@example.com", "U")["id"]
+
+    with pytest.raises(RuntimeError):
+        with db.unit_of_work(immediate=True):
+            db.add_mood_entry(user_id, "2024-01-02", 3, "discarded")
+            raise RuntimeError("request failed")
+    assert db.get_all_mood_entries(user_id) == []
+
+    with db.unit_of_work(immediate=True):
+        db.add_mood_entry(user_id, "2024-01-02", 3, "kept")
+        with pytest.raises(sqlite3.IntegrityError):
+            db.add_mood_entry(user_id, "2024-01-02", 9, "invalid mood")
+        # Nothing is visible to other connections until the unit commits
+        with sqlite3.connect(db.db_path) as other:
+            assert other.execute("SELECT COUNT(*) FROM mood_entries").fetchone()[0] == 0
+    assert [e.content for e in db.get_all_mood_entries(user_id)] == ["kept"]
+    db.close()
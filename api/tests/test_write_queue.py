@@ -0,0 +1,80 @@
+import sqlite3
+import threading
+
+import pytest
+
+from api.database import MoodDatabase
+
+
+@pytest.fixture()
+def db(tmp_path):
+    database = MoodDatabase(
+        str(tmp_path / "queue.db"), write_queue=True, write_queue_latency_ms=20
+    )
+    yield database
+    database.close()
+
+
+@pytest.fixture()
+def user_id(db):
+    return db.upsert_user_by_google_id("queue-user", "q@example.com", "Queue")["id"]
+
+
+def test_queued_writes_return_results(db, user_id):
+    entry_id = db.add_mood_entry(user_id, "2024-01-02", 4, "queued", None, [1])
+    assert entry_id > 0
+    assert db.get_mood_entry_by_id(user_id, entry_id)["content"] == "queued"
+    assert db.update_mood_entry(user_id, entry_id, mood=2) is True
+    assert db.delete_mood_entry(user_id, entry_id) is True
+    assert db.delete_mood_entry(user_id, entry_id) is False
+
+
+def test_concurrent_writes_are_group_committed(db, user_id):
+    ids = []
+    lock = threading.Lock()
+
+    def post(i):
+        entry_id = db.add_mood_entry(user_id, "2024-01-03", 1 + i % 5, f"entry {i}")
+        with lock:
+            ids.append(entry_id)
+
+    threads = [threading.Thread(target=post, args=(i,)) for i in range(40)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert len(set(ids)) == 40
+    assert len(db.get_all_mood_entries(user_id)) == 40
+    assert db._writer.batches < db._writer.operations
+
+
+def test_failing_operation_does_not_poison_batch(db, user_id):
+    results = {}
+
+    def good():
+        results["good"] = db.add_mood_entry(user_id, "2024-01-04", 3, "ok")
+
+    def bad():
+        try:
+            db.add_mood_entry(user_id, "2024-01-04", 9, "mood out of range")
+        except sqlite3.IntegrityError as exc:
+            results["bad"] = exc
+
+    threads = [threading.Thread(target=good), threading.Thread(target=bad)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert isinstance(results["bad"], sqlite3.IntegrityError)
+    assert db.get_mood_entry_by_id(user_id, results["good"]) is not None
+    assert len(db.get_all_mood_entries(user_id)) == 1
+
+
+def test_execute_with_retry_runs_through_queue(db, user_id):
+    cursor = db._execute_with_retry(
+        "UPDATE users SET name = ? WHERE id = ?", ("Renamed", user_id)
+    )
+    assert cursor.rowcount == 1
+    assert db.get_user_by_id(user_id)["name"] == "Renamed"
@@ -0,0 +1,114 @@
+"""Per-process LRU cache for analytics results keyed on the data version."""
+
+import json
+import threading
+from collections import OrderedDict
+from datetime import date
+from typing import Any, Callable, Dict, Hashable, Tuple, TypeVar
+
+T = TypeVar("T")
+
+CacheKey = Tuple[int, int, int, str, Hashable]
+
+
+def _size_of(value: Any) -> int:
+    # Cached values are JSON-shaped; their encoded length is a fair,
+    # cheap-enough stand-in for memory held, and only misses pay it.
+    return len(json.dumps(value, separators=(",", ":"), default=str))
+
+
+class AnalyticsCache:
+    """Bounded LRU of computed analytics, shared by the services.
+
+    Keys are ``(user_id, data version, today, endpoint, params)``. Every
+    write to a user's entries, selections, goals or achievements bumps the
+    data version, so a stale result is simply never looked up again and
+    ages out; today's ordinal is part of the key because streaks and
+    date-relative ranges roll over at midnight without any write.
+
+    ``max_entries`` and ``max_bytes`` (measured as encoded JSON) bound the
+    cache; the least recently used results go first and a single result
+    larger than ``max_bytes`` is returned but not kept. ``max_entries`` 0
+    disables caching. Cached values are shared between callers and must
+    be treated as read-only.
+    """
+
+    def __init__(
+        self, db, max_entries: int = 1024, max_bytes: int = 8 * 1024 * 1024
+    ):
+        self.db = db
+        self.max_entries = max(0, int(max_entries))
+        self.max_bytes = max(0, int(max_bytes))
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[CacheKey, Tuple[Any, int]]" = OrderedDict()
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_entries > 0 and self.max_bytes > 0
+
+    def get_or_compute(
+        self,
+        user_id: int,
+        endpoint: str,
+        compute: Callable[[], T],
+        params: Hashable = (),
+    ) -> T:
+        """Return the cached result for the user's current data, or compute it.
+
+        The version is read before ``compute`` runs, so a write racing the
+        computation can only file a newer result under an older key, which
+        no later reader asks for.
+        """
+        if not self.enabled:
+            return compute()
+
+        key: CacheKey = (
+            user_id,
+            self.db.get_data_version(user_id),
+            date.today().toordinal(),
+            endpoint,
+            params,
+        )
+        with self._lock:
+            cached = self._entries.get(key)
+            if cached is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return cached[0]
+            self.misses += 1
+
+        value = compute()
+        size = _size_of(value)
+        if size > self.max_bytes:
+            return value
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._bytes -= previous[1]
+            self._entries[key] = (value, size)
+            self._bytes += size
+            while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+                _, (_, evicted) = self._entries.popitem(last=False)
+                self._bytes -= evicted
+                self.evictions += 1
+        return value
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self) -> Dict[str, int]:
+        """Counters and current occupancy, for logging and tests."""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+            }
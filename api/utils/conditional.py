@@ -0,0 +1,61 @@
+"""Conditional GET support keyed on a user's data version."""
+
+from datetime import date
+from functools import wraps
+from typing import Callable, Optional
+
+from flask import make_response, request
+
+from api.utils.auth_middleware import get_current_user_id
+
+
+def data_version_etag(db, user_id: int, *, with_stats_views: bool = False) -> str:
+    """Build the ETag value for a user's current data.
+
+    Today's date is part of the tag because streaks and weekly goal progress
+    roll over at midnight without any write.
+    """
+    parts = [str(db.get_data_version(user_id)), f"{date.today():%Y%m%d}"]
+    if with_stats_views:
+        parts.append(str(db.get_user_metrics(user_id).get("stats_views") or 0))
+    return "-".join(parts)
+
+
+def conditional_on_data_version(
+    db,
+    *,
+    with_stats_views: bool = False,
+    on_not_modified: Optional[Callable[[int], None]] = None,
+):
+    """Answer a GET with a weak ETag and 304 when the client's copy is current.
+
+    Must sit below ``@require_auth``. The tag is computed before the view
+    runs, so a write racing the view can only make the tag older than the
+    body, never newer. ``on_not_modified(user_id)`` replays side effects the
+    skipped view would have had.
+    """
+
+    def decorator(view):
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            user_id = get_current_user_id()
+            if not isinstance(user_id, int):
+                return view(*args, **kwargs)
+
+            etag = data_version_etag(db, user_id, with_stats_views=with_stats_views)
+            if request.if_none_match.contains_weak(etag):
+                if on_not_modified is not None:
+                    on_not_modified(user_id)
+                response = make_response("", 304)
+            else:
+                response = make_response(view(*args, **kwargs))
+                if response.status_code != 200:
+                    return response
+            response.set_etag(etag, weak=True)
+            response.headers["Cache-Control"] = "private, no-cache"
+            response.vary.add("Authorization")
+            return response
+
+        return wrapper
+
+    return decorator
@@ -0,0 +1,68 @@
+"""Flask JSON provider that serializes responses with orjson when available."""
+
+import typing as t
+
+from flask import Flask, Response
+from flask.json.provider import DefaultJSONProvider
+
+try:  # Optional: falls back to the stdlib encoder when missing
+    import orjson
+except ImportError:  # pragma: no cover - exercised only without orjson
+    orjson = None  # type: ignore[assignment]
+
+
+def _default(obj: t.Any) -> t.Any:
+    # Models serialize through their own hook instead of dataclasses.asdict
+    to_json = getattr(obj, "to_json", None)
+    if to_json is not None:
+        return to_json()
+    return DefaultJSONProvider.default(obj)
+
+
+class FastJSONProvider(DefaultJSONProvider):
+    """``DefaultJSONProvider`` with an orjson fast path for responses.
+
+    The output matches the stdlib provider: keys are sorted, the body is
+    compact and newline-terminated, and dates still go through Flask's
+    ``default`` (HTTP date strings). Non-string keys such as mood values
+    are encoded too, but sorted by their JSON text, so ``10`` comes before
+    ``2`` where the stdlib would sort numerically. Anything orjson rejects
+    (integers beyond 64 bits), bodies with non-ASCII text while
+    ``ensure_ascii`` is on (the stdlib writes ``\\uXXXX`` escapes) and
+    pretty-printed debug output take the stdlib path.
+
+    Objects with a ``to_json()`` method (the row models) are encoded from
+    what it returns, one at a time, on both paths.
+    """
+
+    default = staticmethod(_default)  # type: ignore[assignment]
+    options = (
+        orjson.OPT_SORT_KEYS
+        | orjson.OPT_PASSTHROUGH_DATETIME
+        | orjson.OPT_PASSTHROUGH_DATACLASS
+        | orjson.OPT_NON_STR_KEYS
+        if orjson
+        else 0
+    )
+
+    def response(self, *args: t.Any, **kwargs: t.Any) -> Response:
+        pretty = (self.compact is None and self._app.debug) or self.compact is False
+        if orjson is None or pretty:
+            return super().response(*args, **kwargs)
+
+        obj = self._prepare_response_obj(args, kwargs)
+        try:
+            body = orjson.dumps(obj, default=self.default, option=self.options)
+        except TypeError:
+            return super().response(*args, **kwargs)
+        # orjson writes UTF-8 and a raw DEL. Escaping them afterwards costs
+        # more than encoding with the stdlib, which does it as it goes.
+        if self.ensure_ascii and (not body.isascii() or b"\x7f" in body):
+            return super().response(*args, **kwargs)
+        return self._app.response_class(body + b"\n", mimetype=self.mimetype)
+
+
+def install_json_provider(app: Flask) -> None:
+    """Serialize every ``jsonify`` response through :class:`FastJSONProvider`."""
+    app.json_provider_class = FastJSONProvider
+    app.json = FastJSONProvider(app)
@@ -0,0 +1,96 @@
+"""Per-option mood analytics over a user's entry selections."""
+
+from itertools import chain, combinations
+from typing import Dict, List, Sequence, Tuple
+
+try:  # Optional: falls back to plain Python loops when missing
+    import numpy as np
+except ImportError:  # pragma: no cover - exercised only without numpy
+    np = None  # type: ignore[assignment]
+
+OptionTotals = Tuple[List[int], List[int], List[int], List[List[int]]]
+
+
+def option_totals(rows: Sequence[Tuple[int, int, int]]) -> OptionTotals:
+    """Fold ``(entry_id, option_id, mood)`` rows into per-option totals.
+
+    Returns ``(option_ids, counts, mood_sums, co_occurrence)``: option ids
+    ascending, the number of entries and the mood sum per option, and the
+    symmetric matrix of entries shared by each pair (counts on the
+    diagonal). Rows of one entry must be adjacent.
+    """
+    if not rows:
+        return [], [], [], []
+    if np is None:
+        return _option_totals_python(rows)
+
+    data = np.fromiter(
+        chain.from_iterable(rows), dtype=np.int64, count=3 * len(rows)
+    ).reshape(-1, 3)
+    entry_ids, selected, moods = data.T
+    # Option ids are small table keys, so a lookup table numbers them
+    # without sorting the rows.
+    option_ids = np.flatnonzero(np.bincount(selected))
+    width = len(option_ids)
+    position = np.zeros(option_ids[-1] + 1, dtype=np.int64)
+    position[option_ids] = np.arange(width)
+    option_index = position[selected]
+
+    # Rows of an entry are adjacent, so comparing each row with the one
+    # ``step`` rows later, for each step up to the largest entry, meets
+    # every pair of an entry's rows once. Repeated selections are dropped.
+    steps = []
+    keep = np.ones(len(data), dtype=bool)
+    step = 1
+    while step < len(data):
+        same = entry_ids[step:] == entry_ids[:-step]
+        if not same.any():
+            break
+        keep[step:][same & (option_index[step:] == option_index[:-step])] = False
+        steps.append((step, same))
+        step += 1
+    cells = []
+    for step, same in steps:
+        pair = same & keep[:-step] & keep[step:]
+        cells.append(option_index[:-step][pair] * width + option_index[step:][pair])
+
+    counts = np.bincount(option_index[keep], minlength=width)
+    sums = np.bincount(option_index[keep], weights=moods[keep], minlength=width)
+    pairs = np.bincount(
+        np.concatenate([np.empty(0, dtype=np.int64), *cells]),
+        minlength=width * width,
+    ).reshape(width, width)
+    pairs += pairs.T
+    pairs[np.diag_indices(width)] = counts
+
+    # Float64 mood sums of small integers are exact; convert back for output.
+    return (
+        option_ids.tolist(),
+        counts.tolist(),
+        sums.astype(np.int64).tolist(),
+        pairs.tolist(),
+    )
+
+
+def _option_totals_python(rows: Sequence[Tuple[int, int, int]]) -> OptionTotals:
+    by_entry: Dict[int, Tuple[int, set]] = {}
+    for entry_id, option_id, mood in rows:
+        by_entry.setdefault(entry_id, (mood, set()))[1].add(option_id)
+
+    option_ids = sorted({row[1] for row in rows})
+    position = {option_id: i for i, option_id in enumerate(option_ids)}
+    sums = [0] * len(option_ids)
+    pairs = [[0] * len(option_ids) for _ in option_ids]
+    for mood, options in by_entry.values():
+        indexes = sorted(position[option_id] for option_id in options)
+        for i in indexes:
+            sums[i] += mood
+            pairs[i][i] += 1
+        for i, j in combinations(indexes, 2):
+            pairs[i][j] += 1
+            pairs[j][i] += 1
+    counts = [pairs[i][i] for i in range(len(option_ids))]
+    return option_ids, counts, sums, pairs
+
+
+__all__ = ["option_totals"]
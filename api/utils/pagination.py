@@ -0,0 +1,81 @@
+"""Helpers for keyset pagination and sync checkpoints of list endpoints."""
+
+import base64
+import binascii
+import json
+from typing import Any, Mapping, Optional, Tuple
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 200
+
+
+def wants_pagination(args: Mapping[str, Any]) -> bool:
+    """Pagination is opt-in: old clients send neither parameter."""
+    return "limit" in args or "cursor" in args
+
+
+def parse_limit(value: Optional[str]) -> int:
+    """Parse a ``limit`` query value, clamped to ``MAX_PAGE_SIZE``."""
+    if value is None or value == "":
+        return DEFAULT_PAGE_SIZE
+    try:
+        limit = int(value)
+    except (TypeError, ValueError):
+        raise ValueError("limit must be a positive integer") from None
+    if limit < 1:
+        raise ValueError("limit must be a positive integer")
+    return min(limit, MAX_PAGE_SIZE)
+
+
+def encode_cursor(key: Optional[Tuple[Any, int]]) -> Optional[str]:
+    """Encode a ``(created_at, id)`` keyset as an opaque URL-safe token."""
+    if key is None:
+        return None
+    raw = json.dumps(list(key), separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(token: Optional[str]) -> Optional[Tuple[Any, int]]:
+    """Decode a token produced by :func:`encode_cursor`.
+
+    Raises ``ValueError`` for anything that was not issued by the API.
+    """
+    if not token:
+        return None
+    try:
+        raw = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4))
+        created_at, entry_id = json.loads(raw)
+    except (binascii.Error, UnicodeDecodeError, ValueError, TypeError):
+        raise ValueError("Invalid cursor") from None
+    if not isinstance(entry_id, int) or isinstance(entry_id, bool):
+        raise ValueError("Invalid cursor")
+    if created_at is not None and not isinstance(created_at, str):
+        raise ValueError("Invalid cursor")
+    return created_at, entry_id
+
+
+def encode_sync_token(key: Optional[Tuple[int, int]]) -> str:
+    """Encode a ``(change_seq, id)`` sync checkpoint as an opaque token.
+
+    ``None`` (nothing synced yet) encodes as the start of the change log.
+    """
+    raw = json.dumps(list(key or (0, 0)), separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_sync_token(token: Optional[str]) -> Optional[Tuple[int, int]]:
+    """Decode a token produced by :func:`encode_sync_token`.
+
+    Raises ``ValueError`` for anything that was not issued by the API.
+    """
+    if not token:
+        return None
+    try:
+        raw = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4))
+        change_seq, entry_id = json.loads(raw)
+    except (binascii.Error, UnicodeDecodeError, ValueError, TypeError):
+        raise ValueError("Invalid sync token") from None
+    for value in (change_seq, entry_id):
+        if not isinstance(value, int) or isinstance(value, bool) or value < 0:
+            raise ValueError("Invalid sync token")
+    return change_seq, entry_id
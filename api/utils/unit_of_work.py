@@ -0,0 +1,91 @@
+import logging
+
+from flask import Flask, g, jsonify, request
+
+# Requests that are expected to write take the write lock up front so the
+# transaction never has to upgrade from a read snapshot mid-request.
+_WRITE_METHODS = {"POST", "PUT", "PATCH", "DELETE"}
+
+
+def without_unit_of_work(view):
+    """Exempt a view from the request unit of work.
+
+    For handlers that commit in several transactions of their own (e.g.
+    chunked imports) and must not hold the request's write lock meanwhile.
+    """
+    view.skip_unit_of_work = True
+    return view
+
+
+def immediate_unit_of_work(view=None, *, when=None):
+    """Take the write lock up front for a read route that may write.
+
+    A GET normally opens a deferred transaction. If the handler then writes
+    (e.g. a goal's weekly rollover), upgrading that read snapshot can fail
+    with SQLITE_BUSY, which savepoint writes do not retry. ``when`` is
+    called per request to limit this to requests that can actually write.
+    """
+
+    def decorate(func):
+        func.immediate_unit_of_work = when if when is not None else True
+        return func
+
+    return decorate(view) if view is not None else decorate
+
+
+def _wants_immediate(view) -> bool:
+    if request.method in _WRITE_METHODS:
+        return True
+    flag = getattr(view, "immediate_unit_of_work", False)
+    return bool(flag() if callable(flag) else flag)
+
+
+def init_unit_of_work(app: Flask, db):
+    """Run all database calls of a request on one connection and transaction.
+
+    The unit of work is bound to ``flask.g`` in ``before_request``; it only
+    checks out a connection once a handler touches the database. It commits
+    once in ``after_request`` (rolling back for 5xx responses) and
+    ``teardown_request`` rolls back anything left open by an exception.
+
+    With the write queue enabled nothing is installed: queued writes are
+    group-committed by the writer thread, which a request transaction would
+    bypass, so requests keep one transaction per write instead.
+    """
+    if db.write_queue_enabled:
+        logging.warning(
+            "DB_REQUEST_UNIT_OF_WORK is ignored because ENABLE_DB_WRITE_QUEUE "
+            "is on; the two cannot be combined"
+        )
+        return app
+
+    @app.before_request
+    def begin_unit_of_work():
+        if request.method == "OPTIONS":
+            return None
+        view = app.view_functions.get(request.endpoint)
+        if getattr(view, "skip_unit_of_work", False):
+            return None
+        g.db_unit_of_work = db.begin_unit_of_work(immediate=_wants_immediate(view))
+        return None
+
+    @app.after_request
+    def commit_unit_of_work(response):
+        uow = g.pop("db_unit_of_work", None)
+        if uow is None:
+            return response
+        try:
+            uow.close(commit=response.status_code < 500)
+        except Exception as exc:
+            logging.error(f"Failed to commit request transaction: {exc}")
+            response = jsonify({"error": "Internal server error"})
+            response.status_code = 500
+        return response
+
+    @app.teardown_request
+    def close_unit_of_work(exc):
+        uow = g.pop("db_unit_of_work", None)
+        if uow is not None:
+            uow.close(commit=False)
+
+    return app
@@ -11,20 +11,12 @@ export const useMoodData = () => {
     setError(null);
     
     try {
-      const data = await apiService.getMoodEntries();
-      
-      // Fetch selections for each entry
-      const entriesWithSelections = await Promise.all(
-        data.map(async (entry) => {
-          try {
-            const selections = await apiService.getEntrySelections(entry.id);
-            return { ...entry, selections };
-          } catch (error) {
-            console.error(`Failed to load selections for entry ${entry.id}:`, error);
-            return { ...entry, selections: [] };
-          }
-        })
-      );
+      // Selections are embedded server-side in a single request
+      const data = await apiService.getMoodEntries({ includeSelections: true });
+      const entriesWithSelections = data.map((entry) => ({
+        ...entry,
+        selections: entry.selections || [],
+      }));
       
       setPastEntries(entriesWithSelections);
     } catch (error) {
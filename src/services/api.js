@@ -122,8 +122,8 @@ class ApiService {
   }
 
   // Mood entries endpoints
-  async getMoodEntries() {
-    return this.request('/api/moods');
+  async getMoodEntries({ includeSelections = false } = {}) {
+    return this.request(includeSelections ? '/api/moods?include=selections' : '/api/moods');
   }
 
   async createMoodEntry(entryData) {